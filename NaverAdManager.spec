@@ -6,7 +6,11 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    hiddenimports=[
+        # 탭 모듈은 main_window 에서 처음 열 때 importlib 로 불러옴
+        'ui.tab_dashboard', 'ui.tab_admin', 'ui.tab_autobidder', 'ui.tab_creative',
+        'ui.tab_extension', 'ui.tab_keyword', 'ui.tab_settings', 'ui.tab_guide',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
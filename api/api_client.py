@@ -5,11 +5,52 @@ import hashlib
 import base64
 import urllib.parse
 import json
+import gzip
 import sys
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.adapters import HTTPAdapter
+
+from api.models import Campaign, AdGroup, Keyword, StatRow, Extension, Ad, KeywordPage, parse_list
+
+# -------------------------------------------------------------------------
+# [요청 속도 제한] 토큰 버킷 - 여러 스레드가 공유해도 전체 초당 호출 수를 rate 이하로 유지
+# -------------------------------------------------------------------------
+class RateLimiter:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 1개를 예약하고, 모자라면 채워질 때까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+    def backoff(self, seconds: float):
+        """한도 초과(1014) 응답 시 모든 호출을 seconds 만큼 늦춤"""
+        with self._lock:
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
 
 class APIClient:
+    NAVER_RATE = 8       # 네이버 API 초당 호출 수 (전 스레드 합산)
+    NAVER_BURST = 8
+    NAVER_1014_BACKOFF = 5.0
+    BID_HISTORY_MAX_BATCH = 5000  # 서버 /api/bid-history/bulk 1회 최대 건수 (초과 시 413)
+
+
     def __init__(self, server_url: str = "http://3.38.242.254:8000"):
         self.server_url = server_url
         self.server_token: Optional[str] = None
@@ -19,8 +60,27 @@ class APIClient:
         self.naver_customer_id: Optional[str] = None
         self.naver_base_url = "https://api.searchad.naver.com"
         
+        # [전송 최적화] 네이버 API는 keep-alive 세션 + gzip/deflate 응답으로 통신
+        self.naver_session = requests.Session()
+        self.naver_session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        self.naver_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        # 엔드포인트별 전송량 통계 {uri: {'calls', 'wire_bytes', 'decoded_bytes'}}
+        self.transfer_stats: Dict[str, Dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+        self.naver_limiter = RateLimiter(self.NAVER_RATE, self.NAVER_BURST)
+        
         self.is_superuser = False
 
+        # [자동입찰 설정 캐시] 서버 버전/ETag 기준으로 조건부 조회
+        self.bid_rules_version = 0
+        self.bid_rules_etag: Optional[str] = None
+        self.bid_rules_cache: Dict[str, Dict] = {}
+
+        # [키워드 변경 알림] 생성/삭제 성공 시 호출되는 콜백 (로컬 인덱스 갱신용)
+        # listener(event, adgroup_id, items) - 'created': Keyword 레코드 리스트, 'deleted': 키워드 ID 리스트
+        self.keyword_listeners = []
+        self.extension_listeners = []
+
     def log(self, type_str, msg):
         timestamp = datetime.now().strftime("%H:%M:%S")
         print(f"[{timestamp}] [{type_str}] {msg}", flush=True)
@@ -63,9 +123,124 @@ class APIClient:
             requests.post(f"{self.server_url}/api/monitor/heartbeat", json={"status": status_message}, headers={"Authorization": f"Bearer {self.server_token}"}, timeout=2)
         except: pass
 
+    # [자동입찰 설정] 서버 저장소 동기화 (ETag 조건부 조회 + delta)
+    def get_bid_rules(self) -> Dict[str, Dict]:
+        """전체 규칙 조회. 변경이 없으면 서버가 304를 주고 캐시를 그대로 반환"""
+        if not self.server_token: return self.bid_rules_cache
+        headers = {"Authorization": f"Bearer {self.server_token}"}
+        if self.bid_rules_etag:
+            headers["If-None-Match"] = self.bid_rules_etag
+        try:
+            resp = requests.get(f"{self.server_url}/api/bid-rules", headers=headers, timeout=5)
+            if resp.status_code == 304:
+                return self.bid_rules_cache
+            if resp.status_code == 200:
+                data = resp.json()
+                self.bid_rules_cache = {r['adgroup_id']: r for r in data.get('rules', [])}
+                self.bid_rules_version = data.get('version', 0)
+                self.bid_rules_etag = resp.headers.get("ETag")
+                self.log("SERVER", f"입찰 설정 {len(self.bid_rules_cache)}개 로드 (v{self.bid_rules_version})")
+            else:
+                self.log("SERVER", f"입찰 설정 조회 실패: {resp.status_code}")
+        except Exception as e:
+            self.log("SERVER", f"입찰 설정 조회 오류: {e}")
+        return self.bid_rules_cache
+
+    def sync_bid_rules(self) -> Dict[str, Dict]:
+        """캐시가 있으면 delta만 받아 반영하고, 없으면 전체 조회"""
+        if not self.server_token: return self.bid_rules_cache
+        if not self.bid_rules_etag:
+            return self.get_bid_rules()
+        try:
+            resp = requests.get(f"{self.server_url}/api/bid-rules/delta", params={"since": self.bid_rules_version}, headers={"Authorization": f"Bearer {self.server_token}"}, timeout=5)
+            if resp.status_code != 200:
+                return self.get_bid_rules()
+            data = resp.json()
+            for rule in data.get('changed', []):
+                self.bid_rules_cache[rule['adgroup_id']] = rule
+            for gid in data.get('deleted', []):
+                self.bid_rules_cache.pop(gid, None)
+            self.bid_rules_version = data.get('version', self.bid_rules_version)
+            self.bid_rules_etag = resp.headers.get("ETag") or self.bid_rules_etag
+        except Exception as e:
+            self.log("SERVER", f"입찰 설정 delta 조회 오류: {e}")
+        return self.bid_rules_cache
+
+    def save_bid_rules(self, rules: List[Dict] = None, deleted: List[str] = None) -> bool:
+        """변경된 규칙만 upsert / 삭제 (한 번의 요청)"""
+        if not self.server_token: return False
+        rules = rules or []
+        deleted = deleted or []
+        if not rules and not deleted: return True
+        try:
+            resp = requests.put(f"{self.server_url}/api/bid-rules", json={"rules": rules, "deleted": deleted}, headers={"Authorization": f"Bearer {self.server_token}"}, timeout=10)
+            if resp.status_code != 200:
+                self.log("SERVER", f"입찰 설정 저장 실패: {resp.status_code}")
+                return False
+            version = resp.json().get('version', self.bid_rules_version)
+            # 다른 클라이언트의 변경이 끼어들었으면 delta로 따라잡기
+            if version > self.bid_rules_version + 1:
+                self.sync_bid_rules()
+            for rule in rules:
+                self.bid_rules_cache[rule['adgroup_id']] = dict(rule, version=version)
+            for gid in deleted:
+                self.bid_rules_cache.pop(gid, None)
+            self.bid_rules_version = version
+            self.bid_rules_etag = resp.headers.get("ETag") or self.bid_rules_etag
+            return True
+        except Exception as e:
+            self.log("SERVER", f"입찰 설정 저장 오류: {e}")
+            return False
+
+    # [입찰 이력] gzip 압축 후 한 번에 업로드
+    def upload_bid_history(self, events: List[Dict]) -> bool:
+        if not self.server_token: return False
+        if not events: return True
+        try:
+            payload = gzip.compress(json.dumps(events, ensure_ascii=False).encode("utf-8"))
+            headers = {
+                "Authorization": f"Bearer {self.server_token}",
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip"
+            }
+            resp = requests.post(f"{self.server_url}/api/bid-history/bulk", data=payload, headers=headers, timeout=10)
+            if resp.status_code == 200:
+                return True
+            self.log("SERVER", f"입찰 이력 업로드 실패: {resp.status_code}")
+            return False
+        except Exception as e:
+            self.log("SERVER", f"입찰 이력 업로드 오류: {e}")
+            return False
+
     # -------------------------------------------------------------------------
     # 2. [네이버 API] 핵심 로직
     # -------------------------------------------------------------------------
+    def add_keyword_listener(self, listener):
+        if listener not in self.keyword_listeners:
+            self.keyword_listeners.append(listener)
+
+    def _notify_keywords(self, event, adgroup_id, items):
+        if not items:
+            return
+        for listener in self.keyword_listeners:
+            try:
+                listener(event, adgroup_id, items)
+            except Exception as e:
+                self.log("LISTENER", f"키워드 {event} 알림 실패: {e}")
+
+    def add_extension_listener(self, listener):
+        if listener not in self.extension_listeners:
+            self.extension_listeners.append(listener)
+
+    def _notify_extensions(self, event, owner_id, items):
+        if not items:
+            return
+        for listener in self.extension_listeners:
+            try:
+                listener(event, owner_id, items)
+            except Exception as e:
+                self.log("LISTENER", f"확장소재 {event} 알림 실패: {e}")
+
     def _generate_signature(self, timestamp, method, uri):
         clean_uri = uri.split('?')[0]
         message = f"{timestamp}.{method}.{clean_uri}"
@@ -90,14 +265,16 @@ class APIClient:
         if not self.naver_api_key: return None
         clean_uri = uri.split('?')[0]
         try:
+            self.naver_limiter.acquire()
             headers = self._get_header(method, clean_uri)
             url = self.naver_base_url + clean_uri
             
-            if method == "GET": resp = requests.get(url, headers=headers, params=params)
-            elif method == "POST": resp = requests.post(url, headers=headers, params=params, json=body)
-            elif method == "PUT": resp = requests.put(url, headers=headers, params=params, json=body)
-            elif method == "DELETE": resp = requests.delete(url, headers=headers, params=params)
+            if method == "GET": resp = self.naver_session.get(url, headers=headers, params=params)
+            elif method == "POST": resp = self.naver_session.post(url, headers=headers, params=params, json=body)
+            elif method == "PUT": resp = self.naver_session.put(url, headers=headers, params=params, json=body)
+            elif method == "DELETE": resp = self.naver_session.delete(url, headers=headers, params=params)
             else: return None
+            self._record_transfer(clean_uri, resp)
 
             if resp.status_code in (200, 204):
                 return resp.json() if resp.text else {"success": True}
@@ -105,6 +282,8 @@ class APIClient:
                 self.log("NAVER_ERR", f"실패({resp.status_code}): {resp.text}")
                 try:
                     err_json = resp.json()
+                    if str(err_json.get('code')) == '1014':
+                        self.naver_limiter.backoff(self.NAVER_1014_BACKOFF)
                     # 에러 코드와 메시지를 포함한 딕셔너리 반환
                     return {"error": True, "code": err_json.get('code', resp.status_code), "data": err_json}
                 except:
@@ -113,6 +292,41 @@ class APIClient:
             self.log("NAVER_EX", f"통신 예외: {e}")
             return {"error": True, "code": 999, "data": str(e)}
 
+    def _record_transfer(self, uri, resp):
+        """실제 수신 바이트(압축 상태)와 해제 후 바이트를 엔드포인트별로 누적"""
+        decoded = len(resp.content)
+        wire = decoded
+        try:
+            # urllib3 응답의 tell()은 소켓에서 읽은(압축된) 바이트 수
+            wire = resp.raw.tell() or decoded
+        except Exception:
+            pass
+        # ID가 포함된 경로는 하나로 묶어서 집계 (/ncc/adgroups/grp-xxx -> /ncc/adgroups/{id})
+        parts = uri.split('/')
+        key = '/'.join('{id}' if '-' in p and any(c.isdigit() for c in p) else p for p in parts)
+        with self._stats_lock:
+            st = self.transfer_stats.setdefault(key, {'calls': 0, 'wire_bytes': 0, 'decoded_bytes': 0})
+            st['calls'] += 1
+            st['wire_bytes'] += wire
+            st['decoded_bytes'] += decoded
+
+    def get_transfer_report(self):
+        """엔드포인트별 전송량/절감량 리포트 (절감량 많은 순)"""
+        with self._stats_lock:
+            items = [(uri, dict(st)) for uri, st in self.transfer_stats.items()]
+        report = []
+        for uri, st in items:
+            saved = st['decoded_bytes'] - st['wire_bytes']
+            ratio = (saved / st['decoded_bytes'] * 100) if st['decoded_bytes'] else 0
+            report.append({'uri': uri, 'calls': st['calls'], 'wire_bytes': st['wire_bytes'],
+                           'decoded_bytes': st['decoded_bytes'], 'saved_bytes': saved, 'saved_pct': round(ratio, 1)})
+        report.sort(key=lambda r: r['saved_bytes'], reverse=True)
+        return report
+
+    def log_transfer_report(self):
+        for r in self.get_transfer_report():
+            self.log("TRANSFER", f"{r['uri']}: {r['calls']}회, 수신 {r['wire_bytes']:,}B / 원본 {r['decoded_bytes']:,}B (절감 {r['saved_bytes']:,}B, {r['saved_pct']}%)")
+
     # -------------------------------------------------------------------------
     # 3. [비즈니스 로직]
     # -------------------------------------------------------------------------
@@ -149,32 +363,141 @@ class APIClient:
         res = self.call_naver("/ncc/keywords", params=params)
         return res if isinstance(res, list) else []
 
+    def get_keywords_compact(self, adgroup_id, base_search_id=None, record_size=100):
+        """
+        페이징 키워드 조회를 Keyword 레코드(id/키워드/입찰가/상태)로 바로 변환
+        키워드 목록 API는 필드 선택(projection)을 지원하지 않으므로 수신 즉시 필요한 필드만 남김
+        에러 시에는 에러 딕셔너리를 그대로 반환 (1014 등 호출부에서 판단)
+        """
+        params = {"nccAdgroupId": adgroup_id, "recordSize": record_size}
+        if base_search_id:
+            params["baseSearchId"] = base_search_id
+        res = self.call_naver("/ncc/keywords", params=params)
+        if res is None:
+            return None
+        return parse_list(Keyword, res)
+
+    # [키워드 스트리밍] 그룹 하나/여러 그룹/캠페인 전체를 페이지 단위로 순회 (다음 페이지 선조회)
+    KEYWORD_PAGE_RETRY = 3        # 1014(한도 초과) 재시도 횟수
+    KEYWORD_PAGE_RETRY_WAIT = 10  # 재시도 대기(초), 회차마다 2배
+
+    def _fetch_keyword_page(self, adgroup_id, base_search_id, record_size):
+        wait = self.KEYWORD_PAGE_RETRY_WAIT
+        for attempt in range(self.KEYWORD_PAGE_RETRY + 1):
+            res = self.get_keywords_compact(adgroup_id, base_search_id, record_size)
+            if isinstance(res, dict) and str(res.get('code')) == '1014' and attempt < self.KEYWORD_PAGE_RETRY:
+                self.log("PAGER", f"1014 한도 초과 - {wait}초 후 재시도 ({adgroup_id})")
+                time.sleep(wait)
+                wait *= 2
+                continue
+            return res
+
+    def iter_keyword_pages(self, adgroup_ids, record_size=100, start=None, prefetch=True) -> Iterator[KeywordPage]:
+        """
+        KeywordPage 를 차례로 반환하는 제너레이터 (메모리에는 현재 페이지 + 선조회 1페이지만 유지)
+        - adgroup_ids: 그룹 ID 하나 또는 ID 목록
+        - start: 이전 페이지의 cursor 를 넘기면 그 위치부터 재개
+        - prefetch: 현재 페이지를 처리하는 동안 다음 페이지를 백그라운드에서 미리 조회
+        - 조회 실패한 그룹은 error 가 담긴 페이지를 한 번 반환하고 다음 그룹으로 넘어감
+        """
+        gids = [adgroup_ids] if isinstance(adgroup_ids, str) else list(adgroup_ids)
+        if not gids:
+            return
+
+        idx, base_search_id = 0, None
+        if start and start[0] in gids:
+            idx, base_search_id = gids.index(start[0]), start[1]
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kwd-prefetch")
+        try:
+            pos = (idx, base_search_id)
+            future = executor.submit(self._fetch_keyword_page, gids[idx], base_search_id, record_size)
+            while pos is not None:
+                idx, base_search_id = pos
+                res = future.result()
+                future = None
+
+                if isinstance(res, list):
+                    error = None
+                    keywords = res
+                else:
+                    error = res or {"error": True, "code": None, "data": {"message": "응답 없음"}}
+                    keywords = []
+
+                # 다음 위치: 페이지가 꽉 찼으면 같은 그룹 다음 페이지, 아니면 다음 그룹 첫 페이지
+                if error is None and len(keywords) == record_size:
+                    nxt = (idx, keywords[-1].id)
+                elif idx + 1 < len(gids):
+                    nxt = (idx + 1, None)
+                else:
+                    nxt = None
+
+                if nxt is not None and prefetch:
+                    future = executor.submit(self._fetch_keyword_page, gids[nxt[0]], nxt[1], record_size)
+
+                cursor = (gids[nxt[0]], nxt[1]) if nxt is not None else None
+                yield KeywordPage(gids[idx], keywords, cursor, error)
+
+                pos = nxt
+                if pos is not None and future is None:
+                    future = executor.submit(self._fetch_keyword_page, gids[pos[0]], pos[1], record_size)
+        finally:
+            # 소비자가 중간에 break 해도 선조회 스레드는 정리
+            executor.shutdown(wait=False)
+
+    def iter_keywords(self, adgroup_ids, record_size=100, prefetch=True) -> Iterator[Keyword]:
+        """Keyword 레코드를 하나씩 반환 (조회 실패한 그룹은 로그만 남기고 건너뜀)"""
+        for page in self.iter_keyword_pages(adgroup_ids, record_size, prefetch=prefetch):
+            if page.error:
+                self.log("PAGER", f"키워드 조회 실패 ({page.adgroup_id}): {page.error.get('code')}")
+                continue
+            yield from page.keywords
+
+    def iter_campaign_keyword_pages(self, campaign_id, name_filter=None, record_size=100) -> Iterator[KeywordPage]:
+        """캠페인의 모든 그룹(name_filter(이름)가 True 인 그룹만)을 순서대로 스트리밍"""
+        groups = self.get_adgroup_records(campaign_id)
+        gids = [g.id for g in groups if name_filter is None or name_filter(g.name)]
+        yield from self.iter_keyword_pages(gids, record_size)
+
+    def create_keywords_chunk(self, adgroup_id, keywords, bid_amt=70):
+        """
+        키워드 최대 100개를 POST 1회로 등록 (병렬 호출 가능, 속도 제한은 call_naver 공용 버킷)
+        반환: 생성된 키워드 응답 리스트 / 에러 딕셔너리
+        """
+        # [수정] 3916 오류 해결: useGroupBidAmt=False를 명시하여 bidAmt를 직접 사용하도록 함
+        # useGroupBidAmt 필드가 없으면 bidAmt를 보냈음에도 그룹 입찰가를 사용하려고 시도하다가
+        # 그룹 입찰가가 설정되지 않은 경우 오류가 날 수 있음.
+        # 혹은 bidAmt 필드 자체가 무시될 수 있음.
+        body = [{"nccAdgroupId": adgroup_id, "keyword": k, "bidAmt": bid_amt, "useGroupBidAmt": False} for k in keywords]
+        res = self.call_naver("/ncc/keywords", method="POST", params={"nccAdgroupId": adgroup_id}, body=body)
+
+        if isinstance(res, list):
+            created = [item for item in res if 'nccKeywordId' in item]
+            if len(created) != len(res):
+                self.log("KEYWORD", f"Group:{adgroup_id} ID 없는 항목 {len(res) - len(created)}개")
+            self._notify_keywords("created", adgroup_id, [Keyword.from_api(item) for item in created])
+            return created
+        if res is None:
+            return {"error": True, "code": None, "data": {"message": "응답 없음"}}
+        return res
+
     # [수정] 성공/실패 여부를 리스트/딕셔너리로 명확히 반환
     def create_keywords_bulk(self, adgroup_id, keywords):
         results = []
         
         for i in range(0, len(keywords), 100):
             chunk = keywords[i:i+100]
-            # [수정] 3916 오류 해결: useGroupBidAmt=False를 명시하여 bidAmt를 직접 사용하도록 함
-            # useGroupBidAmt 필드가 없으면 bidAmt를 보냈음에도 그룹 입찰가를 사용하려고 시도하다가
-            # 그룹 입찰가가 설정되지 않은 경우 오류가 날 수 있음.
-            # 혹은 bidAmt 필드 자체가 무시될 수 있음.
-            body = [{"nccAdgroupId": adgroup_id, "keyword": k, "bidAmt": 70, "useGroupBidAmt": False} for k in chunk]
             
             # [DEBUG] 요청 바디 출력
             print(f"[DEBUG_REQ] Group:{adgroup_id} Keywords({len(chunk)}): {chunk}", flush=True)
 
-            res = self.call_naver("/ncc/keywords", method="POST", params={"nccAdgroupId": adgroup_id}, body=body)
+            res = self.create_keywords_chunk(adgroup_id, chunk)
             
             # [DEBUG] 응답 결과 출력
             print(f"[DEBUG_RES] Type:{type(res)} Body:{str(res)[:500]}...", flush=True)
 
             if isinstance(res, list):
-                for item in res:
-                    if 'nccKeywordId' in item:
-                        results.append(item)
-                    else:
-                        print(f"[DEBUG_WARN] Item missing ID: {item}", flush=True)
+                results.extend(res)
             
             elif isinstance(res, dict) and res.get('error'):
                 print(f"[DEBUG_ERR] API Error: {res}", flush=True)
@@ -186,6 +509,48 @@ class APIClient:
             
         return results
 
+    # [키워드 삭제] 단건 / 대량 (ids 파라미터로 최대 100개씩, 실패 시 단건 병렬 삭제로 판정)
+    KEYWORD_DELETE_CHUNK = 100
+    KEYWORD_DELETE_WORKERS = 4
+
+    def delete_keyword(self, keyword_id):
+        res = self.call_naver(f"/ncc/keywords/{keyword_id}", method="DELETE")
+        if res is None:
+            return {"error": True, "code": None, "data": {"message": "응답 없음"}}
+        if not (isinstance(res, dict) and res.get('error')):
+            self._notify_keywords("deleted", None, [keyword_id])
+        return res
+
+    def delete_keywords_bulk(self, keyword_ids, on_chunk=None) -> Dict[str, Any]:
+        """
+        키워드 여러 개 삭제 -> {키워드ID: True | 에러 딕셔너리}
+        - 100개씩 DELETE /ncc/keywords?ids=... 로 한 번에 삭제
+        - 묶음 삭제가 실패하면 (일부 ID 문제 등) 해당 묶음만 단건 삭제를 병렬로 수행해 ID별 결과 확보
+        - on_chunk(results): 묶음 하나가 끝날 때마다 그 묶음 결과 전달 (진행 표시용)
+        """
+        results = {}
+        ids = list(dict.fromkeys(keyword_ids))
+        for i in range(0, len(ids), self.KEYWORD_DELETE_CHUNK):
+            chunk = ids[i:i + self.KEYWORD_DELETE_CHUNK]
+            res = self.call_naver("/ncc/keywords", method="DELETE", params={"ids": ",".join(chunk)})
+
+            if res is not None and not (isinstance(res, dict) and res.get('error')):
+                chunk_results = {kid: True for kid in chunk}
+                self._notify_keywords("deleted", None, chunk)
+            else:
+                self.log("DELETE", f"묶음 삭제 실패({res.get('code') if isinstance(res, dict) else None}) - 단건 삭제로 재시도 ({len(chunk)}개)")
+                with ThreadPoolExecutor(max_workers=self.KEYWORD_DELETE_WORKERS, thread_name_prefix="kwd-delete") as executor:
+                    singles = dict(zip(chunk, executor.map(self.delete_keyword, chunk)))
+                chunk_results = {
+                    kid: (r if isinstance(r, dict) and r.get('error') else True)
+                    for kid, r in singles.items()
+                }
+
+            results.update(chunk_results)
+            if on_chunk:
+                on_chunk(chunk_results)
+        return results
+
     def update_bid(self, keyword_id, adgroup_id, bid_amt):
         body = [{"nccKeywordId": keyword_id, "nccAdgroupId": adgroup_id, "bidAmt": bid_amt, "useGroupBidAmt": False}]
         return self.call_naver("/ncc/keywords", method="PUT", params={"fields": "bidAmt"}, body=body)
@@ -258,80 +623,161 @@ class APIClient:
         
         return result
 
-    def get_stats(self, id_list, since=None, until=None):
-        if not id_list: return {}
+    # -------------------------------------------------------------------------
+    # [통계 조회] ID 를 STATS_CHUNK 개씩 묶어 여러 요청을 동시에 전송
+    # - 호출 간격은 공용 토큰 버킷이 담당 (청크마다 고정 sleep 없음)
+    # - on_chunk({id: item}): 청크 응답이 도착하는 대로 호출 (작업 스레드에서 호출됨)
+    # - 1014(한도 초과) 청크는 STATS_RETRY_1014 회까지 다시 요청 (call_naver 가 버킷을 늦춰 둠)
+    # -------------------------------------------------------------------------
+    STATS_CHUNK = 50
+    STATS_WORKERS = 4
+    STATS_RETRY_1014 = 3
+    STATS_FIELDS = ["impCnt", "clkCnt", "salesAmt", "avgRnk", "ccnt"]  # convCnt, convValue 제외 - 오류 원인 가능성
+
+    def _stats_time_range(self, since=None, until=None):
         if not since:
             # 최근 7일 데이터 사용 (당일 ~ 7일 전)
             # 당일 데이터도 포함하여 최대한 실시간 반영
             until_date = datetime.now().strftime("%Y-%m-%d")
             since_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-            time_range = {"since": since_date, "until": until_date}
+            return {"since": since_date, "until": until_date}
+        return {"since": since, "until": until}
+
+    def _call_stats(self, params):
+        for attempt in range(self.STATS_RETRY_1014 + 1):
+            res = self.call_naver("/stats", params=params)
+            if not (isinstance(res, dict) and str(res.get('code')) == '1014') or attempt == self.STATS_RETRY_1014:
+                return res
+            self.log("STATS", f"1014 한도 초과 - 청크 재요청 ({attempt + 1}/{self.STATS_RETRY_1014})")
+
+    def _get_stats_chunk(self, chunk, time_range):
+        res = self._call_stats({
+            "ids": ",".join(chunk),
+            "fields": json.dumps(self.STATS_FIELDS),
+            "timeRange": json.dumps(time_range)
+        })
+        if res and isinstance(res, dict) and 'data' in res:
+            return {item['id']: item for item in res['data'] if isinstance(item, dict)}
+        if res and isinstance(res, dict) and res.get('error'):
+            print(f"[STATS_ERROR] API 오류 발생 - 코드: {res.get('code', 'unknown')}, 청크 {len(chunk)}개")
         else:
-            time_range = {"since": since, "until": until}
-        
-        print(f"[STATS] 통계 조회 시작: {len(id_list)}개 키워드, 기간: {time_range}")
-        sys.stdout.flush()  # 즉시 출력
+            print(f"[STATS_ERROR] 예상치 못한 응답 형식: {type(res)}")
+        return {}
+
+    def get_stats(self, id_list, since=None, until=None, on_chunk=None):
+        if not id_list: return {}
+        time_range = self._stats_time_range(since, until)
+        chunks = [id_list[i:i + self.STATS_CHUNK] for i in range(0, len(id_list), self.STATS_CHUNK)]
+        print(f"[STATS] 통계 조회 시작: {len(id_list)}개 ID ({len(chunks)}개 요청), 기간: {time_range}")
+        sys.stdout.flush()
+
         stats_map = {}
-        
-        for i in range(0, len(id_list), 50):
-            chunk = id_list[i:i+50]
-            ids_str = ",".join(chunk)
-            # 기본 필드만 요청 (convCnt, convValue 제외 - 오류 원인 가능성)
-            fields = ["impCnt", "clkCnt", "salesAmt", "avgRnk", "ccnt"]
-            
-            print(f"[STATS] 청크 {i//50 + 1}/{(len(id_list)-1)//50 + 1}: {len(chunk)}개 ID 조회 중...")
-            sys.stdout.flush()
-            
-            # [디버깅] 첫 청크 파라미터 출력
-            if i == 0:
-                print(f"[STATS_DEBUG] 요청 파라미터:")
-                print(f"  - ids: {ids_str[:200]}...")  # 처음 200자만
-                print(f"  - fields: {json.dumps(fields)}")
-                print(f"  - timeRange: {json.dumps(time_range)}")
-                sys.stdout.flush()
-            
-            res = self.call_naver("/stats", params={
-                "ids": ids_str, 
-                "fields": json.dumps(fields),
-                "timeRange": json.dumps(time_range)
-            })
-
-            # [디버깅] 실제 응답 구조 확인
-            if i == 0:  # 첫 번째 청크만 출력
-                print(f"[STATS_DEBUG] 첫 청크 응답 타입: {type(res)}")
-                print(f"[STATS_DEBUG] 응답 키: {res.keys() if isinstance(res, dict) else 'N/A'}")
-                if isinstance(res, dict) and 'data' in res:
-                    print(f"[STATS_DEBUG] data 타입: {type(res['data'])}, 길이: {len(res['data']) if isinstance(res['data'], list) else 'N/A'}")
-                    if isinstance(res['data'], list) and len(res['data']) > 0:
-                        print(f"[STATS_DEBUG] 첫 번째 항목: {res['data'][0]}")
-                print(f"[STATS_DEBUG] 전체 응답: {res}")
-                sys.stdout.flush()
-
-            if res and isinstance(res, dict) and 'data' in res:
-                for item in res['data']:
-                    # item이 딕셔너리인지 확인
-                    if not isinstance(item, dict):
-                        print(f"[STATS_WARN] 잘못된 데이터 형식: {type(item)}")
-                        continue
-                    stats_map[item['id']] = item
-                print(f"[STATS] 청크 성공: {len(res['data'])}개 통계 수신")
-            elif res and isinstance(res, dict) and res.get('error'):
-                error_code = res.get('code', 'unknown')
-                error_msg = res.get('message', 'unknown')
-                print(f"[STATS_ERROR] API 오류 발생 - 코드: {error_code}, 메시지: {error_msg}")
-            else:
-                print(f"[STATS_ERROR] 예상치 못한 응답 형식: {type(res)}")
-            
-            # API 한도 방지를 위해 대기 시간 증가 (0.1 → 0.5초)
-            time.sleep(0.5)
-        
+
+        def fetch(chunk):
+            part = self._get_stats_chunk(chunk, time_range)
+            if on_chunk:
+                on_chunk(part)
+            return part
+
+        if len(chunks) == 1:
+            stats_map.update(fetch(chunks[0]))
+        else:
+            with ThreadPoolExecutor(max_workers=self.STATS_WORKERS, thread_name_prefix="stats") as ex:
+                for part in ex.map(fetch, chunks):
+                    stats_map.update(part)
+
         print(f"[STATS] 완료: 총 {len(stats_map)}개 통계 수집됨")
         return stats_map
 
+    # -------------------------------------------------------------------------
+    # [일별 통계] timeIncrement=1 로 ID x 날짜별 행 조회 (로컬 통계 저장소 적재용)
+    # - on_chunk(청크 ID 리스트, {(id, 'YYYY-MM-DD'): item} 또는 None=실패)
+    # - 응답에 날짜(dateStart)가 없으면 해당 청크만 하루씩 나눠서 다시 조회
+    # -------------------------------------------------------------------------
+    def _get_daily_stats_chunk(self, chunk, since, until):
+        res = self._call_stats({
+            "ids": ",".join(chunk),
+            "fields": json.dumps(self.STATS_FIELDS),
+            "timeRange": json.dumps({"since": since, "until": until}),
+            "timeIncrement": "1"
+        })
+        if not (isinstance(res, dict) and isinstance(res.get('data'), list)):
+            print(f"[STATS_ERROR] 일별 통계 실패 - 코드: {res.get('code') if isinstance(res, dict) else type(res)}, 청크 {len(chunk)}개")
+            return None
+        rows = {}
+        for item in res['data']:
+            if not isinstance(item, dict):
+                continue
+            day = item.get('dateStart') or (since if since == until else None)
+            if not day:
+                return self._get_daily_stats_by_day(chunk, since, until)
+            rows[(item['id'], day[:10])] = item
+        return rows
+
+    def _get_daily_stats_by_day(self, chunk, since, until):
+        rows = {}
+        day = datetime.strptime(since, "%Y-%m-%d")
+        end = datetime.strptime(until, "%Y-%m-%d")
+        while day <= end:
+            d = day.strftime("%Y-%m-%d")
+            part = self._get_daily_stats_chunk(chunk, d, d)
+            if part is None:
+                return None
+            rows.update(part)
+            day += timedelta(days=1)
+        return rows
+
+    def get_daily_stats(self, id_list, since, until, on_chunk=None):
+        """-> ({(id, 날짜): item}, 실패 ID 리스트)"""
+        if not id_list: return {}, []
+        chunks = [id_list[i:i + self.STATS_CHUNK] for i in range(0, len(id_list), self.STATS_CHUNK)]
+        print(f"[STATS] 일별 통계 조회: {len(id_list)}개 ID ({len(chunks)}개 요청), {since} ~ {until}")
+
+        def fetch(chunk):
+            rows = self._get_daily_stats_chunk(chunk, since, until)
+            if on_chunk:
+                on_chunk(chunk, rows)
+            return chunk, rows
+
+        all_rows, failed = {}, []
+        with ThreadPoolExecutor(max_workers=self.STATS_WORKERS, thread_name_prefix="stats") as ex:
+            for chunk, rows in ex.map(fetch, chunks):
+                if rows is None:
+                    failed.extend(chunk)
+                else:
+                    all_rows.update(rows)
+        return all_rows, failed
+
     def get_ads(self, adgroup_id):
         res = self.call_naver("/ncc/ads", params={"nccAdgroupId": adgroup_id})
         return res if isinstance(res, list) else []
 
+    # -------------------------------------------------------------------------
+    # [레코드 조회] 응답을 한 번만 파싱해서 __slots__ 레코드로 반환 (실패 시 빈 리스트)
+    # -------------------------------------------------------------------------
+    def get_campaign_records(self):
+        return parse_list(Campaign, self.get_campaigns())
+
+    def get_adgroup_records(self, campaign_id, keep_error=False):
+        """keep_error=True 면 실패 시 빈 리스트 대신 에러 dict 반환 (재시도 판단용)"""
+        if keep_error:
+            return parse_list(AdGroup, self.call_naver("/ncc/adgroups", params={"nccCampaignId": campaign_id}))
+        return parse_list(AdGroup, self.get_adgroups(campaign_id))
+
+    def get_keyword_records(self, adgroup_id):
+        return parse_list(Keyword, self.get_keywords(adgroup_id))
+
+    def get_extension_records(self, owner_id):
+        return parse_list(Extension, self.get_extensions(owner_id))
+
+    def get_ad_records(self, adgroup_id):
+        return parse_list(Ad, self.get_ads(adgroup_id))
+
+    def get_stat_rows(self, id_list, since=None, until=None):
+        """get_stats 결과를 {id: StatRow} 로 변환"""
+        stats_map = self.get_stats(id_list, since, until)
+        return {sid: StatRow.from_api(item) for sid, item in stats_map.items()}
+
     def create_ad(self, adgroup_id, headline, description, pc_url, mobile_url):
         body = {"type": "TEXT_45", "nccAdgroupId": adgroup_id, "ad": {"headline": headline, "description": description, "pc": {"final": pc_url}, "mobile": {"final": mobile_url}}}
         return self.call_naver("/ncc/ads", method="POST", body=body)
@@ -357,17 +803,26 @@ class APIClient:
             print(f"[DEBUG_EXT_CREATE] PHONE Body: {json.dumps(body, ensure_ascii=False)}", flush=True)
 
         # [수정] 단일 객체 전송으로 복구 (API가 Array를 받지 않음)
-        return self.call_naver("/ncc/ad-extensions", method="POST", body=body)
+        res = self.call_naver("/ncc/ad-extensions", method="POST", body=body)
+        if isinstance(res, dict) and 'nccAdExtensionId' in res:
+            self._notify_extensions("created", owner_id, [res])
+        return res
 
     def delete_extension(self, ext_id):
-        return self.call_naver(f"/ncc/ad-extensions/{ext_id}", method="DELETE")
+        res = self.call_naver(f"/ncc/ad-extensions/{ext_id}", method="DELETE")
+        if res is not None and not (isinstance(res, dict) and res.get('error')):
+            self._notify_extensions("deleted", None, [ext_id])
+        return res
 
     def toggle_extension(self, ext_id, user_lock):
-        return self.call_naver(
+        res = self.call_naver(
             f"/ncc/ad-extensions/{ext_id}", method="PUT",
             params={'fields': 'userLock'},
             body={'userLock': user_lock}
         )
+        if res is not None and not (isinstance(res, dict) and res.get('error')):
+            self._notify_extensions("updated", None, [{'nccAdExtensionId': ext_id, 'userLock': user_lock}])
+        return res
 
     def get_biz_channels(self):
         return self.call_naver("/ncc/channels") or []
@@ -0,0 +1,229 @@
+import sys
+import json
+
+# -------------------------------------------------------------------------
+# [응답 레코드] 네이버 API 응답을 필요한 필드만 담는 경량 객체로 변환
+# - __slots__ 로 인스턴스 dict 제거, ID/상태 문자열은 intern 하여 중복 저장 방지
+# - 응답은 수신 시 한 번만 파싱하고 이후 레이어는 레코드만 주고받음
+# -------------------------------------------------------------------------
+def _id(value):
+    return sys.intern(value) if value else ''
+
+
+class Campaign:
+    __slots__ = ('id', 'name', 'campaign_type', 'user_lock', 'del_flag')
+
+    def __init__(self, id, name, campaign_type='', user_lock=False, del_flag=False):
+        self.id = id
+        self.name = name
+        self.campaign_type = campaign_type
+        self.user_lock = user_lock
+        self.del_flag = del_flag
+
+    @classmethod
+    def from_api(cls, d):
+        return cls(
+            _id(d['nccCampaignId']),
+            d.get('name', ''),
+            _id(d.get('campaignTp', '')),
+            bool(d.get('userLock', False)),
+            bool(d.get('delFlag', False)),
+        )
+
+    def __repr__(self):
+        return f"Campaign({self.id}, {self.name!r})"
+
+
+class AdGroup:
+    __slots__ = ('id', 'campaign_id', 'name', 'pc_channel_id', 'mobile_channel_id', 'adgroup_type', 'user_lock')
+
+    def __init__(self, id, campaign_id, name, pc_channel_id=None, mobile_channel_id=None, adgroup_type='WEB_SITE', user_lock=False):
+        self.id = id
+        self.campaign_id = campaign_id
+        self.name = name
+        self.pc_channel_id = pc_channel_id
+        self.mobile_channel_id = mobile_channel_id
+        self.adgroup_type = adgroup_type
+        self.user_lock = user_lock
+
+    @classmethod
+    def from_api(cls, d):
+        return cls(
+            _id(d['nccAdgroupId']),
+            _id(d.get('nccCampaignId', '')),
+            d.get('name', '').strip(),
+            _id(d.get('pcChannelId')) or None,
+            _id(d.get('mobileChannelId')) or None,
+            _id(d.get('adgroupType', 'WEB_SITE')),
+            bool(d.get('userLock', False)),
+        )
+
+    def __repr__(self):
+        return f"AdGroup({self.id}, {self.name!r})"
+
+
+class Keyword:
+    """키워드 레코드 (입찰/중복검사에 필요한 필드만 보관)"""
+    __slots__ = ('id', 'adgroup_id', 'keyword', 'bid_amt', 'status')
+
+    def __init__(self, id, adgroup_id, keyword, bid_amt, status):
+        self.id = id
+        self.adgroup_id = adgroup_id
+        self.keyword = keyword
+        self.bid_amt = bid_amt
+        self.status = status
+
+    @classmethod
+    def from_api(cls, d):
+        return cls(
+            _id(d['nccKeywordId']),
+            _id(d.get('nccAdgroupId', '')),
+            d.get('keyword', ''),
+            d.get('bidAmt', 0),
+            _id(d.get('status', '')),
+        )
+
+    @property
+    def is_active(self):
+        return self.status in ('ELIGIBLE', 'ON')
+
+    @property
+    def normalized(self):
+        return normalize_keyword(self.keyword)
+
+    def __repr__(self):
+        return f"Keyword({self.id}, {self.keyword!r}, bid={self.bid_amt}, {self.status})"
+
+
+class StatRow:
+    """통계 API(/stats) 한 행"""
+    __slots__ = ('id', 'imp_cnt', 'clk_cnt', 'sales_amt', 'avg_rnk', 'conv_cnt')
+
+    def __init__(self, id, imp_cnt=0, clk_cnt=0, sales_amt=0, avg_rnk=0.0, conv_cnt=0):
+        self.id = id
+        self.imp_cnt = imp_cnt
+        self.clk_cnt = clk_cnt
+        self.sales_amt = sales_amt
+        self.avg_rnk = avg_rnk
+        self.conv_cnt = conv_cnt
+
+    @classmethod
+    def from_api(cls, d):
+        return cls(
+            _id(d['id']),
+            d.get('impCnt', 0) or 0,
+            d.get('clkCnt', 0) or 0,
+            d.get('salesAmt', 0) or 0,
+            d.get('avgRnk', 0.0) or 0.0,
+            d.get('ccnt', d.get('convCnt', 0)) or 0,
+        )
+
+    def __repr__(self):
+        return f"StatRow({self.id}, imp={self.imp_cnt}, clk={self.clk_cnt}, rnk={self.avg_rnk})"
+
+
+class Extension:
+    """확장소재 레코드 - GET 응답의 'adExtension'(구버전 'extension') 내용을 content로 통일"""
+    __slots__ = ('id', 'owner_id', 'type', 'content', 'pc_channel_id', 'mobile_channel_id', 'user_lock')
+
+    def __init__(self, id, owner_id, type, content, pc_channel_id=None, mobile_channel_id=None, user_lock=False):
+        self.id = id
+        self.owner_id = owner_id
+        self.type = type
+        self.content = content
+        self.pc_channel_id = pc_channel_id
+        self.mobile_channel_id = mobile_channel_id
+        self.user_lock = user_lock
+
+    @classmethod
+    def from_api(cls, d):
+        return cls(
+            _id(d.get('nccAdExtensionId', '')),
+            _id(d.get('ownerId', '')),
+            _id(d.get('type', '')),
+            d.get('adExtension') or d.get('extension') or {},
+            _id(d.get('pcChannelId')) or None,
+            _id(d.get('mobileChannelId')) or None,
+            bool(d.get('userLock', False)),
+        )
+
+    @property
+    def channel_id(self):
+        return self.pc_channel_id or self.mobile_channel_id
+
+    def __repr__(self):
+        return f"Extension({self.id}, {self.type}, owner={self.owner_id})"
+
+
+class Ad:
+    """소재 레코드 - 'ad' 본문(headline/description/url)은 content 딕셔너리로 보관"""
+    __slots__ = ('id', 'adgroup_id', 'type', 'content', 'user_lock')
+
+    def __init__(self, id, adgroup_id, type, content, user_lock=False):
+        self.id = id
+        self.adgroup_id = adgroup_id
+        self.type = type
+        self.content = content
+        self.user_lock = user_lock
+
+    @classmethod
+    def from_api(cls, d):
+        content = d.get('ad') or {}
+        if isinstance(content, str):
+            content = json.loads(content)
+        return cls(
+            _id(d.get('nccAdId', '')),
+            _id(d.get('nccAdgroupId', '')),
+            _id(d.get('type', 'TEXT_45')),
+            content,
+            bool(d.get('userLock', False)),
+        )
+
+    @property
+    def headline(self):
+        return self.content.get('headline')
+
+    @property
+    def description(self):
+        return self.content.get('description')
+
+    @property
+    def pc_final(self):
+        return (self.content.get('pc') or {}).get('final')
+
+    @property
+    def mobile_final(self):
+        return (self.content.get('mobile') or {}).get('final')
+
+    def __repr__(self):
+        return f"Ad({self.id}, {self.headline!r})"
+
+
+class KeywordPage:
+    """
+    키워드 스트리밍 한 페이지
+    - cursor: 다음 페이지 위치 (adgroup_id, base_search_id), 마지막이면 None
+    - error: 조회 실패 시 에러 딕셔너리 (keywords 는 빈 리스트)
+    """
+    __slots__ = ('adgroup_id', 'keywords', 'cursor', 'error')
+
+    def __init__(self, adgroup_id, keywords, cursor=None, error=None):
+        self.adgroup_id = adgroup_id
+        self.keywords = keywords
+        self.cursor = cursor
+        self.error = error
+
+    def __repr__(self):
+        return f"KeywordPage({self.adgroup_id}, {len(self.keywords)}개, next={self.cursor})"
+
+
+def normalize_keyword(text):
+    """중복 판정용 키워드 정규화 (공백 제거 + 대문자)"""
+    return text.replace(" ", "").upper()
+
+
+def parse_list(cls, res):
+    """리스트 응답이면 레코드 리스트로, 에러 응답(dict)은 그대로 반환"""
+    if isinstance(res, list):
+        return [cls.from_api(d) for d in res if isinstance(d, dict)]
+    return res
@@ -0,0 +1,54 @@
+import tracemalloc
+import json
+
+from api.models import Keyword, parse_list
+
+# -------------------------------------------------------------------------
+# [메모리 벤치마크] 키워드 10만개 기준 dict 보관 vs Keyword 레코드 보관
+# 실행: python bench_memory.py
+# -------------------------------------------------------------------------
+N = 100000
+GROUPS = 100
+
+
+def make_raw(n):
+    """네이버 /ncc/keywords 응답과 같은 형태의 JSON 문자열 생성"""
+    rows = []
+    for i in range(n):
+        gid = f"grp-a001-01-{i % GROUPS:012d}"
+        rows.append({
+            "nccKeywordId": f"nkw-a001-01-{i:012d}",
+            "nccAdgroupId": gid,
+            "nccCampaignId": "cmp-a001-01-000000000001",
+            "customerId": 1234567,
+            "keyword": f"테스트 키워드 {i}",
+            "bidAmt": 70 + (i % 50) * 10,
+            "useGroupBidAmt": False,
+            "userLock": False,
+            "inspectStatus": "APPROVED",
+            "status": "ELIGIBLE",
+            "statusReason": "ELIGIBLE",
+            "links": {"pc": {"final": "https://example.com"}, "mobile": {"final": "https://m.example.com"}},
+            "regTm": "2024-01-01T00:00:00.000Z",
+            "editTm": "2024-01-01T00:00:00.000Z",
+        })
+    return json.dumps(rows)
+
+
+def measure(label, build):
+    tracemalloc.start()
+    data = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"[BENCH] {label:<10} 보관 {current / 1024 / 1024:8.1f} MB | 피크 {peak / 1024 / 1024:8.1f} MB ({len(data)}개)")
+    return current
+
+
+if __name__ == "__main__":
+    raw = make_raw(N)
+    print(f"[BENCH] 키워드 {N}개, 응답 {len(raw) / 1024 / 1024:.1f} MB")
+
+    before = measure("dict", lambda: json.loads(raw))
+    after = measure("Keyword", lambda: parse_list(Keyword, json.loads(raw)))
+
+    print(f"[BENCH] 절감: {(before - after) / 1024 / 1024:.1f} MB ({(1 - after / before) * 100:.0f}%)")
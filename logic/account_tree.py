@@ -0,0 +1,169 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from api.api_client import api
+
+# -------------------------------------------------------------------------
+# [계정 트리] 캠페인 -> 광고그룹 구조를 한 번 조회해 모든 탭이 공유하는 스냅샷
+# - 캠페인별 그룹 조회를 스레드 풀에서 동시에 실행 (호출 간격은 api 공용 토큰 버킷)
+# - 결과는 캠페인 순서대로 on_campaign 으로 바로 전달 (앞 캠페인이 끝나는 대로)
+# - MAX_AGE 이내에 다시 요청하면 API 호출 없이 스냅샷을 그대로 전달
+# - 여러 탭이 동시에 요청해도 실제 조회는 1번 (나머지는 끝난 스냅샷 사용)
+# -------------------------------------------------------------------------
+class AccountTree:
+    MAX_WORKERS = 4
+    MAX_AGE = 300  # 초
+    RETRY_1014 = 3
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._campaigns = []  # Campaign 레코드 (API 순서)
+        self._groups = {}     # campaign_id -> [AdGroup]
+        self.loaded_at = None
+
+    # ---------------------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------------------
+    def is_fresh(self, max_age=None):
+        max_age = self.MAX_AGE if max_age is None else max_age
+        return self.loaded_at is not None and time.time() - self.loaded_at < max_age
+
+    def snapshot(self):
+        """[(Campaign, [AdGroup]), ...]"""
+        with self._lock:
+            return [(c, list(self._groups.get(c.id, []))) for c in self._campaigns]
+
+    def campaigns(self):
+        with self._lock:
+            return list(self._campaigns)
+
+    def groups_of(self, campaign_id):
+        with self._lock:
+            return list(self._groups.get(campaign_id, []))
+
+    def invalidate(self):
+        """그룹 생성/삭제 후 호출 - 다음 load 에서 다시 조회"""
+        self.loaded_at = None
+
+    # ---------------------------------------------------------------------
+    # 불러오기
+    # ---------------------------------------------------------------------
+    def _fetch_groups(self, campaign):
+        res = None
+        for _ in range(self.RETRY_1014):
+            res = api.get_adgroup_records(campaign.id, keep_error=True)
+            if isinstance(res, list):
+                return res
+            if not (isinstance(res, dict) and str(res.get('code')) == '1014'):
+                break  # 1014 는 call_naver 가 버킷을 늦춰 두었으므로 바로 재시도
+        print(f"[TREE] 그룹 조회 실패 ({campaign.name}): {res}")
+        return None
+
+    def load(self, on_campaign=None, force=False, max_age=None, should_stop=None):
+        """
+        계정 트리 조회 -> [(Campaign, [AdGroup]), ...]
+        on_campaign(Campaign, [AdGroup]): 캠페인 하나가 준비될 때마다 순서대로 호출
+        """
+        with self._load_lock:
+            if not force and self.is_fresh(max_age):
+                snap = self.snapshot()
+                if on_campaign:
+                    for c, groups in snap:
+                        on_campaign(c, groups)
+                return snap
+
+            camps = api.get_campaign_records()
+            if not isinstance(camps, list):
+                return []
+
+            result = []
+            complete = True
+            executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="account-tree")
+            try:
+                # map 은 동시에 실행하면서 결과는 입력 순서대로 돌려줌
+                for c, groups in zip(camps, executor.map(self._fetch_groups, camps)):
+                    if should_stop and should_stop():
+                        complete = False
+                        break
+                    if groups is None:
+                        complete = False
+                        groups = []
+                    result.append((c, groups))
+                    if on_campaign:
+                        on_campaign(c, groups)
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+            with self._lock:
+                self._campaigns = [c for c, _ in result]
+                self._groups = {c.id: groups for c, groups in result}
+            # 일부 실패/중단된 결과는 보관만 하고 다음 요청 때 다시 조회
+            self.loaded_at = time.time() if complete else None
+            return result
+
+
+account_tree = AccountTree()
+
+
+# -------------------------------------------------------------------------
+# [계정 트리 로더] 탭에서 사용하는 QThread 래퍼
+# - campaign_signal: 캠페인 하나씩 (트리 위젯에 바로 추가)
+# - data_signal: 전체 결과 (완료 처리)
+# -------------------------------------------------------------------------
+class AccountTreeLoader(QThread):
+    campaign_signal = pyqtSignal(object, list)  # (Campaign, [AdGroup])
+    data_signal = pyqtSignal(list)              # [(Campaign, [AdGroup]), ...]
+
+    def __init__(self, force=False):
+        super().__init__()
+        self.force = force
+        self.is_running = True
+
+    def run(self):
+        try:
+            result = account_tree.load(
+                on_campaign=self.campaign_signal.emit,
+                force=self.force,
+                should_stop=lambda: not self.is_running
+            )
+        except Exception as e:
+            print(f"[TREE] 계정 트리 로드 오류: {e}")
+            result = []
+        self.data_signal.emit(result)
+
+    def stop(self):
+        self.is_running = False
+
+
+_loaders = []   # load_tree_async 로 시작한 로더 (스레드가 끝날 때까지 참조 유지)
+_waiting = {}   # 결과를 아직 전달하지 않은 로더 -> [on_loaded 콜백] (메인 스레드에서만 읽고 씀)
+
+
+def _deliver(loader, tree):
+    """메인 스레드에서 호출 - 로더를 대기 목록에서 빼고 모아 둔 콜백에 전달"""
+    for on_loaded in _waiting.pop(loader, []):
+        on_loaded(tree)
+
+
+def load_tree_async(on_loaded, force=False):
+    """
+    메인 스레드에서 호출 - 스냅샷이 최신이면 on_loaded(트리) 를 바로, 아니면 백그라운드 조회 후 호출
+    여러 탭이 동시에 요청하면 진행 중인 로더 하나에 콜백만 추가
+    (콜백은 시그널 연결이 아니라 _waiting 목록에 모아 두므로, 결과가 전달되기 전에 추가한 콜백은 빠지지 않음)
+    """
+    if not force and account_tree.is_fresh():
+        on_loaded(account_tree.snapshot())
+        return
+    loader = next((l for l in _waiting if l.force or not force), None)
+    if loader is None:
+        loader = AccountTreeLoader(force=force)
+        _loaders.append(loader)
+        _waiting[loader] = []
+        loader.data_signal.connect(lambda tree, l=loader: _deliver(l, tree))
+        loader.finished.connect(lambda l=loader: _loaders.remove(l))
+        loader.start()
+    _waiting[loader].append(on_loaded)
@@ -0,0 +1,159 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+
+from api.api_client import api
+
+# -------------------------------------------------------------------------
+# [자산 복제 큐] 신규 _N 그룹에 원본 그룹의 확장소재/소재를 백그라운드로 복제
+# - 원본 그룹 자산은 원본당 1회만 조회 (memo)
+# - 대상 그룹별 작업을 스레드 풀에서 동시에 처리 (호출 간격은 api 공용 토큰 버킷)
+# - 그룹별 상태: 대기 -> 복제중 -> 완료 / 일부실패 / 실패
+# -------------------------------------------------------------------------
+SKIP_EXTENSION_TYPES = ("IMAGE_SUB_LINKS", "POWER_LINK_IMAGE")
+CONTENT_REQUIRED_TYPES = ("PHONE", "SUB_LINKS")
+
+
+class CloneStatus:
+    __slots__ = ('src_gid', 'dst_gid', 'state', 'created', 'failed', 'message')
+
+    def __init__(self, src_gid, dst_gid):
+        self.src_gid = src_gid
+        self.dst_gid = dst_gid
+        self.state = "대기"
+        self.created = 0
+        self.failed = 0
+        self.message = ""
+
+    def __repr__(self):
+        return f"CloneStatus({self.dst_gid}, {self.state}, +{self.created}/-{self.failed})"
+
+
+class AssetCloner:
+    MAX_WORKERS = 3
+    RETRY_1014 = 3
+
+    def __init__(self, on_status=None):
+        """on_status(CloneStatus): 상태가 바뀔 때마다 호출 (작업 스레드에서 호출됨)"""
+        self.on_status = on_status
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="asset-clone")
+        self._lock = threading.Lock()
+        self._sources = {}       # src_gid -> (extensions, ads)
+        self._source_locks = {}  # src_gid -> Lock (같은 원본 동시 조회 방지)
+        self._status = {}        # dst_gid -> CloneStatus
+        self._futures = {}       # dst_gid -> Future
+
+    # ---------------------------------------------------------------------
+    # 작업 등록 / 조회
+    # ---------------------------------------------------------------------
+    def enqueue(self, src_gid, dst_gid):
+        with self._lock:
+            if dst_gid in self._futures:
+                return self._futures[dst_gid]
+            status = CloneStatus(src_gid, dst_gid)
+            self._status[dst_gid] = status
+            future = self._executor.submit(self._clone, status)
+            self._futures[dst_gid] = future
+        self._emit(status)
+        return future
+
+    def status(self, dst_gid=None):
+        with self._lock:
+            if dst_gid is not None:
+                return self._status.get(dst_gid)
+            return list(self._status.values())
+
+    def pending_count(self):
+        with self._lock:
+            return sum(1 for f in self._futures.values() if not f.done())
+
+    def wait(self, timeout=None):
+        """등록된 복제 작업이 모두 끝날 때까지 대기 -> 상태 리스트"""
+        with self._lock:
+            futures = list(self._futures.values())
+        wait_futures(futures, timeout=timeout)
+        return self.status()
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    # ---------------------------------------------------------------------
+    # 내부 처리
+    # ---------------------------------------------------------------------
+    def _emit(self, status):
+        if self.on_status:
+            try:
+                self.on_status(status)
+            except Exception as e:
+                print(f"[CLONE] 상태 알림 실패: {e}")
+
+    def _load_source(self, src_gid):
+        """원본 그룹 자산을 복제 가능한 것만 골라 1회 조회 후 재사용"""
+        with self._lock:
+            if src_gid in self._sources:
+                return self._sources[src_gid]
+            src_lock = self._source_locks.setdefault(src_gid, threading.Lock())
+
+        with src_lock:
+            with self._lock:
+                if src_gid in self._sources:
+                    return self._sources[src_gid]
+
+            exts = api.get_extension_records(src_gid)
+            ads = api.get_ad_records(src_gid)
+            if not isinstance(exts, list) or not isinstance(ads, list):
+                return None
+
+            exts = [
+                e for e in exts
+                if e.type not in SKIP_EXTENSION_TYPES
+                and not (e.type in CONTENT_REQUIRED_TYPES and not e.content)
+            ]
+            # [오류 해결 1010] headline 등 필수 필드가 없으면 스킵
+            ads = [a for a in ads if a.headline and a.description]
+
+            with self._lock:
+                self._sources[src_gid] = (exts, ads)
+            return exts, ads
+
+    def _call(self, fn, *args):
+        for _ in range(self.RETRY_1014):
+            res = fn(*args)
+            if isinstance(res, dict) and res.get('error') and str(res.get('code')) == '1014':
+                continue  # call_naver 가 버킷을 이미 늦춰 둠
+            return res
+        return res
+
+    def _clone(self, status):
+        status.state = "복제중"
+        self._emit(status)
+        try:
+            source = self._load_source(status.src_gid)
+            if source is None:
+                status.state = "실패"
+                status.message = "원본 자산 조회 실패"
+                return status
+            exts, ads = source
+
+            for ext in exts:
+                res = self._call(api.create_extension, status.dst_gid, ext.type, ext.content, ext.channel_id)
+                if isinstance(res, dict) and res.get('error'):
+                    status.failed += 1
+                    status.message = f"확장소재 {ext.type} 실패 ({res.get('code')})"
+                else:
+                    status.created += 1
+
+            for ad in ads:
+                res = self._call(api.create_ad, status.dst_gid, ad.headline, ad.description, ad.pc_final, ad.mobile_final)
+                if isinstance(res, dict) and res.get('error'):
+                    status.failed += 1
+                    status.message = f"소재 실패 ({res.get('code')})"
+                else:
+                    status.created += 1
+
+            status.state = "완료" if status.failed == 0 else "일부실패"
+        except Exception as e:
+            status.state = "실패"
+            status.message = str(e)
+        finally:
+            self._emit(status)
+        return status
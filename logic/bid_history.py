@@ -0,0 +1,53 @@
+import os
+import json
+import threading
+
+# -------------------------------------------------------------------------
+# [입찰 변경 이력 (로컬)] 서버 업로드와 별개로 월별 JSONL 파일에 누적
+# - bid_history/YYYY-MM.jsonl, 한 줄 = 변경 1건 (서버 업로드 형식과 동일한 키)
+# - 리포트/내보내기는 서버나 API 를 거치지 않고 이 파일을 한 줄씩 읽음
+# -------------------------------------------------------------------------
+class BidHistoryLog:
+    HISTORY_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'bid_history'))
+
+    def __init__(self, history_dir=None):
+        self.history_dir = history_dir or self.HISTORY_DIR
+        self._lock = threading.Lock()
+
+    def append(self, events):
+        """events: [{'ts': ISO 시각, 'adgroup_id', 'keyword_id', 'old_bid', 'new_bid', ...}]"""
+        if not events:
+            return
+        by_month = {}
+        for ev in events:
+            by_month.setdefault(str(ev.get('ts', ''))[:7] or 'unknown', []).append(ev)
+        try:
+            with self._lock:
+                os.makedirs(self.history_dir, exist_ok=True)
+                for month, items in by_month.items():
+                    with open(os.path.join(self.history_dir, f"{month}.jsonl"), 'a', encoding='utf-8') as f:
+                        f.write("".join(json.dumps(ev, ensure_ascii=False) + "\n" for ev in items))
+        except OSError as e:
+            print(f"[BID_HISTORY] 저장 실패: {e}")
+
+    def iter_events(self, since=None, until=None):
+        """since~until (YYYY-MM-DD, 포함) 이벤트를 시간순 파일 단위로 하나씩"""
+        if not os.path.isdir(self.history_dir):
+            return
+        for name in sorted(os.listdir(self.history_dir)):
+            month = name[:7]
+            if not name.endswith('.jsonl') or (since and month < since[:7]) or (until and month > until[:7]):
+                continue
+            with open(os.path.join(self.history_dir, name), 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        ev = json.loads(line)
+                    except ValueError:
+                        continue  # 쓰다 끊긴 줄
+                    day = str(ev.get('ts', ''))[:10]
+                    if (since and day < since) or (until and day > until):
+                        continue
+                    yield ev
+
+
+bid_history = BidHistoryLog()
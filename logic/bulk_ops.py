@@ -0,0 +1,133 @@
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from api.api_client import api
+
+# -------------------------------------------------------------------------
+# [확장소재 일괄 작업 워커] 복사/삭제/ON·OFF 를 백그라운드에서 동시 실행
+# - 호출 간격은 api 공유 속도 제한기(naver_limiter)가 맞춤 -> 고정 sleep 없음
+# - 항목마다 결과(성공 여부, 메시지)를 results 에 기록하고 시그널로 전달
+# - stop(): 아직 시작 안 한 항목은 건너뜀 (진행 중인 호출은 끝까지 기다림)
+# - failed_tasks(): 실패/미실행 항목만 모아 새 워커로 재시도
+#   (복사 응답이 예상 밖이라 등록 여부를 모르는 항목은 중복 등록 방지를 위해 제외 -> unknown)
+# -------------------------------------------------------------------------
+BULK_WORKERS = 4
+
+# action: "copy" (args: 그룹ID, 확장소재 그룹 dict) / "delete" (args: 확장소재ID,) / "toggle" (args: 확장소재ID, userLock)
+BulkTask = namedtuple("BulkTask", "key label action args")
+
+
+class UnknownOutcome(Exception):
+    """요청은 보냈지만 성공 여부를 알 수 없음 (재시도하면 중복 등록 가능)"""
+
+
+def copy_task(group_id, ext_data, group_name=""):
+    return BulkTask(f"copy|{group_id}|{ext_data.get('key', ext_data['type'])}",
+                    f"{ext_data['type']} → {group_name or group_id}", "copy", (group_id, ext_data))
+
+
+def delete_task(ext_id):
+    return BulkTask(f"delete|{ext_id}", ext_id, "delete", (ext_id,))
+
+
+def toggle_task(ext_id, user_lock):
+    return BulkTask(f"toggle|{ext_id}", ext_id, "toggle", (ext_id, user_lock))
+
+
+def error_message(res):
+    """에러 응답 -> 'Err 코드: 메시지'"""
+    if not isinstance(res, dict):
+        return "응답 없음"
+    data = res.get('data')
+    msg = data.get('message') if isinstance(data, dict) else data
+    return f"Err {res.get('code', '')}: {msg or '알 수 없음'}"
+
+
+def run_task(task):
+    """작업 1건 실행 -> (성공 여부, 메시지) / 결과를 알 수 없으면 UnknownOutcome"""
+    if task.action == "copy":
+        gid, ext_data = task.args
+        res = api.create_extension(
+            owner_id=gid,
+            type_str=ext_data['type'],
+            content_dict=ext_data['content'],
+            channel_id=ext_data.get('businessChannelId')
+        )
+        # 'nccAdExtensionId' 가 있어야 생성 확인
+        if isinstance(res, dict) and 'nccAdExtensionId' in res:
+            return True, res['nccAdExtensionId']
+        if isinstance(res, dict) and res.get('error'):
+            print(f"[EXT_COPY_FAIL] Type:{ext_data['type']} Group:{gid} Res:{res}", flush=True)
+            return False, error_message(res)
+        print(f"[EXT_COPY_WARN] Type:{ext_data['type']} Group:{gid} Unexpected Res:{res}", flush=True)
+        raise UnknownOutcome("예상치 못한 응답 (등록 여부 확인 필요)")
+
+    if task.action == "delete":
+        res = api.delete_extension(*task.args)
+    elif task.action == "toggle":
+        res = api.toggle_extension(*task.args)
+    else:
+        return False, f"알 수 없는 작업: {task.action}"
+
+    if res is not None and not (isinstance(res, dict) and res.get('error')):
+        return True, ""
+    print(f"[EXT_{task.action.upper()}_FAIL] {task.args} Res:{res}", flush=True)
+    return False, error_message(res)
+
+
+class BulkOperationWorker(QThread):
+    item_signal = pyqtSignal(str, bool, str)  # (작업 key, 성공 여부, 메시지)
+    progress_signal = pyqtSignal(int, int)    # (처리 수, 전체)
+    finished_signal = pyqtSignal(int, int, int)  # (성공, 실패, 취소로 미실행)
+
+    def __init__(self, tasks, workers=BULK_WORKERS):
+        super().__init__()
+        self.tasks = list(tasks)
+        self.workers = max(1, workers)
+        self.results = {}  # key -> (성공 여부, 메시지)
+        self.unknown = set()  # 등록 여부를 알 수 없는 작업 key (실패로 집계, 재시도 제외)
+        self.is_running = True
+
+    def run(self):
+        done = 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bulk-ext") as executor:
+                futures = {executor.submit(self._run_one, t): t for t in self.tasks}
+                for future in as_completed(futures):
+                    task = futures[future]
+                    if future.cancelled():
+                        continue
+                    try:
+                        ok, msg = future.result()
+                    except UnknownOutcome as e:
+                        self.unknown.add(task.key)
+                        ok, msg = False, str(e)
+                    except Exception as e:
+                        print(f"[BULK] {task.label} 오류: {e}", flush=True)
+                        ok, msg = False, str(e)
+                    if ok is None:
+                        continue  # 취소 후 건너뛴 항목
+                    self.results[task.key] = (ok, msg)
+                    done += 1
+                    self.item_signal.emit(task.key, ok, msg)
+                    self.progress_signal.emit(done, len(self.tasks))
+        except Exception as e:
+            print(f"[BULK] 일괄 작업 오류: {e}", flush=True)
+
+        success = sum(1 for ok, _ in self.results.values() if ok)
+        self.finished_signal.emit(success, len(self.results) - success, len(self.tasks) - len(self.results))
+
+    def _run_one(self, task):
+        if not self.is_running:
+            return None, ""
+        return run_task(task)
+
+    def failed_tasks(self):
+        """실패했거나 취소로 실행되지 않은 작업 (재시도용, 등록 여부를 모르는 작업 제외)"""
+        return [t for t in self.tasks
+                if not self.results.get(t.key, (False,))[0] and t.key not in self.unknown]
+
+    def stop(self):
+        self.is_running = False
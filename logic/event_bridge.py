@@ -0,0 +1,52 @@
+import threading
+from collections import deque
+
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+# -------------------------------------------------------------------------
+# [이벤트 브리지] 작업 스레드 이벤트를 모아 UI 스레드에 묶음으로 전달
+# - attach(signal): 워커 시그널을 DirectConnection 으로 받아 버퍼에만 쌓음
+#   (emit 마다 UI 스레드 큐 이벤트가 생기지 않음)
+# - UI 스레드 타이머(기본 10Hz)가 버퍼를 비워 batch_signal(list) 1회 발생
+# - coalesce=True: 마지막 값만 전달 (상태 문구 / 진행률)
+# - 워커 종료 시그널에 flush 를 먼저 연결하면 남은 이벤트가 종료 처리보다 먼저 반영됨
+# -------------------------------------------------------------------------
+class BatchingBridge(QObject):
+    batch_signal = pyqtSignal(list)
+
+    DEFAULT_INTERVAL_MS = 100
+
+    def __init__(self, interval_ms=DEFAULT_INTERVAL_MS, coalesce=False, parent=None):
+        """UI 스레드에서 생성해야 함 (타이머가 생성한 스레드에서 동작)"""
+        super().__init__(parent)
+        self.coalesce = coalesce
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+    def attach(self, signal):
+        """워커 시그널 연결 - 인자가 1개면 값 그대로, 여러 개면 튜플로 쌓음"""
+        signal.connect(self.push, Qt.ConnectionType.DirectConnection)
+
+    def push(self, *args):
+        """어느 스레드에서든 호출 가능"""
+        item = args[0] if len(args) == 1 else args
+        with self._lock:
+            if self.coalesce:
+                self._queue.clear()
+            self._queue.append(item)
+
+    def flush(self):
+        with self._lock:
+            if not self._queue:
+                return
+            batch = list(self._queue)
+            self._queue.clear()
+        self.batch_signal.emit(batch)
+
+    def stop(self):
+        self._timer.stop()
+        self.flush()
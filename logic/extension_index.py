@@ -0,0 +1,259 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from api.api_client import api
+
+# -------------------------------------------------------------------------
+# [확장소재 인덱스] 소유자(캠페인/광고그룹)별 확장소재를 로컬 SQLite 에 보관
+# - content_hash: (타입, 내용, 채널) 정규화 JSON 의 SHA-1 -> 세션이 바뀌어도 같은 소재는 같은 키
+# - 소유자 단위로 동기화 시각(synced_at)을 기록하고, 오래된 소유자만 다시 조회 (동시 실행)
+# - api 의 확장소재 생성/삭제/ON·OFF 알림을 받아 즉시 반영 (api 는 logic 을 모름)
+# - 캠페인 그룹핑은 저장된 해시 순서대로 묶기만 함 -> 캠페인 전환 시 API 재조회 없이 바로 표시
+# - seq: 소재가 인덱스에 처음 들어온 순번 (소유자 재동기화로 다시 써도 유지) -> 카드 순서 고정
+# -------------------------------------------------------------------------
+def channel_of(ext):
+    return ext.get('pcChannelId') or ext.get('mobileChannelId') or ''
+
+
+def content_hash(ext_type, content, channel_id):
+    raw = json.dumps([ext_type, content or {}, channel_id or ''], sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class ExtensionIndex:
+    DB_FILE = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'extension_index.db'))
+    MAX_AGE = 30 * 60   # 소유자 동기화 유효 시간(초)
+    SYNC_WORKERS = 4
+    IN_CHUNK = 500      # SQLite 변수 개수 제한 대비 IN (...) 분할 크기
+
+    def __init__(self, db_file=None):
+        self.db_file = db_file or self.DB_FILE
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS ext_owners (
+                customer_id TEXT NOT NULL,
+                owner_id    TEXT NOT NULL,
+                campaign_id TEXT,
+                synced_at   REAL DEFAULT 0,
+                PRIMARY KEY (customer_id, owner_id)
+            );
+            CREATE TABLE IF NOT EXISTS ext_index (
+                customer_id  TEXT NOT NULL,
+                ext_id       TEXT NOT NULL,
+                owner_id     TEXT NOT NULL,
+                campaign_id  TEXT,
+                type         TEXT,
+                content_hash TEXT NOT NULL,
+                channel_id   TEXT,
+                data         TEXT,
+                seq          INTEGER DEFAULT 0,
+                PRIMARY KEY (customer_id, ext_id)
+            );
+            CREATE INDEX IF NOT EXISTS ix_ext_campaign ON ext_index (customer_id, campaign_id, content_hash);
+            CREATE INDEX IF NOT EXISTS ix_ext_owner ON ext_index (customer_id, owner_id);
+        """)
+        # seq 컬럼 이전에 만든 DB 는 컬럼만 추가 (기존 행은 0 -> rowid 순)
+        if 'seq' not in [r[1] for r in self._conn.execute("PRAGMA table_info(ext_index)")]:
+            self._conn.execute("ALTER TABLE ext_index ADD COLUMN seq INTEGER DEFAULT 0")
+        self._conn.commit()
+
+    @property
+    def customer_id(self):
+        return str(api.naver_customer_id or '')
+
+    def _chunks(self, items):
+        items = list(items)
+        for i in range(0, len(items), self.IN_CHUNK):
+            yield items[i:i + self.IN_CHUNK]
+
+    @staticmethod
+    def _row(cid, campaign_id, owner_id, ext, seq):
+        t = ext.get('type', '')
+        ch = channel_of(ext)
+        content = ext.get('adExtension') or ext.get('extension') or {}
+        return (cid, ext['nccAdExtensionId'], owner_id or ext.get('ownerId', ''), campaign_id, t,
+                content_hash(t, content, ch), ch, json.dumps(ext, ensure_ascii=False), seq)
+
+    def _assign_seq(self, cur, cid, ext_ids):
+        """이미 있던 소재는 기존 순번, 새 소재는 뒤에 이어서 (_lock 안에서 호출)"""
+        known = {}
+        for chunk in self._chunks(ext_ids):
+            q = f"SELECT ext_id, seq FROM ext_index WHERE customer_id=? AND ext_id IN ({','.join('?' * len(chunk))})"
+            known.update(cur.execute(q, [cid, *chunk]).fetchall())
+        nxt = (cur.execute("SELECT MAX(seq) FROM ext_index WHERE customer_id=?", (cid,)).fetchone()[0] or 0) + 1
+        seqs = {}
+        for eid in ext_ids:
+            if eid in known:
+                seqs[eid] = known[eid]
+            else:
+                seqs[eid] = nxt
+                nxt += 1
+        return seqs
+
+    # ---------------------------------------------------------------------
+    # 동기화
+    # ---------------------------------------------------------------------
+    def sync_campaign(self, campaign_id, owner_ids, max_age=None, progress=None):
+        """
+        캠페인 + 소속 그룹(owner_ids) 중 오래된 소유자만 다시 조회해 교체
+        - 목록에서 사라진 그룹의 소재는 제거
+        - progress(done, total): 소유자 1개 조회가 끝날 때마다 (작업 스레드에서 호출)
+        반환: 다시 조회한 소유자 수
+        """
+        max_age = self.MAX_AGE if max_age is None else max_age
+        owners = [campaign_id] + [o for o in owner_ids if o != campaign_id]
+        self._drop_missing_owners(campaign_id, set(owners))
+
+        synced = self.synced_times(owners)
+        now = time.time()
+        stale = [o for o in owners if now - synced.get(o, 0) > max_age]
+        if not stale:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=self.SYNC_WORKERS, thread_name_prefix="ext-index") as executor:
+            futures = {executor.submit(api.call_naver, "/ncc/ad-extensions", "GET", {"ownerId": o}): o for o in stale}
+            for done, future in enumerate(as_completed(futures), 1):
+                owner = futures[future]
+                try:
+                    res = future.result()
+                except Exception as e:
+                    res = None
+                    print(f"[EXT_INDEX] {owner} 조회 실패: {e}")
+                # 조회 실패(에러 딕셔너리/None)면 기존 인덱스 유지 -> 다음 동기화에서 재시도
+                if isinstance(res, list):
+                    self._replace_owner(campaign_id, owner, res)
+                if progress:
+                    progress(done, len(stale))
+        return len(stale)
+
+    def _replace_owner(self, campaign_id, owner_id, exts):
+        cid = self.customer_id
+        exts = [e for e in exts if e.get('nccAdExtensionId')]
+        with self._lock:
+            cur = self._conn.cursor()
+            seqs = self._assign_seq(cur, cid, [e['nccAdExtensionId'] for e in exts])
+            rows = [self._row(cid, campaign_id, owner_id, e, seqs[e['nccAdExtensionId']]) for e in exts]
+            cur.execute("DELETE FROM ext_index WHERE customer_id=? AND owner_id=?", (cid, owner_id))
+            cur.executemany(
+                "INSERT OR REPLACE INTO ext_index (customer_id, ext_id, owner_id, campaign_id, type, content_hash, channel_id, data, seq) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            cur.execute(
+                "INSERT OR REPLACE INTO ext_owners (customer_id, owner_id, campaign_id, synced_at) VALUES (?, ?, ?, ?)",
+                (cid, owner_id, campaign_id, time.time())
+            )
+            self._conn.commit()
+
+    def _drop_missing_owners(self, campaign_id, live_ids):
+        cid = self.customer_id
+        with self._lock:
+            known = [r[0] for r in self._conn.execute(
+                "SELECT owner_id FROM ext_owners WHERE customer_id=? AND campaign_id=?", (cid, campaign_id))]
+            gone = [o for o in known if o not in live_ids]
+            for o in gone:
+                self._conn.execute("DELETE FROM ext_index WHERE customer_id=? AND owner_id=?", (cid, o))
+                self._conn.execute("DELETE FROM ext_owners WHERE customer_id=? AND owner_id=?", (cid, o))
+            if gone:
+                self._conn.commit()
+
+    def synced_times(self, owner_ids):
+        cid = self.customer_id
+        result = {}
+        with self._lock:
+            for chunk in self._chunks(owner_ids):
+                q = f"SELECT owner_id, synced_at FROM ext_owners WHERE customer_id=? AND owner_id IN ({','.join('?' * len(chunk))})"
+                result.update(self._conn.execute(q, [cid, *chunk]).fetchall())
+        return result
+
+    def invalidate(self, campaign_id):
+        """다음 sync_campaign 때 캠페인 전체를 다시 조회"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE ext_owners SET synced_at=0 WHERE customer_id=? AND campaign_id=?", (self.customer_id, campaign_id))
+            self._conn.commit()
+
+    # ---------------------------------------------------------------------
+    # API 알림 반영 (생성/삭제/ON·OFF)
+    # ---------------------------------------------------------------------
+    def on_extension_event(self, event, owner_id, items):
+        cid = self.customer_id
+        with self._lock:
+            cur = self._conn.cursor()
+            if event == "created":
+                for ext in items:
+                    owner = owner_id or ext.get('ownerId', '')
+                    row = cur.execute(
+                        "SELECT campaign_id FROM ext_owners WHERE customer_id=? AND owner_id=?", (cid, owner)).fetchone()
+                    if row is None or not ext.get('nccAdExtensionId'):
+                        continue  # 인덱스에 없는 소유자 - 처음 열 때 동기화됨
+                    seq = self._assign_seq(cur, cid, [ext['nccAdExtensionId']])[ext['nccAdExtensionId']]
+                    cur.execute(
+                        "INSERT OR REPLACE INTO ext_index (customer_id, ext_id, owner_id, campaign_id, type, content_hash, channel_id, data, seq) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self._row(cid, row[0], owner, ext, seq)
+                    )
+            elif event == "deleted":
+                for chunk in self._chunks(items):
+                    cur.execute(
+                        f"DELETE FROM ext_index WHERE customer_id=? AND ext_id IN ({','.join('?' * len(chunk))})", [cid, *chunk])
+            elif event == "updated":
+                # 부분 응답(userLock 등)을 저장된 원본에 덮어씀 - 내용이 바뀌지 않으므로 해시는 그대로
+                for patch in items:
+                    eid = patch.get('nccAdExtensionId')
+                    row = cur.execute(
+                        "SELECT data FROM ext_index WHERE customer_id=? AND ext_id=?", (cid, eid)).fetchone()
+                    if row:
+                        data = json.loads(row[0])
+                        data.update(patch)
+                        cur.execute("UPDATE ext_index SET data=? WHERE customer_id=? AND ext_id=?",
+                                    (json.dumps(data, ensure_ascii=False), cid, eid))
+            else:
+                return
+            self._conn.commit()
+
+    # ---------------------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------------------
+    def campaign_groups(self, campaign_id, channels=None):
+        """
+        캠페인 소재를 같은 (타입, 내용, 채널) 끼리 묶은 목록 (처음 저장된 순서)
+        channels: {채널ID: 채널 dict} - 채널 이름/URL 표시용
+        반환: [{'key', 'type', 'content', 'businessChannelId', 'channelName', 'channelUrl', 'ownerIds', 'items'}]
+        """
+        channels = channels or {}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT content_hash, owner_id, type, channel_id, data FROM ext_index "
+                "WHERE customer_id=? AND campaign_id=? ORDER BY seq, rowid",
+                (self.customer_id, campaign_id)
+            ).fetchall()
+
+        groups = {}
+        for key, owner, ext_type, channel_id, data in rows:
+            ext = json.loads(data)
+            group = groups.get(key)
+            if group is None:
+                ch = channels.get(channel_id) if channel_id else None
+                group = groups[key] = {
+                    'key': key,
+                    'type': ext_type,
+                    'content': ext.get('adExtension') or ext.get('extension') or {},
+                    'businessChannelId': channel_id,
+                    'channelName': ch['name'] if ch else channel_id,
+                    'channelUrl': ch.get('channelKey', '') if ch else '',
+                    'ownerIds': [],
+                    'items': []
+                }
+            group['ownerIds'].append(owner)
+            group['items'].append(ext)
+        return list(groups.values())
+
+
+extension_index = ExtensionIndex()
+api.add_extension_listener(extension_index.on_extension_event)
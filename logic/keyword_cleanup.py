@@ -0,0 +1,90 @@
+import re
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from api.api_client import api
+from logic.keyword_index import keyword_index
+
+# -------------------------------------------------------------------------
+# [중복 키워드 검색 워커] 베이스명(basename 또는 basename_숫자) 그룹만 인덱스 동기화 후 중복 조회
+# - 최근 동기화된 그룹은 API 호출 없이 건너뜀
+# -------------------------------------------------------------------------
+class DuplicateScanWorker(QThread):
+    status_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal(object, str)  # ([(그룹명, 키워드, 키워드ID, 정규화)] / 실패 시 None, 실패 메시지)
+
+    def __init__(self, campaign_id, basenames):
+        super().__init__()
+        self.campaign_id = campaign_id
+        self.basenames = basenames
+
+    def run(self):
+        try:
+            patterns = [re.compile(f"^{re.escape(b)}(_\\d+)?$") for b in self.basenames]
+            all_groups = keyword_index.sync_campaign(
+                self.campaign_id,
+                lambda name: any(p.match(name) for p in patterns),
+                progress=lambda done, total, name: self.status_signal.emit(f"동기화 중: {name} ({done}/{total})")
+            )
+            if not all_groups:
+                self.finished_signal.emit(None, "그룹 조회 실패")
+                return
+
+            duplicates = []
+            # 각 베이스명별로 인덱스에서 중복 조회 (첫 번째 그룹 유지, 나머지 중복 표시)
+            for basename, pattern in zip(self.basenames, patterns):
+                self.status_signal.emit(f"검색 중: {basename}...")
+                related_groups = [grp for grp in all_groups if pattern.match(grp.name)]
+                if len(related_groups) < 2:
+                    continue  # 묶음 그룹이 아니면 스킵
+                duplicates.extend(keyword_index.duplicates(related_groups))
+            self.finished_signal.emit(duplicates, "")
+        except Exception as e:
+            print(f"[SCAN] 중복 검색 오류: {e}")
+            self.finished_signal.emit(None, f"오류: {e}")
+
+# -------------------------------------------------------------------------
+# [중복 키워드 삭제 워커] 대량 삭제 API로 100개씩 삭제하고 묶음마다 결과 전달
+# - 삭제 결과는 키워드 인덱스에 자동 반영되므로 재검색 불필요
+# -------------------------------------------------------------------------
+class KeywordDeleteWorker(QThread):
+    chunk_signal = pyqtSignal(list, dict)    # (삭제된 ID 리스트, {실패 ID: 메시지})
+    progress_signal = pyqtSignal(int, int)   # (처리 수, 전체)
+    finished_signal = pyqtSignal(int, int)   # (성공, 실패)
+
+    def __init__(self, keyword_ids):
+        super().__init__()
+        self.keyword_ids = keyword_ids
+        self.is_running = True
+        self._done = 0
+        self._success = 0
+        self._fail = 0
+
+    def run(self):
+        try:
+            ids = list(self.keyword_ids)
+            step = api.KEYWORD_DELETE_CHUNK
+            for i in range(0, len(ids), step):
+                if not self.is_running:
+                    break
+                api.delete_keywords_bulk(ids[i:i + step], on_chunk=self._on_chunk)
+        except Exception as e:
+            print(f"[DELETE] 삭제 작업 오류: {e}")
+        self.finished_signal.emit(self._success, self._fail)
+
+    def _on_chunk(self, results):
+        deleted = [kid for kid, r in results.items() if r is True]
+        failed = {}
+        for kid, r in results.items():
+            if r is not True:
+                data = r.get('data') if isinstance(r, dict) else None
+                msg = data.get('message') if isinstance(data, dict) else data
+                failed[kid] = f"Err {r.get('code') if isinstance(r, dict) else ''}: {msg or '알 수 없음'}"
+        self._done += len(results)
+        self._success += len(deleted)
+        self._fail += len(failed)
+        self.chunk_signal.emit(deleted, failed)
+        self.progress_signal.emit(self._done, len(self.keyword_ids))
+
+    def stop(self):
+        self.is_running = False
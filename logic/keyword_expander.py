@@ -0,0 +1,93 @@
+import re
+
+from api.models import normalize_keyword
+
+# -------------------------------------------------------------------------
+# [키워드 확장] 지역 × 키워드 조합을 한 번에 리스트로 만들지 않고 하나씩 생성
+# - 매핑 한 줄: "그룹명(지역1,지역2)" 또는 "그룹명" (지역 = 그룹명)
+# - 조합: 지역+키워드(A+B), 키워드+지역(B+A), 키워드만(B)
+# - 정규화 키워드 기준 중복 제거 (그룹별: 생성 중 중복 + 이미 등록된 키워드 집합)
+# -------------------------------------------------------------------------
+MAPPING_RE = re.compile(r"^([^(]+)(?:\(([^)]+)\))?$")
+
+
+def parse_mapping(map_txt, adgroups_map):
+    """
+    매핑 텍스트 -> ([(그룹명, 그룹ID, [지역...]), ...], [매칭 실패 그룹명...])
+    adgroups_map: {그룹명: 그룹ID}
+    """
+    specs = []
+    unmatched = []
+    for line in map_txt.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        match = MAPPING_RE.match(line)
+        if not match:
+            continue
+        gname = match.group(1).strip()
+        subs = match.group(2)
+        gid = adgroups_map.get(gname)
+        if not gid:
+            unmatched.append(gname)
+            continue
+        geos = [s.strip() for s in subs.split(',') if s.strip()] if subs else [gname]
+        specs.append((gname, gid, geos))
+    return specs, unmatched
+
+
+def split_keywords(kwd_txt):
+    return [k.strip() for k in re.split(r'[,\n]+', kwd_txt) if k.strip()]
+
+
+class KeywordExpansion:
+    """
+    반복할 때마다 (그룹명, 그룹ID, 키워드) 를 하나씩 생성
+    - existing: {그룹ID: 이미 등록된 정규화 키워드 집합} (건너뜀)
+    - 중복/기존 건너뛴 개수는 skipped_dup / skipped_existing 에 누적
+    """
+
+    def __init__(self, specs, keywords, use_ab=True, use_ba=True, use_b=False, existing=None):
+        self.specs = specs
+        self.keywords = keywords
+        self.use_ab = use_ab
+        self.use_ba = use_ba
+        self.use_b = use_b
+        self.existing = existing or {}
+        self.skipped_dup = 0
+        self.skipped_existing = 0
+
+    def upper_bound(self):
+        """중복 제거 전 최대 조합 수 (미리보기 표시용, 생성 없이 계산)"""
+        per_geo = int(self.use_ab) + int(self.use_ba)
+        return sum(len(self.keywords) * (len(geos) * per_geo + int(self.use_b)) for _, _, geos in self.specs)
+
+    def _raw(self):
+        for gname, gid, geos in self.specs:
+            for k in self.keywords:
+                # 1. 지역+키워드 조합 (체크된 경우에만)
+                if self.use_ab or self.use_ba:
+                    for g in geos:
+                        if self.use_ab:
+                            yield gname, gid, g + k
+                        if self.use_ba:
+                            yield gname, gid, k + g
+                # 2. 키워드만 (체크된 경우 한 번만 추가)
+                if self.use_b:
+                    yield gname, gid, k
+
+    def __iter__(self):
+        self.skipped_dup = 0
+        self.skipped_existing = 0
+        seen = {}
+        for gname, gid, kwd in self._raw():
+            norm = normalize_keyword(kwd)
+            group_seen = seen.setdefault(gid, set())
+            if norm in group_seen:
+                self.skipped_dup += 1
+                continue
+            group_seen.add(norm)
+            if norm in self.existing.get(gid, ()):
+                self.skipped_existing += 1
+                continue
+            yield gname, gid, kwd
@@ -0,0 +1,284 @@
+import os
+import time
+import sqlite3
+import threading
+
+from api.api_client import api
+from api.models import normalize_keyword
+
+# -------------------------------------------------------------------------
+# [키워드 인덱스] 정규화 키워드 -> (그룹, 키워드ID) 로컬 역색인 (SQLite)
+# - 그룹 단위로 동기화 시각(synced_at)을 기록하고, 오래된 그룹만 다시 스트리밍
+# - api 의 키워드 생성/삭제 알림을 받아 즉시 반영 (api 는 logic 을 모름)
+# - 중복 검사/중복 스캔은 API 재조회 없이 로컬 조회로 처리
+# -------------------------------------------------------------------------
+class KeywordIndex:
+    DB_FILE = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'keyword_index.db'))
+    MAX_AGE = 30 * 60  # 그룹 동기화 유효 시간(초)
+    IN_CHUNK = 500     # SQLite 변수 개수 제한 대비 IN (...) 분할 크기
+
+    def __init__(self, db_file=None):
+        self.db_file = db_file or self.DB_FILE
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS kw_groups (
+                customer_id TEXT NOT NULL,
+                adgroup_id  TEXT NOT NULL,
+                campaign_id TEXT,
+                name        TEXT,
+                kw_count    INTEGER DEFAULT 0,
+                synced_at   REAL DEFAULT 0,
+                PRIMARY KEY (customer_id, adgroup_id)
+            );
+            CREATE TABLE IF NOT EXISTS kw_index (
+                customer_id TEXT NOT NULL,
+                keyword_id  TEXT NOT NULL,
+                adgroup_id  TEXT NOT NULL,
+                norm        TEXT NOT NULL,
+                keyword     TEXT,
+                PRIMARY KEY (customer_id, keyword_id)
+            );
+            CREATE INDEX IF NOT EXISTS ix_kw_norm ON kw_index (customer_id, norm);
+            CREATE INDEX IF NOT EXISTS ix_kw_group ON kw_index (customer_id, adgroup_id);
+        """)
+        self._conn.commit()
+
+    @property
+    def customer_id(self):
+        return str(api.naver_customer_id or '')
+
+    def _chunks(self, items):
+        items = list(items)
+        for i in range(0, len(items), self.IN_CHUNK):
+            yield items[i:i + self.IN_CHUNK]
+
+    # ---------------------------------------------------------------------
+    # 동기화
+    # ---------------------------------------------------------------------
+    def sync_group(self, adgroup_id, campaign_id=None, name=None):
+        """
+        그룹 키워드 전체를 스트리밍으로 다시 받아 인덱스를 교체
+        반환: 키워드 개수 / 조회 실패 시 None (기존 인덱스는 유지)
+        """
+        rows = []
+        for page in api.iter_keyword_pages(adgroup_id):
+            if page.error:
+                return None
+            rows.extend((k.id, k.normalized, k.keyword) for k in page.keywords)
+
+        cid = self.customer_id
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("DELETE FROM kw_index WHERE customer_id=? AND adgroup_id=?", (cid, adgroup_id))
+            cur.executemany(
+                "INSERT OR REPLACE INTO kw_index (customer_id, keyword_id, adgroup_id, norm, keyword) VALUES (?, ?, ?, ?, ?)",
+                [(cid, kid, adgroup_id, norm, text) for kid, norm, text in rows]
+            )
+            cur.execute("""
+                INSERT INTO kw_groups (customer_id, adgroup_id, campaign_id, name, kw_count, synced_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(customer_id, adgroup_id) DO UPDATE SET
+                    campaign_id=COALESCE(excluded.campaign_id, kw_groups.campaign_id),
+                    name=COALESCE(excluded.name, kw_groups.name),
+                    kw_count=excluded.kw_count,
+                    synced_at=excluded.synced_at
+            """, (cid, adgroup_id, campaign_id, name, len(rows), time.time()))
+            self._conn.commit()
+        return len(rows)
+
+    def sync_campaign(self, campaign_id, name_filter=None, max_age=None, progress=None):
+        """
+        캠페인 그룹 목록을 받아 (name_filter 통과 그룹만) 오래된 그룹만 재동기화
+        - 목록에서 사라진 그룹은 인덱스에서 제거
+        - progress(done, total, name) 콜백으로 진행 상황 전달
+        반환: 동기화 대상 AdGroup 레코드 리스트 (API 순서 유지)
+        """
+        max_age = self.MAX_AGE if max_age is None else max_age
+        groups = api.get_adgroup_records(campaign_id)
+        if not isinstance(groups, list):
+            return []
+        self._drop_missing_groups(campaign_id, {g.id for g in groups})
+
+        targets = [g for g in groups if name_filter is None or name_filter(g.name)]
+        synced = self.synced_times([g.id for g in targets])
+        now = time.time()
+        for i, g in enumerate(targets):
+            if now - synced.get(g.id, 0) > max_age:
+                if progress:
+                    progress(i, len(targets), g.name)
+                self.sync_group(g.id, campaign_id, g.name)
+            else:
+                self._touch_group(g.id, campaign_id, g.name)
+        return targets
+
+    def _touch_group(self, adgroup_id, campaign_id, name):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE kw_groups SET campaign_id=?, name=? WHERE customer_id=? AND adgroup_id=?",
+                (campaign_id, name, self.customer_id, adgroup_id)
+            )
+            self._conn.commit()
+
+    def _drop_missing_groups(self, campaign_id, live_ids):
+        cid = self.customer_id
+        with self._lock:
+            known = [r[0] for r in self._conn.execute(
+                "SELECT adgroup_id FROM kw_groups WHERE customer_id=? AND campaign_id=?", (cid, campaign_id))]
+            gone = [gid for gid in known if gid not in live_ids]
+            for gid in gone:
+                self._conn.execute("DELETE FROM kw_index WHERE customer_id=? AND adgroup_id=?", (cid, gid))
+                self._conn.execute("DELETE FROM kw_groups WHERE customer_id=? AND adgroup_id=?", (cid, gid))
+            if gone:
+                self._conn.commit()
+
+    def synced_times(self, adgroup_ids):
+        cid = self.customer_id
+        result = {}
+        with self._lock:
+            for chunk in self._chunks(adgroup_ids):
+                q = f"SELECT adgroup_id, synced_at FROM kw_groups WHERE customer_id=? AND adgroup_id IN ({','.join('?' * len(chunk))})"
+                result.update(self._conn.execute(q, [cid, *chunk]).fetchall())
+        return result
+
+    # ---------------------------------------------------------------------
+    # API 알림 반영 (생성/삭제)
+    # ---------------------------------------------------------------------
+    def on_keyword_event(self, event, adgroup_id, items):
+        cid = self.customer_id
+        with self._lock:
+            cur = self._conn.cursor()
+            if event == "created":
+                cur.executemany(
+                    "INSERT OR REPLACE INTO kw_index (customer_id, keyword_id, adgroup_id, norm, keyword) VALUES (?, ?, ?, ?, ?)",
+                    [(cid, k.id, adgroup_id or k.adgroup_id, k.normalized, k.keyword) for k in items]
+                )
+                touched = {adgroup_id or k.adgroup_id for k in items}
+            elif event == "deleted":
+                touched = {adgroup_id} if adgroup_id else set()
+                for chunk in self._chunks(items):
+                    marks = ','.join('?' * len(chunk))
+                    if not adgroup_id:
+                        touched.update(r[0] for r in cur.execute(
+                            f"SELECT DISTINCT adgroup_id FROM kw_index WHERE customer_id=? AND keyword_id IN ({marks})", [cid, *chunk]))
+                    cur.execute(f"DELETE FROM kw_index WHERE customer_id=? AND keyword_id IN ({marks})", [cid, *chunk])
+            else:
+                return
+            # 그룹별 키워드 수 재계산
+            cur.executemany("""
+                UPDATE kw_groups SET kw_count=(
+                    SELECT COUNT(*) FROM kw_index WHERE customer_id=? AND adgroup_id=?
+                ) WHERE customer_id=? AND adgroup_id=?
+            """, [(cid, gid, cid, gid) for gid in touched if gid])
+            self._conn.commit()
+
+    # ---------------------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------------------
+    def group_count(self, adgroup_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT kw_count FROM kw_groups WHERE customer_id=? AND adgroup_id=?",
+                (self.customer_id, adgroup_id)
+            ).fetchone()
+        return row[0] if row else None
+
+    def group_keywords(self, adgroup_ids):
+        """그룹들의 인덱스된 키워드 -> [(keyword_id, adgroup_id, 키워드 원문), ...]"""
+        cid = self.customer_id
+        rows = []
+        with self._lock:
+            for chunk in self._chunks(adgroup_ids):
+                rows.extend(self._conn.execute(
+                    f"SELECT keyword_id, adgroup_id, keyword FROM kw_index WHERE customer_id=? "
+                    f"AND adgroup_id IN ({','.join('?' * len(chunk))})",
+                    [cid, *chunk]
+                ))
+        return rows
+
+    def find_existing(self, keywords, campaign_id, name_prefix=None):
+        """
+        주어진 키워드(원문) 중 캠페인(선택: 그룹명이 name_prefix 로 시작)에 이미 있는 것의 정규화 문자열 집합
+        """
+        norms = {normalize_keyword(k) for k in keywords}
+        cid = self.customer_id
+        found = set()
+        q = """
+            SELECT DISTINCT i.norm FROM kw_index i
+            JOIN kw_groups g ON g.customer_id=i.customer_id AND g.adgroup_id=i.adgroup_id
+            WHERE i.customer_id=? AND g.campaign_id=? {prefix} AND i.norm IN ({marks})
+        """
+        prefix_sql = "AND substr(g.name, 1, ?)=?" if name_prefix else ""
+        prefix_args = [len(name_prefix), name_prefix] if name_prefix else []
+        with self._lock:
+            for chunk in self._chunks(norms):
+                sql = q.format(prefix=prefix_sql, marks=','.join('?' * len(chunk)))
+                found.update(r[0] for r in self._conn.execute(sql, [cid, campaign_id, *prefix_args, *chunk]))
+        return found
+
+    def campaign_norms(self, campaign_id, name_prefix=None):
+        """캠페인(선택: 그룹명이 name_prefix 로 시작)에 등록된 정규화 키워드 집합 (확장 미리보기 중복 제거용)"""
+        sql = """
+            SELECT DISTINCT i.norm FROM kw_index i
+            JOIN kw_groups g ON g.customer_id=i.customer_id AND g.adgroup_id=i.adgroup_id
+            WHERE i.customer_id=? AND g.campaign_id=?
+        """
+        args = [self.customer_id, campaign_id]
+        if name_prefix:
+            sql += " AND substr(g.name, 1, ?)=?"
+            args += [len(name_prefix), name_prefix]
+        with self._lock:
+            return {r[0] for r in self._conn.execute(sql, args)}
+
+    def lookup(self, keyword, campaign_id=None):
+        """키워드 원문 -> [(adgroup_id, keyword_id), ...]"""
+        sql = """
+            SELECT i.adgroup_id, i.keyword_id FROM kw_index i
+            LEFT JOIN kw_groups g ON g.customer_id=i.customer_id AND g.adgroup_id=i.adgroup_id
+            WHERE i.customer_id=? AND i.norm=?
+        """
+        args = [self.customer_id, normalize_keyword(keyword)]
+        if campaign_id:
+            sql += " AND g.campaign_id=?"
+            args.append(campaign_id)
+        with self._lock:
+            return self._conn.execute(sql, args).fetchall()
+
+    def duplicates(self, groups):
+        """
+        groups(AdGroup 레코드, 우선순위 순) 사이에 중복된 키워드 목록
+        각 정규화 키워드는 앞선 그룹의 첫 항목만 유지, 나머지를 (그룹명, 키워드, 키워드ID, 정규화) 로 반환
+        """
+        names = {g.id: g.name for g in groups}
+        cid = self.customer_id
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("CREATE TEMP TABLE IF NOT EXISTS tmp_scan_groups (adgroup_id TEXT PRIMARY KEY, pos INTEGER)")
+            cur.execute("DELETE FROM tmp_scan_groups")
+            cur.executemany("INSERT OR IGNORE INTO tmp_scan_groups VALUES (?, ?)", [(g.id, i) for i, g in enumerate(groups)])
+            rows = cur.execute("""
+                SELECT i.adgroup_id, i.keyword, i.keyword_id, i.norm, t.pos FROM kw_index i
+                JOIN tmp_scan_groups t ON t.adgroup_id=i.adgroup_id
+                WHERE i.customer_id=? AND i.norm IN (
+                    SELECT i2.norm FROM kw_index i2
+                    JOIN tmp_scan_groups t2 ON t2.adgroup_id=i2.adgroup_id
+                    WHERE i2.customer_id=?
+                    GROUP BY i2.norm HAVING COUNT(*) > 1
+                )
+                ORDER BY i.norm, t.pos, i.keyword_id
+            """, (cid, cid)).fetchall()
+
+        result = []
+        prev = None
+        for gid, text, kid, norm, pos in rows:
+            if norm == prev:
+                result.append((pos, names[gid], text, kid, norm))
+            prev = norm
+        # 화면 표시는 그룹 순서대로
+        result.sort(key=lambda r: r[0])
+        return [r[1:] for r in result]
+
+
+keyword_index = KeywordIndex()
+api.add_keyword_listener(keyword_index.on_keyword_event)
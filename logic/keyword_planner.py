@@ -0,0 +1,305 @@
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from api.api_client import api
+from api.models import normalize_keyword
+from logic.keyword_index import keyword_index
+from logic.account_tree import account_tree
+
+# -------------------------------------------------------------------------
+# [키워드 배치 계획] base_name, base_name_1, base_name_2 ... 묶음 그룹에 대량 키워드 배치
+# 1) 스냅샷: 캠페인 그룹 목록 1회 조회 + 키워드 인덱스로 그룹별 키워드 수 확인
+# 2) 계획: 큐 전체를 기존 그룹 여유분 -> 신규 그룹 순으로 한 번에 배치 (신규 그룹 수까지 계산)
+# 3) 실행: 신규 그룹 생성 후 100개 단위 POST 를 여러 그룹에 병렬 전송
+#    (속도 제한은 api 공용 토큰 버킷이 담당)
+# -------------------------------------------------------------------------
+GROUP_LIMIT = 1000
+BATCH_SIZE = 100
+
+
+class GroupSlot:
+    """배치 대상 그룹 한 칸 (신규 그룹은 adgroup_id 가 생성 후 채워짐)"""
+    __slots__ = ('adgroup_id', 'name', 'index', 'count', 'assigned')
+
+    def __init__(self, adgroup_id, name, index, count):
+        self.adgroup_id = adgroup_id
+        self.name = name
+        self.index = index
+        self.count = count
+        self.assigned = []
+
+    @property
+    def is_new(self):
+        return self.adgroup_id is None
+
+    @property
+    def free(self):
+        return GROUP_LIMIT - self.count - len(self.assigned)
+
+    def __repr__(self):
+        return f"GroupSlot({self.name}, count={self.count}, +{len(self.assigned)})"
+
+
+class PlacementPlan:
+    __slots__ = ('slots', 'skipped')
+
+    def __init__(self, slots, skipped):
+        self.slots = slots
+        self.skipped = skipped
+
+    @property
+    def new_groups(self):
+        return [s for s in self.slots if s.is_new and s.assigned]
+
+    @property
+    def total(self):
+        return sum(len(s.assigned) for s in self.slots)
+
+    def batches(self):
+        """(slot, tasks[<=100]) 목록 - 그룹을 번갈아 가며 섞어서 병렬 전송 시 한 그룹에 몰리지 않게 함"""
+        per_slot = [
+            [(s, s.assigned[i:i + BATCH_SIZE]) for i in range(0, len(s.assigned), BATCH_SIZE)]
+            for s in self.slots if s.assigned and not s.is_new
+        ]
+        result = []
+        for i in range(max((len(p) for p in per_slot), default=0)):
+            result.extend(p[i] for p in per_slot if i < len(p))
+        return result
+
+
+class PlacementResult:
+    __slots__ = ('success', 'failed', 'leftover')
+
+    def __init__(self):
+        self.success = 0
+        self.failed = 0
+        self.leftover = []   # 그룹 생성 실패 등으로 배치하지 못한 작업 (재계획 대상)
+
+
+TRANSIENT_CODES = ('1014', '999', 'None')  # 한도 초과 / 통신 예외 / 응답 없음 -> 재계획
+
+
+class KeywordPlanner:
+    MAX_WORKERS = 4
+    MAX_ROUNDS = 3          # 남은 작업 재계획 횟수
+    SNAPSHOT_MAX_AGE = 300  # 스냅샷에 쓸 키워드 인덱스 허용 지연(초)
+
+    def __init__(self, campaign_id, base_name, template, journal=None, snapshot_max_age=None):
+        """
+        template: 원본 그룹 정보(dict) - 신규 그룹 생성 시 채널/유형 복사
+        journal: RegisterJob - 계획/전송/확인 배치를 기록 (재개용)
+        snapshot_max_age: 재개 시에는 인덱스를 그대로 믿도록 크게 지정
+        """
+        self.campaign_id = campaign_id
+        self.base_name = base_name
+        self.template = template
+        self.journal = journal
+        if snapshot_max_age is not None:
+            self.SNAPSHOT_MAX_AGE = snapshot_max_age
+        self._pattern = re.compile(f"^{re.escape(base_name)}(?:_(\\d+))?$")
+
+    # ---------------------------------------------------------------------
+    # 1. 스냅샷
+    # ---------------------------------------------------------------------
+    def snapshot(self):
+        """묶음 그룹 전체를 접미 번호 순으로 GroupSlot 리스트로 반환"""
+        groups = keyword_index.sync_campaign(
+            self.campaign_id,
+            lambda name: bool(self._pattern.match(name)),
+            max_age=self.SNAPSHOT_MAX_AGE
+        )
+        slots = []
+        for g in groups:
+            m = self._pattern.match(g.name)
+            index = int(m.group(1)) if m.group(1) else 0
+            count = keyword_index.group_count(g.id)
+            if count is None:
+                count = keyword_index.sync_group(g.id, self.campaign_id, g.name)
+            if count is None:
+                count = GROUP_LIMIT  # 수를 모르면 가득 찬 것으로 보고 건너뜀
+            slots.append(GroupSlot(g.id, g.name, index, count))
+        slots.sort(key=lambda s: s.index)
+        return slots
+
+    # ---------------------------------------------------------------------
+    # 2. 계획
+    # ---------------------------------------------------------------------
+    def plan(self, tasks, start_index=0):
+        """
+        tasks: {'keyword', 'row', ...} 작업 리스트
+        start_index: 이 접미 번호 이상의 그룹부터 채움 (원본 그룹이 base_name_N 인 경우)
+        """
+        slots = self.snapshot()
+        existing = keyword_index.find_existing([t['keyword'] for t in tasks], self.campaign_id, self.base_name)
+
+        queue = []
+        skipped = []
+        seen = set()
+        for t in tasks:
+            norm = normalize_keyword(t['keyword'])
+            if norm in existing or norm in seen:
+                skipped.append(t)
+            else:
+                seen.add(norm)
+                queue.append(t)
+
+        pos = 0
+        for slot in slots:
+            if slot.index < start_index or pos >= len(queue):
+                continue
+            take = max(0, slot.free)
+            slot.assigned = queue[pos:pos + take]
+            pos += len(slot.assigned)
+
+        # 남은 작업은 신규 그룹(_N)으로 - 필요한 개수만큼 미리 계산
+        next_index = max([s.index for s in slots] + [start_index - 1]) + 1
+        while pos < len(queue):
+            slot = GroupSlot(None, f"{self.base_name}_{next_index}", next_index, 0)
+            slot.assigned = queue[pos:pos + GROUP_LIMIT]
+            pos += len(slot.assigned)
+            slots.append(slot)
+            next_index += 1
+
+        return PlacementPlan(slots, skipped)
+
+    # ---------------------------------------------------------------------
+    # 3. 실행
+    # ---------------------------------------------------------------------
+    def execute(self, plan, log, on_group_created=None, on_progress=None, should_stop=None):
+        """
+        log(tasks, status, msg) / on_group_created(adgroup_id) / on_progress(done_count) / should_stop() -> bool
+        """
+        result = PlacementResult()
+        stopped = should_stop or (lambda: False)
+
+        # 신규 그룹 생성 (이름 순서가 중요하므로 순차)
+        for slot in plan.new_groups:
+            if stopped():
+                result.leftover.extend(slot.assigned)
+                slot.assigned = []
+                continue
+            gid = self._create_group(slot, log)
+            if gid is None:
+                result.leftover.extend(slot.assigned)
+                slot.assigned = []
+                continue
+            slot.adgroup_id = gid
+            if self.journal:
+                self.journal.group_created(slot.name, gid)
+            if on_group_created:
+                on_group_created(gid)
+
+        # 100개 배치 병렬 전송
+        batches = plan.batches()
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="kwd-post") as executor:
+            futures = {}
+            for slot, chunk in batches:
+                bid = None
+                if self.journal:
+                    bid = self.journal.next_batch_id()
+                    self.journal.planned(bid, slot.adgroup_id, slot.name, [t['row'] for t in chunk])
+                futures[executor.submit(self._post_batch, slot.adgroup_id, chunk, stopped, bid)] = (slot, chunk, bid)
+
+            for future in as_completed(futures):
+                slot, chunk, bid = futures[future]
+                res = future.result()
+                if res is None:
+                    # 중단 요청으로 전송하지 않은 배치 (저널상 planned 로 남아 재개 대상)
+                    result.leftover.extend(chunk)
+                    continue
+                if isinstance(res, list):
+                    created = {normalize_keyword(item.get('keyword', '')) for item in res}
+                    ok = [t for t in chunk if normalize_keyword(t['keyword']) in created]
+                    bad = [t for t in chunk if normalize_keyword(t['keyword']) not in created]
+                    log(ok, "성공", f"{slot.name} 등록함")
+                    if bad:
+                        log(bad, "실패", "키워드 등록 실패 (검증 미통과)")
+                    result.success += len(ok)
+                    result.failed += len(bad)
+                    if self.journal:
+                        self.journal.confirmed(bid, [t['row'] for t in ok], [t['row'] for t in bad],
+                                               msg=f"{slot.name} 등록함", err="검증 미통과")
+                else:
+                    code = res.get('code') if isinstance(res, dict) else None
+                    data = res.get('data') if isinstance(res, dict) else None
+                    msg = data.get('message', '알 수 없음') if isinstance(data, dict) else str(data)
+                    if str(code) in TRANSIENT_CODES:
+                        # 일시 오류는 다음 라운드에서 다시 계획
+                        log(chunk, "대기", f"Err {code}: 재시도 예정")
+                        result.leftover.extend(chunk)
+                        if self.journal:
+                            self.journal.released(bid)
+                    else:
+                        log(chunk, "실패", f"Err {code}: {msg}")
+                        result.failed += len(chunk)
+                        if self.journal:
+                            self.journal.confirmed(bid, [], [t['row'] for t in chunk], err=f"Err {code}: {msg}")
+                done += len(chunk)
+                if on_progress:
+                    on_progress(done)
+
+        return result
+
+    def _post_batch(self, adgroup_id, chunk, stopped, batch_id=None, retries=3):
+        if stopped():
+            return None
+        if self.journal:
+            self.journal.sent(batch_id)
+        keywords = [t['keyword'] for t in chunk]
+        res = None
+        for _ in range(retries):
+            res = api.create_keywords_chunk(adgroup_id, keywords)
+            # 1014 는 공용 버킷이 이미 늦춰 두었으므로 바로 재시도
+            if isinstance(res, dict) and str(res.get('code')) == '1014':
+                continue
+            break
+        return res
+
+    def _create_group(self, slot, log):
+        tpl = self.template
+        for _ in range(5):
+            res = api.create_adgroup(
+                self.campaign_id, slot.name,
+                tpl.get('pcChannelId'), tpl.get('mobileChannelId'),
+                tpl.get('adgroupType', 'WEB_SITE')
+            )
+            if isinstance(res, dict) and 'nccAdgroupId' in res:
+                log(slot.assigned, "생성", f"새 그룹({slot.name}) 생성")
+                keyword_index.sync_group(res['nccAdgroupId'], self.campaign_id, slot.name)
+                account_tree.invalidate()  # 공용 계정 트리에 새 그룹 반영 (다음 조회 시)
+                return res['nccAdgroupId']
+
+            code = str(res.get('code')) if isinstance(res, dict) else None
+            if code == '1014':
+                log(slot.assigned, "대기", "API 1014... 5초 대기")
+                time.sleep(5.0)
+                continue
+            # 3710(이름 중복) 등: 재계획 시 스냅샷에 다시 잡히도록 남김
+            log(slot.assigned, "확장오류", f"{slot.name} 생성실패 {code}")
+            return None
+        return None
+
+    def run(self, tasks, log, start_index=0, on_group_created=None, on_progress=None, should_stop=None):
+        """계획 -> 실행, 남은 작업은 스냅샷부터 다시 (최대 MAX_ROUNDS)"""
+        total = PlacementResult()
+        pending = tasks
+        for _ in range(self.MAX_ROUNDS):
+            if not pending or (should_stop and should_stop()):
+                break
+            plan = self.plan(pending, start_index)
+            if plan.skipped:
+                log(plan.skipped, "스킵", "이미 등록됨")
+                total.success += len(plan.skipped)
+                if self.journal:
+                    self.journal.skipped([t['row'] for t in plan.skipped])
+            existing_slots = [sl for sl in plan.slots if sl.assigned and not sl.is_new]
+            log([t for sl in plan.slots for t in sl.assigned], "계획",
+                f"기존 그룹 {len(existing_slots)}개 + 신규 그룹 {len(plan.new_groups)}개에 배치")
+            res = self.execute(plan, log, on_group_created, on_progress, should_stop)
+            total.success += res.success
+            total.failed += res.failed
+            pending = res.leftover
+        total.leftover = pending
+        return total
@@ -0,0 +1,135 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+from logic.keyword_index import keyword_index
+from logic.stats_store import stats_store
+
+# -------------------------------------------------------------------------
+# [키워드 성과 분석] 광고그룹 -> 키워드 드릴다운
+# - 키워드 목록은 로컬 키워드 인덱스 (오래된 그룹만 다시 동기화)
+# - 통계는 통계 저장소에 키워드 레벨로 적재 (없는 날짜만 API 조회)
+# - 정렬/필터/Top-N 은 메모리의 열 배열(numpy)로만 처리 -> 10만 키워드도 즉시 반응
+# -------------------------------------------------------------------------
+SYNC_WORKERS = 4
+
+SORT_KEYS = (
+    ("cost", "비용 높은 순"),
+    ("clk", "클릭 많은 순"),
+    ("cpa", "CPA 높은 순"),
+    ("rank_dev", "순위 편차 큰 순"),
+    ("imp", "노출 많은 순"),
+)
+
+
+def load_keyword_stats(groups, since, until, progress=None, should_stop=None):
+    """
+    groups: [(adgroup_id, 그룹명, campaign_id), ...] 의 키워드 기간 성과 -> KeywordStats
+    progress(문구): 단계별 진행 상황 / should_stop(): True 면 중단 (None 반환)
+    """
+    names = {gid: name for gid, name, _ in groups}
+
+    # 1. 키워드 인덱스가 오래된 그룹만 동시에 다시 동기화
+    synced = keyword_index.synced_times(list(names))
+    now = time.time()
+    stale = [g for g in groups if now - synced.get(g[0], 0) > keyword_index.MAX_AGE]
+    if stale:
+        with ThreadPoolExecutor(max_workers=SYNC_WORKERS, thread_name_prefix="kw-stats") as executor:
+            futures = [executor.submit(keyword_index.sync_group, gid, cid, name) for gid, name, cid in stale]
+            for done, _ in enumerate(as_completed(futures), 1):
+                if progress:
+                    progress(f"키워드 목록 동기화 중... ({done}/{len(stale)})")
+                if should_stop and should_stop():
+                    for f in futures:
+                        f.cancel()
+                    return None
+
+    # 2. 키워드 일별 통계 적재 (그룹 단위로 이미 받은 날짜는 건너뜀)
+    entities = keyword_index.group_keywords(list(names))
+    if should_stop and should_stop():
+        return None
+
+    def on_chunk(done, total, _chunk):
+        if progress:
+            progress(f"키워드 통계 조회 중... ({done}/{total})")
+
+    stats_store.backfill("keyword", entities, since, until, progress=on_chunk)
+
+    # 3. 기간 합계 (현재 인덱스에 있는 키워드만)
+    frame = stats_store.frame([kid for kid, _, _ in entities], since, until)
+    return KeywordStats(frame, names)
+
+
+class KeywordStats:
+    """
+    키워드 기간 성과 열 배열 + 파생 지표
+    - rank_dev: 소속 그룹 평균 순위(노출 가중) 대비 편차, 클수록 그룹 평균보다 아래 노출
+    - select(): 필터 후 정렬 기준 상위 N개 인덱스
+    """
+
+    def __init__(self, frame, group_names):
+        self.frame = frame
+        self.metrics = frame.metrics()
+        self.groups = [group_names.get(p, "") for p in frame.parents]
+        self._text = np.array([(n or "").lower() for n in frame.names], dtype=str) if len(frame) else np.array([], dtype=str)
+        self.rank_dev = self._rank_deviation()
+
+    def __len__(self):
+        return len(self.frame)
+
+    def _rank_deviation(self):
+        f = self.frame
+        if not len(f):
+            return np.zeros(0)
+        _, codes = np.unique(np.array([p or "" for p in f.parents], dtype=str), return_inverse=True)
+        w_rnk = np.bincount(codes, weights=f.rnk * f.imp)
+        w_imp = np.bincount(codes, weights=f.imp)
+        group_rnk = np.divide(w_rnk, w_imp, out=np.zeros_like(w_rnk), where=w_imp > 0)[codes]
+        return np.where(f.imp > 0, f.rnk - group_rnk, 0.0)
+
+    def column(self, key):
+        if key in self.metrics:
+            return self.metrics[key]
+        if key == "rank_dev":
+            return self.rank_dev
+        return getattr(self.frame, key)
+
+    def select(self, sort_by="cost", top_n=100, wasted_only=False, min_cost=0, text=""):
+        """
+        조건에 맞는 키워드 인덱스 배열 (정렬 기준 내림차순, top_n=None 이면 전체)
+        - wasted_only: 비용은 나갔는데 전환 0 인 키워드만
+        - text: 키워드 부분 일치 (대소문자 무시)
+        CPA 정렬은 전환이 있는 키워드끼리 비교하고 전환 0 은 뒤로
+        """
+        f = self.frame
+        mask = f.cost >= min_cost
+        if wasted_only:
+            mask &= (f.cost > 0) & (f.conv == 0)
+        if text:
+            mask &= np.char.find(self._text, text.lower()) >= 0
+
+        idx = np.flatnonzero(mask)
+        key = self.column(sort_by)[idx]
+        if sort_by == "cpa":
+            key = np.where(f.conv[idx] > 0, key, -1.0)
+
+        if top_n and top_n < len(idx):
+            part = np.argpartition(-key, top_n - 1)[:top_n]
+            idx, key = idx[part], key[part]
+        return idx[np.argsort(-key, kind="stable")]
+
+    def rows(self, idx):
+        """표시용 행 dict 리스트"""
+        f, m = self.frame, self.metrics
+        return [{
+            'id': f.ids[i], 'keyword': f.names[i], 'group': self.groups[i],
+            'imp': int(f.imp[i]), 'clk': int(f.clk[i]), 'cost': float(f.cost[i]), 'conv': int(f.conv[i]),
+            'ctr': float(m['ctr'][i]), 'cpc': float(m['cpc'][i]), 'cpa': float(m['cpa'][i]),
+            'rnk': float(f.rnk[i]), 'rank_dev': float(self.rank_dev[i]),
+        } for i in idx.tolist()]
+
+    def summary(self, idx):
+        """선택 범위 합계 (비용/전환)"""
+        f = self.frame
+        return float(f.cost[idx].sum()), int(f.conv[idx].sum())
@@ -0,0 +1,282 @@
+import os
+import json
+import time
+import threading
+from datetime import datetime
+
+# -------------------------------------------------------------------------
+# [등록 작업 저널] 대량 키워드 등록을 재개 가능한 작업으로 기록 (JSONL, 한 줄 = 이벤트 1개)
+# - job       : 작업 생성 (전체 작업 목록 1회 기록)
+# - planned   : 배치 계획 (그룹 + 작업 row 목록)
+# - sent      : 배치 전송 시작 (응답 전 중단되면 '확인 필요' 상태)
+# - confirmed : 배치 결과 (성공 row / 실패 row)
+# - skipped   : 이미 등록되어 건너뛴 row
+# - released  : 일시 오류로 결과 없이 끝난 배치 (row 는 재계획 대상)
+# - reconciled: 재개 시 확인 필요 배치를 그룹 재조회로 판정한 결과
+# - finished  : 작업 종료 (done / stopped)
+# 앱이 죽어도 마지막 줄까지는 남으므로, 재개 시 남은 row 만 다시 계획한다.
+# index.json: 작업별 요약 (생성/재개/종료 때 갱신) -> 목록 조회 시 저널 전체를 다시 읽지 않음
+# 정상 완료(done)된 작업은 저널과 요약을 삭제한다.
+# -------------------------------------------------------------------------
+class RegisterJob:
+    JOB_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'register_jobs'))
+    INDEX_FILE = "index.json"
+    _index_lock = threading.Lock()
+
+    def __init__(self, job_id, path):
+        self.job_id = job_id
+        self.path = path
+        self._lock = threading.Lock()
+        self._batch_seq = 0
+
+        self.created = None
+        self.updated = None
+        self.state = "running"
+        self.tasks = {}       # row -> task dict
+        self.row_status = {}  # row -> (상태, 메시지)
+        self.done_rows = set()
+        self.failed_rows = set()
+        self.batches = {}     # batch_id -> {'adgroup_id', 'group_name', 'rows', 'sent', 'closed'}
+
+    # ---------------------------------------------------------------------
+    # 생성 / 불러오기 / 목록
+    # ---------------------------------------------------------------------
+    @classmethod
+    def create(cls, tasks):
+        os.makedirs(cls.JOB_DIR, exist_ok=True)
+        job_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        job = cls(job_id, os.path.join(cls.JOB_DIR, f"job_{job_id}.jsonl"))
+        job.created = datetime.now().isoformat()
+        for t in tasks:
+            job.tasks[t['row']] = t
+        job._write({
+            "ev": "job", "job_id": job_id, "created": job.created,
+            "tasks": [{k: t[k] for k in ('row', 'keyword', 'group_id', 'group_name') if k in t} for t in tasks]
+        })
+        cls._update_index(job.job_id, job.summary())
+        return job
+
+    @classmethod
+    def load(cls, job_id):
+        """저널을 다시 읽어 상태 복원 (읽기 전용 - 줄바꿈 보정은 재개할 때)"""
+        path = os.path.join(cls.JOB_DIR, f"job_{job_id}.jsonl")
+        if not os.path.exists(path):
+            return None
+        job = cls(job_id, path)
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    job._apply(json.loads(line))
+                except json.JSONDecodeError:
+                    # 비정상 종료로 잘린 마지막 줄은 무시
+                    continue
+        return job
+
+    @classmethod
+    def _read_index(cls):
+        try:
+            with open(os.path.join(cls.JOB_DIR, cls.INDEX_FILE), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _update_index(cls, job_id, summary):
+        """작업 요약 갱신 (summary=None 이면 삭제)"""
+        with cls._index_lock:
+            index = cls._read_index()
+            if summary is None:
+                index.pop(job_id, None)
+            else:
+                index[job_id] = summary
+            cls._save_index(index)
+
+    @classmethod
+    def _save_index(cls, index):
+        try:
+            os.makedirs(cls.JOB_DIR, exist_ok=True)
+            path = os.path.join(cls.JOB_DIR, cls.INDEX_FILE)
+            with open(path + ".part", 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False)
+            os.replace(path + ".part", path)
+        except OSError as e:
+            print(f"[JOURNAL] 작업 목록 저장 실패: {e}")
+
+    @classmethod
+    def list_jobs(cls):
+        """저장된 작업 요약 목록 (최신순) - 요약 파일만 읽음"""
+        if not os.path.isdir(cls.JOB_DIR):
+            return []
+        with cls._index_lock:
+            index = cls._read_index()
+            # 요약에 없는 저널(이전 버전에서 만든 작업)만 한 번 읽어서 등록
+            names = {name[4:-6] for name in os.listdir(cls.JOB_DIR) if name.startswith("job_") and name.endswith(".jsonl")}
+            missing = names - set(index)
+            for job_id in missing:
+                job = cls.load(job_id)
+                if job:
+                    index[job_id] = job.summary()
+            gone = set(index) - names
+            for job_id in gone:
+                index.pop(job_id)
+            if missing or gone:
+                cls._save_index(index)
+        return [index[j] for j in sorted(index, reverse=True)]
+
+    @classmethod
+    def has_unfinished(cls):
+        return any(s['state'] != "done" and s['pending'] + s['in_doubt'] > 0 for s in cls.list_jobs())
+
+    @classmethod
+    def latest_unfinished(cls):
+        for s in cls.list_jobs():
+            if s['state'] != "done" and s['pending'] + s['in_doubt'] > 0:
+                return cls.load(s['job_id'])
+        return None
+
+    # ---------------------------------------------------------------------
+    # 기록
+    # ---------------------------------------------------------------------
+    def _write(self, record):
+        record.setdefault("ts", time.time())
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._apply(record)
+
+    def _apply(self, rec):
+        ev = rec.get("ev")
+        ts = rec.get("ts")
+        if ts:
+            self.updated = datetime.fromtimestamp(ts).isoformat()
+
+        if ev == "job":
+            self.created = rec.get("created")
+            for t in rec.get("tasks", []):
+                self.tasks[t['row']] = t
+        elif ev == "planned":
+            self.batches[rec['batch']] = {
+                'adgroup_id': rec['adgroup_id'], 'group_name': rec.get('group_name', ''),
+                'rows': rec['rows'], 'sent': False, 'closed': False
+            }
+            self._batch_seq = max(self._batch_seq, int(str(rec['batch']).split('-')[-1]) + 1)
+        elif ev == "sent":
+            if rec['batch'] in self.batches:
+                self.batches[rec['batch']]['sent'] = True
+        elif ev in ("confirmed", "reconciled"):
+            b = self.batches.get(rec['batch'])
+            if b:
+                b['closed'] = True
+            for r in rec.get('ok', []):
+                self.done_rows.add(r)
+                self.failed_rows.discard(r)
+                self.row_status[r] = ("성공", rec.get('msg', ''))
+            for r in rec.get('failed', []):
+                self.failed_rows.add(r)
+                self.row_status[r] = ("실패", rec.get('err', ''))
+            for r in rec.get('retry', []):
+                self.row_status.pop(r, None)
+        elif ev == "released":
+            b = self.batches.get(rec['batch'])
+            if b:
+                b['closed'] = True
+        elif ev == "skipped":
+            for r in rec.get('rows', []):
+                self.done_rows.add(r)
+                self.row_status[r] = ("스킵", "이미 등록됨")
+        elif ev == "finished":
+            self.state = rec.get("state", "done")
+        elif ev == "resumed":
+            self.state = "running"
+
+    def next_batch_id(self):
+        with self._lock:
+            bid = f"{self.job_id}-{self._batch_seq}"
+            self._batch_seq += 1
+            return bid
+
+    def planned(self, batch_id, adgroup_id, group_name, rows):
+        self._write({"ev": "planned", "batch": batch_id, "adgroup_id": adgroup_id, "group_name": group_name, "rows": rows})
+
+    def sent(self, batch_id):
+        self._write({"ev": "sent", "batch": batch_id})
+
+    def confirmed(self, batch_id, ok_rows, failed_rows, msg="", err=""):
+        self._write({"ev": "confirmed", "batch": batch_id, "ok": ok_rows, "failed": failed_rows, "msg": msg, "err": err})
+
+    def released(self, batch_id):
+        """일시 오류(1014/통신)로 결과 없이 끝난 배치 - 해당 row 는 다시 계획 대상"""
+        self._write({"ev": "released", "batch": batch_id})
+
+    def reconciled(self, batch_id, ok_rows, retry_rows):
+        self._write({"ev": "reconciled", "batch": batch_id, "ok": ok_rows, "retry": retry_rows, "msg": "재개 시 확인됨"})
+
+    def skipped(self, rows):
+        if rows:
+            self._write({"ev": "skipped", "rows": rows})
+
+    def group_created(self, name, adgroup_id):
+        self._write({"ev": "group", "name": name, "adgroup_id": adgroup_id})
+
+    def resumed(self):
+        self._repair_tail()
+        self._write({"ev": "resumed"})
+        self._update_index(self.job_id, self.summary())
+
+    def _repair_tail(self):
+        """비정상 종료로 잘린 줄 뒤에 이어 쓰지 않도록 줄바꿈 보정"""
+        with self._lock:
+            with open(self.path, 'rb+') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+
+    def finish(self, state="done"):
+        self._write({"ev": "finished", "state": state})
+        if state == "done":
+            # 끝난 작업은 재개할 일이 없으므로 저널 삭제
+            try:
+                os.remove(self.path)
+            except OSError as e:
+                print(f"[JOURNAL] 작업 파일 삭제 실패: {e}")
+            self._update_index(self.job_id, None)
+        else:
+            self._update_index(self.job_id, self.summary())
+
+    # ---------------------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------------------
+    def in_doubt_batches(self):
+        """전송은 했지만 결과를 기록하지 못한 배치 (재개 시 그룹 재조회로 판정)"""
+        return {bid: b for bid, b in self.batches.items() if b['sent'] and not b['closed']}
+
+    def remaining_tasks(self):
+        """성공/스킵/실패로 끝나지 않았고 확인 필요 배치에도 속하지 않은 작업"""
+        doubt = {r for b in self.in_doubt_batches().values() for r in b['rows']}
+        finished = self.done_rows | self.failed_rows | doubt
+        return [t for r, t in sorted(self.tasks.items()) if r not in finished]
+
+    def summary(self):
+        doubt = {r for b in self.in_doubt_batches().values() for r in b['rows']}
+        total = len(self.tasks)
+        done = len(self.done_rows)
+        failed = len(self.failed_rows - self.done_rows)
+        return {
+            "job_id": self.job_id,
+            "state": self.state,
+            "created": self.created,
+            "updated": self.updated,
+            "total": total,
+            "done": done,
+            "failed": failed,
+            "in_doubt": len(doubt - self.done_rows),
+            "pending": max(0, total - done - failed - len(doubt - self.done_rows)),
+        }
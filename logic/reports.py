@@ -0,0 +1,472 @@
+import os
+import csv
+import sys
+import json
+import sqlite3
+import argparse
+import pathlib
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+from logic.stats_store import stats_store
+from logic.keyword_index import keyword_index
+from logic.bid_history import bid_history
+
+# 선택 의존성 - 없으면 해당 형식만 비활성화
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# -------------------------------------------------------------------------
+# [리포트 엔진] 로컬 캐시를 파일로 내보내기 (API 재조회 없음)
+# - 원본(SOURCES): 통계 저장소(캠페인/그룹/키워드 성과, 일별), 키워드 인덱스(인벤토리), 입찰 이력
+#   SQLite 는 읽기 전용 연결 + fetchmany 로 CHUNK_ROWS 씩 흘려보냄
+# - 출력(WRITERS): CSV(기본) / XLSX(openpyxl write_only) / Parquet(pyarrow, 청크 = row group)
+#   -> 10만 키워드 리포트도 메모리는 청크 1개 분량만 사용
+# - 예약 리포트: report_schedule.json 에 정의, run-scheduled 로 기한이 된 것만 생성
+# - CLI: python -m logic.reports --help (GUI 없이 실행 가능)
+# -------------------------------------------------------------------------
+CHUNK_ROWS = 5000
+BASE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+REPORT_DIR = os.path.join(BASE_DIR, 'reports')
+
+Column = namedtuple('Column', 'name label type')  # type: str / int / float
+Source = namedtuple('Source', 'title columns rows')  # rows(since, until, customer_id) -> 청크 이터레이터
+
+
+# ---------------------------------------------------------------------
+# 기간 프리셋
+# ---------------------------------------------------------------------
+PRESETS = ("yesterday", "last_7_days", "last_30_days", "this_week", "last_week", "this_month", "last_month")
+
+
+def preset_range(name, today=None):
+    """프리셋 이름 -> (since, until) YYYY-MM-DD"""
+    today = today or date.today()
+    if name == "yesterday":
+        since = until = today - timedelta(days=1)
+    elif name == "last_7_days":
+        since, until = today - timedelta(days=7), today - timedelta(days=1)
+    elif name == "last_30_days":
+        since, until = today - timedelta(days=30), today - timedelta(days=1)
+    elif name == "this_week":
+        since, until = today - timedelta(days=today.weekday()), today
+    elif name == "last_week":
+        until = today - timedelta(days=today.weekday() + 1)
+        since = until - timedelta(days=6)
+    elif name == "this_month":
+        since, until = today.replace(day=1), today
+    elif name == "last_month":
+        until = today.replace(day=1) - timedelta(days=1)
+        since = until.replace(day=1)
+    else:
+        raise ValueError(f"알 수 없는 기간: {name}")
+    return since.isoformat(), until.isoformat()
+
+
+# ---------------------------------------------------------------------
+# 원본
+# ---------------------------------------------------------------------
+def _stream(db_file, sql, args):
+    """읽기 전용 연결로 쿼리 결과를 CHUNK_ROWS 씩 (앱이 쓰는 중이어도 WAL 이라 막히지 않음)"""
+    conn = sqlite3.connect(pathlib.Path(db_file).resolve().as_uri() + "?mode=ro", uri=True)
+    try:
+        cur = conn.execute(sql, args)
+        while True:
+            rows = cur.fetchmany(CHUNK_ROWS)
+            if not rows:
+                break
+            yield rows
+    finally:
+        conn.close()
+
+
+def _customer_filter(alias, customer_id):
+    if customer_id:
+        return f" AND {alias}.customer_id=?", [customer_id]
+    return "", []
+
+
+def _div(num, den, scale=1.0):
+    return num * scale / den if den else 0.0
+
+
+PERFORMANCE_COLUMNS = [
+    Column("entity_id", "ID", "str"), Column("name", "이름", "str"),
+    Column("parent_id", "상위 ID", "str"), Column("parent_name", "상위 이름", "str"),
+    Column("imp", "노출수", "int"), Column("clk", "클릭수", "int"),
+    Column("cost", "비용", "float"), Column("conv", "전환수", "int"),
+    Column("ctr", "CTR(%)", "float"), Column("cpc", "CPC", "float"),
+    Column("cvr", "CVR(%)", "float"), Column("cpa", "CPA", "float"),
+    Column("avg_rank", "평균순위", "float"),
+]
+
+
+def _performance_rows(level):
+    def rows(since, until, customer_id=None):
+        where, args = _customer_filter("d", customer_id)
+        sql = f"""
+            SELECT d.entity_id, e.name, d.parent_id, p.name,
+                   SUM(d.imp), SUM(d.clk), SUM(d.cost), SUM(d.conv), SUM(d.rnk_imp)
+            FROM daily_stats d
+            LEFT JOIN entities e ON e.customer_id=d.customer_id AND e.entity_id=d.entity_id
+            LEFT JOIN entities p ON p.customer_id=d.customer_id AND p.entity_id=d.parent_id
+            WHERE d.level=? AND d.day BETWEEN ? AND ?{where}
+            GROUP BY d.customer_id, d.entity_id
+            ORDER BY SUM(d.cost) DESC
+        """
+        for chunk in _stream(stats_store.db_file, sql, [level, since, until, *args]):
+            yield [
+                (eid, name or eid, pid, pname, imp, clk, cost, conv,
+                 _div(clk, imp, 100.0), _div(cost, clk), _div(conv, clk, 100.0), _div(cost, conv), _div(rnk_imp, imp))
+                for eid, name, pid, pname, imp, clk, cost, conv, rnk_imp in chunk
+            ]
+    return rows
+
+
+DAILY_COLUMNS = [
+    Column("level", "레벨", "str"), Column("entity_id", "ID", "str"), Column("name", "이름", "str"),
+    Column("day", "날짜", "str"), Column("imp", "노출수", "int"), Column("clk", "클릭수", "int"),
+    Column("cost", "비용", "float"), Column("conv", "전환수", "int"), Column("avg_rank", "평균순위", "float"),
+]
+
+
+def _daily_rows(since, until, customer_id=None):
+    where, args = _customer_filter("d", customer_id)
+    sql = f"""
+        SELECT d.level, d.entity_id, e.name, d.day, d.imp, d.clk, d.cost, d.conv, d.rnk_imp
+        FROM daily_stats d
+        LEFT JOIN entities e ON e.customer_id=d.customer_id AND e.entity_id=d.entity_id
+        WHERE d.level IN ('campaign', 'adgroup') AND d.day BETWEEN ? AND ?{where}
+        ORDER BY d.level, d.entity_id, d.day
+    """
+    for chunk in _stream(stats_store.db_file, sql, [since, until, *args]):
+        yield [(lv, eid, name or eid, day, imp, clk, cost, conv, _div(rnk_imp, imp))
+               for lv, eid, name, day, imp, clk, cost, conv, rnk_imp in chunk]
+
+
+INVENTORY_COLUMNS = [
+    Column("keyword_id", "키워드 ID", "str"), Column("keyword", "키워드", "str"),
+    Column("adgroup_id", "광고그룹 ID", "str"), Column("group_name", "광고그룹", "str"),
+    Column("campaign_id", "캠페인 ID", "str"),
+]
+
+
+def _inventory_rows(since=None, until=None, customer_id=None):
+    """기간과 무관 - 현재 인덱스 전체"""
+    where, args = _customer_filter("i", customer_id)
+    sql = f"""
+        SELECT i.keyword_id, i.keyword, i.adgroup_id, g.name, g.campaign_id
+        FROM kw_index i
+        LEFT JOIN kw_groups g ON g.customer_id=i.customer_id AND g.adgroup_id=i.adgroup_id
+        WHERE 1=1{where}
+        ORDER BY g.campaign_id, i.adgroup_id
+    """
+    yield from _stream(keyword_index.db_file, sql, args)
+
+
+BID_COLUMNS = [
+    Column("ts", "시각", "str"), Column("adgroup_id", "광고그룹 ID", "str"), Column("group_name", "광고그룹", "str"),
+    Column("keyword_id", "키워드 ID", "str"), Column("keyword", "키워드", "str"),
+    Column("old_bid", "기존 입찰가", "int"), Column("new_bid", "변경 입찰가", "int"),
+    Column("rank", "순위", "float"), Column("reason", "사유", "str"),
+]
+
+
+def _bid_rows(since, until, customer_id=None):
+    """입찰 이력 파일은 계정 구분이 없어 customer_id 는 무시"""
+    keys = [c.name for c in BID_COLUMNS]
+    chunk = []
+    for ev in bid_history.iter_events(since, until):
+        chunk.append(tuple(ev.get(k) for k in keys))
+        if len(chunk) >= CHUNK_ROWS:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+SOURCES = {
+    "campaign_performance": Source("캠페인 성과", PERFORMANCE_COLUMNS, _performance_rows("campaign")),
+    "adgroup_performance": Source("광고그룹 성과", PERFORMANCE_COLUMNS, _performance_rows("adgroup")),
+    "keyword_performance": Source("키워드 성과", PERFORMANCE_COLUMNS, _performance_rows("keyword")),
+    "daily_stats": Source("캠페인/그룹 일별 성과", DAILY_COLUMNS, _daily_rows),
+    "keyword_inventory": Source("키워드 목록", INVENTORY_COLUMNS, _inventory_rows),
+    "bid_history": Source("입찰 변경 이력", BID_COLUMNS, _bid_rows),
+}
+
+
+# ---------------------------------------------------------------------
+# 출력 형식
+# ---------------------------------------------------------------------
+class CsvWriter:
+    ext = "csv"
+    requires = None
+
+    def __init__(self, path, columns):
+        # utf-8-sig: 엑셀에서 바로 열어도 한글이 깨지지 않음
+        self._f = open(path, 'w', encoding='utf-8-sig', newline='')
+        self._w = csv.writer(self._f)
+        self._w.writerow([c.label for c in columns])
+
+    def write(self, rows):
+        self._w.writerows(rows)
+
+    def close(self):
+        self._f.close()
+
+
+class XlsxWriter:
+    ext = "xlsx"
+    requires = "openpyxl"
+    MAX_ROWS = 1048575  # 시트당 행 제한 (헤더 제외)
+
+    def __init__(self, path, columns):
+        self.path = path
+        self.header = [c.label for c in columns]
+        self._wb = openpyxl.Workbook(write_only=True)
+        self._sheet = None
+        self._rows = 0
+        self._new_sheet()
+
+    def _new_sheet(self):
+        self._sheet = self._wb.create_sheet(f"Sheet{len(self._wb.worksheets) + 1}")
+        self._sheet.append(self.header)
+        self._rows = 0
+
+    def write(self, rows):
+        for row in rows:
+            if self._rows >= self.MAX_ROWS:
+                self._new_sheet()
+            self._sheet.append(row)
+            self._rows += 1
+
+    def close(self):
+        self._wb.save(self.path)
+
+
+class ParquetWriter:
+    ext = "parquet"
+    requires = "pyarrow"
+    TYPES = {"str": "string", "int": "int64", "float": "float64"}
+
+    def __init__(self, path, columns):
+        self.columns = columns
+        self.schema = pyarrow.schema([(c.name, getattr(pyarrow, self.TYPES[c.type])()) for c in columns])
+        self._w = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def write(self, rows):
+        arrays = [pyarrow.array([r[i] for r in rows], type=field.type) for i, field in enumerate(self.schema)]
+        self._w.write_table(pyarrow.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self._w.close()
+
+
+WRITERS = {w.ext: w for w in (CsvWriter, XlsxWriter, ParquetWriter)}
+_MODULES = {"openpyxl": openpyxl, "pyarrow": pyarrow}
+
+
+def available_formats():
+    return [ext for ext, w in WRITERS.items() if w.requires is None or _MODULES[w.requires] is not None]
+
+
+def default_path(name, fmt, since, until):
+    stamp = f"{since}_{until}" if since else datetime.now().strftime("%Y-%m-%d")
+    return os.path.join(REPORT_DIR, f"{name}_{stamp}.{fmt}")
+
+
+def export(source, fmt="csv", since=None, until=None, path=None, customer_id=None, progress=None):
+    """
+    원본 -> 파일 (청크 단위 기록, 완료 후 이름 변경이라 중간에 실패해도 반쪽 파일이 남지 않음)
+    progress(누적 행 수): 청크마다 호출
+    반환: (저장 경로, 행 수)
+    """
+    src = SOURCES.get(source)
+    if src is None:
+        raise ValueError(f"알 수 없는 리포트: {source}")
+    writer_cls = WRITERS.get(fmt)
+    if writer_cls is None:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    if fmt not in available_formats():
+        raise RuntimeError(f"{fmt} 형식은 {writer_cls.requires} 설치가 필요합니다 (pip install {writer_cls.requires})")
+    if not since or not until:
+        since, until = preset_range("yesterday")
+
+    path = path or default_path(source, fmt, since, until)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".part"
+    count = 0
+    done = False
+    writer = writer_cls(tmp, src.columns)
+    try:
+        for rows in src.rows(since, until, customer_id):
+            writer.write(rows)
+            count += len(rows)
+            if progress:
+                progress(count)
+        done = True
+    finally:
+        writer.close()
+        if not done and os.path.exists(tmp):
+            os.remove(tmp)
+    os.replace(tmp, path)
+    print(f"[REPORT] {src.title} {count}행 -> {path}")
+    return path, count
+
+
+# ---------------------------------------------------------------------
+# 예약 리포트
+# ---------------------------------------------------------------------
+class ReportSchedule:
+    """
+    {이름: {'source', 'format', 'range'(프리셋), 'every'(daily/weekly/monthly), 'customer_id', 'last_run'}}
+    run_due() 를 작업 스케줄러(cron, Windows 작업 스케줄러)에서 주기적으로 호출하면 기한이 된 것만 생성
+    """
+    SCHEDULE_FILE = os.path.join(BASE_DIR, 'report_schedule.json')
+    EVERY = ("daily", "weekly", "monthly")
+
+    def __init__(self, path=None):
+        self.path = path or self.SCHEDULE_FILE
+        self.items = {}
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.items = json.load(f)
+        except Exception as e:
+            print(f"[REPORT] 예약 목록 로드 실패: {e}")
+
+    def save(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.items, f, ensure_ascii=False, indent=2)
+
+    def add(self, name, source, fmt="csv", range_preset="yesterday", every="daily", customer_id=None):
+        if source not in SOURCES:
+            raise ValueError(f"알 수 없는 리포트: {source}")
+        if fmt not in WRITERS:
+            raise ValueError(f"지원하지 않는 형식: {fmt}")
+        if range_preset not in PRESETS:
+            raise ValueError(f"알 수 없는 기간: {range_preset}")
+        if every not in self.EVERY:
+            raise ValueError(f"알 수 없는 주기: {every}")
+        self.items[name] = {
+            'source': source, 'format': fmt, 'range': range_preset, 'every': every,
+            'customer_id': customer_id, 'last_run': None,
+        }
+        self.save()
+
+    def remove(self, name):
+        if self.items.pop(name, None) is not None:
+            self.save()
+            return True
+        return False
+
+    def is_due(self, item, today=None):
+        today = today or date.today()
+        last = item.get('last_run')
+        if not last:
+            return True
+        last = date.fromisoformat(last)
+        if item['every'] == "daily":
+            return today > last
+        if item['every'] == "weekly":
+            return (today - last).days >= 7
+        return (today.year, today.month) != (last.year, last.month)
+
+    def run_due(self, today=None):
+        """기한이 된 예약 실행 -> [(이름, 경로 또는 None, 행 수 또는 오류 문구)]"""
+        today = today or date.today()
+        results = []
+        for name, item in self.items.items():
+            if not self.is_due(item, today):
+                continue
+            since, until = preset_range(item['range'], today)
+            try:
+                path, count = export(
+                    item['source'], item['format'], since, until,
+                    path=default_path(name, item['format'], since, until), customer_id=item.get('customer_id')
+                )
+                item['last_run'] = today.isoformat()
+                results.append((name, path, count))
+            except Exception as e:
+                print(f"[REPORT] 예약 리포트 '{name}' 실패: {e}")
+                results.append((name, None, str(e)))
+        self.save()
+        return results
+
+
+# ---------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m logic.reports", description="로컬 캐시 리포트 내보내기")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="리포트 종류 / 형식 / 예약 목록")
+
+    p = sub.add_parser("export", help="리포트 1회 생성")
+    p.add_argument("source", choices=list(SOURCES))
+    p.add_argument("--format", default="csv", choices=list(WRITERS))
+    p.add_argument("--range", choices=PRESETS, help="기간 프리셋 (--since/--until 대신)")
+    p.add_argument("--since")
+    p.add_argument("--until")
+    p.add_argument("--out", help="저장 경로 (기본: reports/)")
+    p.add_argument("--customer", help="광고주 ID (기본: 저장된 전체)")
+
+    p = sub.add_parser("schedule-add", help="예약 리포트 추가/변경")
+    p.add_argument("name")
+    p.add_argument("source", choices=list(SOURCES))
+    p.add_argument("--format", default="csv", choices=list(WRITERS))
+    p.add_argument("--range", default="yesterday", choices=PRESETS)
+    p.add_argument("--every", default="daily", choices=ReportSchedule.EVERY)
+    p.add_argument("--customer")
+
+    p = sub.add_parser("schedule-remove", help="예약 리포트 삭제")
+    p.add_argument("name")
+
+    sub.add_parser("run-scheduled", help="기한이 된 예약 리포트 생성")
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "list":
+            print("리포트:")
+            for key, src in SOURCES.items():
+                print(f"  {key:<22} {src.title}")
+            print(f"형식: {', '.join(available_formats())}")
+            schedule = ReportSchedule()
+            if schedule.items:
+                print("예약:")
+                for name, item in schedule.items.items():
+                    print(f"  {name}: {item['source']} / {item['format']} / {item['range']} / {item['every']} "
+                          f"(마지막 {item.get('last_run') or '-'})")
+        elif args.command == "export":
+            if args.range:
+                since, until = preset_range(args.range)
+            else:
+                since, until = args.since, args.until or args.since
+            export(args.source, args.format, since, until, path=args.out, customer_id=args.customer)
+        elif args.command == "schedule-add":
+            ReportSchedule().add(args.name, args.source, args.format, args.range, args.every, args.customer)
+            print(f"[REPORT] 예약 저장: {args.name}")
+        elif args.command == "schedule-remove":
+            if not ReportSchedule().remove(args.name):
+                print(f"[REPORT] 예약 없음: {args.name}")
+                return 1
+        elif args.command == "run-scheduled":
+            failed = [r for r in ReportSchedule().run_due() if r[1] is None]
+            return 1 if failed else 0
+    except (ValueError, RuntimeError) as e:
+        print(f"[REPORT] {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,457 @@
+import os
+import time
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from api.api_client import api
+
+# -------------------------------------------------------------------------
+# [통계 저장소] 캠페인 / 광고그룹 / 키워드 일별 성과를 로컬 SQLite 에 누적
+# - daily_stats: (엔티티, 날짜) 1행 - 노출/클릭/비용/전환/순위x노출
+# - coverage   : (소유자, 레벨, 날짜) 조회 완료 기록
+#   캠페인/그룹은 자기 자신, 키워드는 소속 그룹 단위로 기록 (통계 0 인 날은 행이 없음)
+# - rollup_weekly / rollup_monthly: 엔티티별 주(월요일 시작)/월 합계
+#   일별 행이 저장될 때 그 날짜가 속한 주/월만 다시 계산 (증분 갱신)
+# - backfill 은 기록이 없는 날짜만 API 로 조회, 집계가 끝나기 전(그 날짜 + RECENT_DAYS 이전)에
+#   조회한 날짜는 마지막 조회 후 RECENT_TTL 이 지났을 때 다시 조회
+# - 기간 합계는 꽉 찬 달 -> 월 롤업, 꽉 찬 주 -> 주 롤업, 나머지 -> 일별 행으로 나눠 합산
+# - 기간 합계/일별 추이/지표(CTR, CPC, CVR, CPA)는 로컬 데이터로 numpy 배열 연산
+# -------------------------------------------------------------------------
+LEVELS = ("campaign", "adgroup", "keyword")
+
+
+def day_range(since, until):
+    d = datetime.strptime(since, "%Y-%m-%d").date()
+    end = datetime.strptime(until, "%Y-%m-%d").date()
+    days = []
+    while d <= end:
+        days.append(d.isoformat())
+        d += timedelta(days=1)
+    return days
+
+
+def week_start(day):
+    d = datetime.strptime(day, "%Y-%m-%d").date()
+    return (d - timedelta(days=d.weekday())).isoformat()
+
+
+def month_start(day):
+    return day[:8] + "01"
+
+
+def month_end(day):
+    d = datetime.strptime(month_start(day), "%Y-%m-%d").date()
+    return ((d + timedelta(days=32)).replace(day=1) - timedelta(days=1)).isoformat()
+
+
+def previous_range(since, until):
+    """같은 길이의 바로 앞 기간 (이전 기간 비교용)"""
+    start = datetime.strptime(since, "%Y-%m-%d").date()
+    end = datetime.strptime(until, "%Y-%m-%d").date()
+    prev_until = start - timedelta(days=1)
+    return (prev_until - (end - start)).isoformat(), prev_until.isoformat()
+
+
+def rollup_segments(since, until):
+    """
+    since~until 을 겹치지 않게 분해 -> (일별 구간 [(시작, 끝)], 주 시작일 [...], 월 시작일 [...])
+    앞에서부터 보면서 꽉 찬 달은 월, 꽉 찬 주는 주, 나머지는 일별로
+    """
+    d = datetime.strptime(since, "%Y-%m-%d").date()
+    end = datetime.strptime(until, "%Y-%m-%d").date()
+    daily, weeks, months = [], [], []
+    run_start = None
+
+    def close_run(last):
+        if run_start is not None:
+            daily.append((run_start.isoformat(), last.isoformat()))
+
+    while d <= end:
+        if d.day == 1:
+            last = datetime.strptime(month_end(d.isoformat()), "%Y-%m-%d").date()
+            if last <= end:
+                close_run(d - timedelta(days=1))
+                run_start = None
+                months.append(d.isoformat())
+                d = last + timedelta(days=1)
+                continue
+        if d.weekday() == 0 and d + timedelta(days=6) <= end:
+            close_run(d - timedelta(days=1))
+            run_start = None
+            weeks.append(d.isoformat())
+            d += timedelta(days=7)
+            continue
+        if run_start is None:
+            run_start = d
+        d += timedelta(days=1)
+    close_run(end)
+    return daily, weeks, months
+
+
+# 일별 행 -> 주/월 기간 키 (SQLite 식)
+WEEK_EXPR = "date(day, '-' || ((CAST(strftime('%w', day) AS INTEGER) + 6) % 7) || ' days')"
+MONTH_EXPR = "strftime('%Y-%m-01', day)"
+ROLLUPS = (("rollup_weekly", WEEK_EXPR), ("rollup_monthly", MONTH_EXPR))
+
+
+def _ratio(num, den, scale=1.0):
+    """0 으로 나누는 항목은 0 (배열 전체 한 번에)"""
+    num = np.asarray(num, dtype=np.float64)
+    den = np.asarray(den, dtype=np.float64)
+    out = np.zeros(np.broadcast(num, den).shape, dtype=np.float64)
+    np.divide(num * scale, den, out=out, where=den > 0)
+    return out
+
+
+class StatsFrame:
+    """
+    엔티티별 기간 합계 (열 단위 numpy 배열)
+    - ids / names / parents: 리스트, imp / clk / cost / conv / rnk: 배열 (rnk = 노출 가중 평균 순위)
+    - metrics(): ctr, cpc, cvr, cpa 배열
+    """
+    __slots__ = ('ids', 'names', 'parents', 'imp', 'clk', 'cost', 'conv', 'rnk')
+
+    def __init__(self, ids, names, parents, imp, clk, cost, conv, rnk_imp):
+        self.ids = ids
+        self.names = names
+        self.parents = parents
+        self.imp = np.asarray(imp, dtype=np.float64)
+        self.clk = np.asarray(clk, dtype=np.float64)
+        self.cost = np.asarray(cost, dtype=np.float64)
+        self.conv = np.asarray(conv, dtype=np.float64)
+        self.rnk = _ratio(rnk_imp, self.imp)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def metrics(self):
+        return {
+            'ctr': _ratio(self.clk, self.imp, 100.0),
+            'cpc': _ratio(self.cost, self.clk),
+            'cvr': _ratio(self.conv, self.clk, 100.0),
+            'cpa': _ratio(self.cost, self.conv),
+        }
+
+    def totals(self):
+        """전체 합계 (계정/선택 범위 요약)"""
+        imp, clk, cost, conv = (float(a.sum()) for a in (self.imp, self.clk, self.cost, self.conv))
+        rnk = float((self.rnk * self.imp).sum() / imp) if imp > 0 else 0.0
+        return {
+            'imp': int(imp), 'clk': int(clk), 'cost': float(cost), 'conv': int(conv), 'rnk': rnk,
+            'ctr': clk / imp * 100 if imp > 0 else 0.0,
+            'cpc': cost / clk if clk > 0 else 0.0,
+            'cvr': conv / clk * 100 if clk > 0 else 0.0,
+            'cpa': cost / conv if conv > 0 else 0.0,
+        }
+
+    def stats_dict(self, i):
+        """API 통계 응답과 같은 키 형태 (기존 화면 코드 호환)"""
+        return {
+            'impCnt': int(self.imp[i]), 'clkCnt': int(self.clk[i]), 'salesAmt': float(self.cost[i]),
+            'ccnt': int(self.conv[i]), 'convCnt': int(self.conv[i]), 'avgRnk': float(self.rnk[i]),
+        }
+
+
+class StatsStore:
+    DB_FILE = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'stats_store.db'))
+    RECENT_DAYS = 3        # 최근 N일은 값이 바뀔 수 있어 다시 조회
+    RECENT_TTL = 30 * 60   # 최근 날짜 재조회 간격(초) - 기간 프리셋을 연달아 눌러도 API 호출 없음
+    SCHEMA_VERSION = 1     # 1: 주/월 롤업 추가
+    IN_CHUNK = 500    # SQLite 변수 개수 제한 대비 IN (...) 분할 크기
+
+    def __init__(self, db_file=None):
+        self.db_file = db_file or self.DB_FILE
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS daily_stats (
+                customer_id TEXT NOT NULL,
+                entity_id   TEXT NOT NULL,
+                level       TEXT NOT NULL,
+                parent_id   TEXT,
+                day         TEXT NOT NULL,
+                imp         INTEGER DEFAULT 0,
+                clk         INTEGER DEFAULT 0,
+                cost        REAL DEFAULT 0,
+                conv        INTEGER DEFAULT 0,
+                rnk_imp     REAL DEFAULT 0,
+                PRIMARY KEY (customer_id, entity_id, day)
+            );
+            CREATE INDEX IF NOT EXISTS ix_stats_level_day ON daily_stats (customer_id, level, day);
+            CREATE INDEX IF NOT EXISTS ix_stats_parent_day ON daily_stats (customer_id, parent_id, day);
+            CREATE TABLE IF NOT EXISTS coverage (
+                customer_id TEXT NOT NULL,
+                owner_id    TEXT NOT NULL,
+                level       TEXT NOT NULL,
+                day         TEXT NOT NULL,
+                fetched_at  REAL DEFAULT 0,
+                PRIMARY KEY (customer_id, owner_id, level, day)
+            );
+            CREATE TABLE IF NOT EXISTS entities (
+                customer_id TEXT NOT NULL,
+                entity_id   TEXT NOT NULL,
+                level       TEXT NOT NULL,
+                parent_id   TEXT,
+                name        TEXT,
+                PRIMARY KEY (customer_id, entity_id)
+            );
+            CREATE INDEX IF NOT EXISTS ix_entities_parent ON entities (customer_id, parent_id);
+        """ + "".join(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                customer_id TEXT NOT NULL,
+                entity_id   TEXT NOT NULL,
+                level       TEXT NOT NULL,
+                parent_id   TEXT,
+                period      TEXT NOT NULL,
+                imp         INTEGER DEFAULT 0,
+                clk         INTEGER DEFAULT 0,
+                cost        REAL DEFAULT 0,
+                conv        INTEGER DEFAULT 0,
+                rnk_imp     REAL DEFAULT 0,
+                PRIMARY KEY (customer_id, entity_id, period)
+            );
+        """ for table, _ in ROLLUPS))
+        self._conn.commit()
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < self.SCHEMA_VERSION:
+            self.rebuild_rollups()
+            self._conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+            self._conn.commit()
+
+    @property
+    def customer_id(self):
+        return str(api.naver_customer_id or '')
+
+    def _chunks(self, items):
+        items = list(items)
+        for i in range(0, len(items), self.IN_CHUNK):
+            yield items[i:i + self.IN_CHUNK]
+
+    # ---------------------------------------------------------------------
+    # 적재
+    # ---------------------------------------------------------------------
+    def _covered(self, owner_ids, level, days):
+        """{owner_id: {조회 완료된 날짜: 조회 시각}}"""
+        cid = self.customer_id
+        covered = {}
+        with self._lock:
+            for chunk in self._chunks(owner_ids):
+                q = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT owner_id, day, fetched_at FROM coverage WHERE customer_id=? AND level=? "
+                    f"AND day BETWEEN ? AND ? AND owner_id IN ({q})",
+                    [cid, level, days[0], days[-1], *chunk]
+                ).fetchall()
+                for owner, day, fetched_at in rows:
+                    covered.setdefault(owner, {})[day] = fetched_at or 0
+        return covered
+
+    def backfill(self, level, entities, since, until, progress=None, recent_ttl=None):
+        """
+        entities: [(entity_id, parent_id, name), ...] 의 since~until 일별 통계를 채움
+        - 캠페인/그룹: 엔티티 자신이 조회 단위, 키워드: 소속 그룹(parent_id) 단위
+        - progress(완료 청크, 전체 청크, 이번 청크 ID 리스트): 청크가 저장될 때마다 호출
+        - recent_ttl: 미확정 날짜 재조회 간격(초), 기본 RECENT_TTL / 0 이면 미확정 날짜는 항상 다시 조회
+        반환: 실제로 API 조회한 ID 수
+        """
+        if level not in LEVELS or not entities:
+            return 0
+        days = day_range(since, until)
+        if not days:
+            return 0
+        self._save_entities(level, entities)
+
+        owner_of = {}
+        for eid, parent, _ in entities:
+            owner_of[eid] = parent if level == "keyword" else eid
+        owners = sorted(set(owner_of.values()))
+        covered = self._covered(owners, level, days)
+        stale_before = time.time() - (self.RECENT_TTL if recent_ttl is None else recent_ttl)
+        # 날짜별 집계 확정 시각 - 이보다 먼저 조회한 값은 부분 집계일 수 있음
+        settled = {d: datetime.combine(date.fromisoformat(d) + timedelta(days=self.RECENT_DAYS),
+                                       datetime.min.time()).timestamp() for d in days}
+
+        # 소유자별로 필요한 날짜 구간 -> 같은 구간끼리 묶어서 조회
+        ranges = {}
+        for owner in owners:
+            seen = covered.get(owner, {})
+            need = [d for d in days if d not in seen or (seen[d] < settled[d] and seen[d] <= stale_before)]
+            if need:
+                ranges.setdefault((need[0], need[-1]), []).append(owner)
+        if not ranges:
+            return 0
+
+        parent_of = {eid: parent for eid, parent, _ in entities}
+        fetched = 0
+        for (r_since, r_until), range_owners in ranges.items():
+            owner_set = set(range_owners)
+            ids = [eid for eid, owner in owner_of.items() if owner in owner_set]
+            total = (len(ids) + api.STATS_CHUNK - 1) // api.STATS_CHUNK
+            done = [0]
+
+            def on_chunk(chunk, rows, r_since=r_since, r_until=r_until, total=total, done=done):
+                if rows is not None:
+                    self._save_rows(level, chunk, rows, parent_of, r_since, r_until)
+                done[0] += 1
+                if progress:
+                    progress(done[0], total, chunk)
+
+            _, failed = api.get_daily_stats(ids, r_since, r_until, on_chunk=on_chunk)
+            failed_owners = {owner_of[eid] for eid in failed}
+            self._mark_covered([o for o in range_owners if o not in failed_owners], level, day_range(r_since, r_until))
+            fetched += len(ids)
+        return fetched
+
+    def _save_rows(self, level, chunk, rows, parent_of, since, until):
+        cid = self.customer_id
+        values = []
+        for (eid, day), item in rows.items():
+            imp = int(item.get('impCnt') or 0)
+            values.append((
+                cid, eid, level, parent_of.get(eid), day,
+                imp, int(item.get('clkCnt') or 0), float(item.get('salesAmt') or 0),
+                int(item.get('ccnt') or 0), float(item.get('avgRnk') or 0) * imp
+            ))
+        with self._lock:
+            q = ",".join("?" * len(chunk))
+            # 다시 조회한 구간은 통째로 교체 (사라진 행 정리)
+            self._conn.execute(
+                f"DELETE FROM daily_stats WHERE customer_id=? AND day BETWEEN ? AND ? AND entity_id IN ({q})",
+                [cid, since, until, *chunk]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO daily_stats (customer_id, entity_id, level, parent_id, day, imp, clk, cost, conv, rnk_imp) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", values
+            )
+            self._refresh_rollups(chunk, since, until)
+            self._conn.commit()
+
+    def _refresh_rollups(self, chunk, since, until):
+        """chunk 엔티티의 since~until 이 속한 주/월 합계만 다시 계산 (락 안에서 호출)"""
+        cid = self.customer_id
+        q = ",".join("?" * len(chunk))
+        spans = (
+            (week_start(since), week_start(until),
+             (datetime.strptime(week_start(until), "%Y-%m-%d").date() + timedelta(days=6)).isoformat()),
+            (month_start(since), month_start(until), month_end(until)),
+        )
+        for (table, expr), (first, last, last_day) in zip(ROLLUPS, spans):
+            self._conn.execute(
+                f"DELETE FROM {table} WHERE customer_id=? AND period BETWEEN ? AND ? AND entity_id IN ({q})",
+                [cid, first, last, *chunk]
+            )
+            self._conn.execute(
+                f"INSERT INTO {table} (customer_id, entity_id, level, parent_id, period, imp, clk, cost, conv, rnk_imp) "
+                f"SELECT customer_id, entity_id, MAX(level), MAX(parent_id), {expr} AS p, "
+                f"SUM(imp), SUM(clk), SUM(cost), SUM(conv), SUM(rnk_imp) FROM daily_stats "
+                f"WHERE customer_id=? AND day BETWEEN ? AND ? AND entity_id IN ({q}) GROUP BY entity_id, p",
+                [cid, first, last_day, *chunk]
+            )
+
+    def rebuild_rollups(self):
+        """주/월 합계 전체 재계산 (롤업 도입 전 DB 1회 변환)"""
+        with self._lock:
+            for table, expr in ROLLUPS:
+                self._conn.execute(f"DELETE FROM {table}")
+                self._conn.execute(
+                    f"INSERT INTO {table} (customer_id, entity_id, level, parent_id, period, imp, clk, cost, conv, rnk_imp) "
+                    f"SELECT customer_id, entity_id, MAX(level), MAX(parent_id), {expr} AS p, "
+                    f"SUM(imp), SUM(clk), SUM(cost), SUM(conv), SUM(rnk_imp) FROM daily_stats "
+                    f"GROUP BY customer_id, entity_id, p"
+                )
+            self._conn.commit()
+
+    def _mark_covered(self, owners, level, days):
+        if not owners:
+            return
+        cid, now = self.customer_id, time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO coverage (customer_id, owner_id, level, day, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                [(cid, o, level, d, now) for o in owners for d in days]
+            )
+            self._conn.commit()
+
+    def _save_entities(self, level, entities):
+        cid = self.customer_id
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entities (customer_id, entity_id, level, parent_id, name) VALUES (?, ?, ?, ?, ?)",
+                [(cid, eid, level, parent, name) for eid, parent, name in entities]
+            )
+            self._conn.commit()
+
+    # ---------------------------------------------------------------------
+    # 조회 (로컬)
+    # ---------------------------------------------------------------------
+    def frame(self, ids, since, until):
+        """ids 의 기간 합계 -> StatsFrame (ids 순서 유지, 통계 없는 ID 는 0)"""
+        cid = self.customer_id
+        ids = list(ids)
+        daily, weeks, months = rollup_segments(since, until)
+        # (테이블, 기간 열, 조건, 인자) - 일별 구간은 BETWEEN, 주/월은 기간 시작일 목록
+        parts = [("daily_stats", "day BETWEEN ? AND ?", [lo, hi]) for lo, hi in daily]
+        for (table, _), periods in zip(ROLLUPS, (weeks, months)):
+            if periods:
+                parts.append((table, f"period IN ({','.join('?' * len(periods))})", periods))
+        sums = {}
+        names = {}
+        with self._lock:
+            for chunk in self._chunks(ids):
+                q = ",".join("?" * len(chunk))
+                for table, cond, args in parts:
+                    for row in self._conn.execute(
+                        f"SELECT entity_id, SUM(imp), SUM(clk), SUM(cost), SUM(conv), SUM(rnk_imp) FROM {table} "
+                        f"WHERE customer_id=? AND {cond} AND entity_id IN ({q}) GROUP BY entity_id",
+                        [cid, *args, *chunk]
+                    ):
+                        prev = sums.get(row[0])
+                        sums[row[0]] = row[1:] if prev is None else tuple(a + b for a, b in zip(prev, row[1:]))
+                for eid, parent, name in self._conn.execute(
+                    f"SELECT entity_id, parent_id, name FROM entities WHERE customer_id=? AND entity_id IN ({q})",
+                    [cid, *chunk]
+                ):
+                    names[eid] = (parent, name)
+        cols = np.array([sums.get(i, (0, 0, 0, 0, 0)) for i in ids], dtype=np.float64).reshape(len(ids), 5)
+        return StatsFrame(
+            ids, [names.get(i, (None, i))[1] or i for i in ids], [names.get(i, (None, None))[0] for i in ids],
+            cols[:, 0], cols[:, 1], cols[:, 2], cols[:, 3], cols[:, 4]
+        )
+
+    def children_frame(self, parent_ids, level, since, until):
+        """parent_ids 소속 엔티티(level) 전체의 기간 합계 - 저장된 엔티티 목록 기준"""
+        cid = self.customer_id
+        ids = []
+        with self._lock:
+            for chunk in self._chunks(parent_ids):
+                q = ",".join("?" * len(chunk))
+                ids.extend(r[0] for r in self._conn.execute(
+                    f"SELECT entity_id FROM entities WHERE customer_id=? AND level=? AND parent_id IN ({q})",
+                    [cid, level, *chunk]
+                ))
+        return self.frame(ids, since, until)
+
+    def series(self, ids, since, until):
+        """ids 합산 일별 추이 -> {'days': [...], 'imp'/'clk'/'cost'/'conv': 배열} (빈 날은 0)"""
+        cid = self.customer_id
+        days = day_range(since, until)
+        pos = {d: i for i, d in enumerate(days)}
+        out = np.zeros((4, len(days)), dtype=np.float64)
+        with self._lock:
+            for chunk in self._chunks(ids):
+                q = ",".join("?" * len(chunk))
+                for day, imp, clk, cost, conv in self._conn.execute(
+                    f"SELECT day, SUM(imp), SUM(clk), SUM(cost), SUM(conv) FROM daily_stats "
+                    f"WHERE customer_id=? AND day BETWEEN ? AND ? AND entity_id IN ({q}) GROUP BY day",
+                    [cid, since, until, *chunk]
+                ):
+                    i = pos.get(day)
+                    if i is not None:
+                        out[:, i] += (imp, clk, cost, conv)
+        return {'days': days, 'imp': out[0], 'clk': out[1], 'cost': out[2], 'conv': out[3]}
+
+
+stats_store = StatsStore()
@@ -2,14 +2,17 @@
 import sys
 import os
 import time
+import zlib
+import json
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, status, Header, Response, Request
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, Float, ForeignKey, UniqueConstraint, Index, func, case
 from sqlalchemy.orm import sessionmaker, Session, relationship, declarative_base
 from passlib.context import CryptContext
 from jose import JWTError, jwt
@@ -18,6 +21,9 @@ from jose import JWTError, jwt
 SECRET_KEY = "YOUR_SECRET_KEY_PLEASE_CHANGE_THIS"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24시간
+BID_HISTORY_RETENTION_DAYS = 90  # 입찰 이력 보관 기간
+BID_HISTORY_MAX_BATCH = 5000     # 한 번에 받는 최대 이벤트 수
+BID_HISTORY_MAX_BYTES = 8 * 1024 * 1024  # 본문 최대 크기 (압축 전/후 각각, 5000건 기준 여유 있게)
 
 DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.db")
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
@@ -65,6 +71,46 @@ class ActivityLog(Base):
 
     user = relationship("User", back_populates="logs")
 
+class BidRule(Base):
+    """유저별 자동입찰 설정 (광고그룹 1개당 1행, version으로 변경 추적)"""
+    __tablename__ = "bid_rules"
+    __table_args__ = (UniqueConstraint("user_id", "adgroup_id", name="uq_bid_rule_user_group"),)
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    adgroup_id = Column(String, index=True)
+    name = Column(String)
+    target_rank = Column(Integer, default=3)
+    max_bid = Column(Integer, default=20000)
+    bid_step = Column(Integer, default=500)
+    probe_limit = Column(Integer, default=5000)
+    min_imp = Column(Integer, default=20)
+    min_bid = Column(Integer, default=70)
+    # 변경될 때마다 유저 단위로 1씩 증가하는 버전 (delta 조회 기준)
+    version = Column(Integer, default=0, index=True)
+    # 삭제된 규칙은 delta 조회를 위해 행을 남겨두고 플래그만 세움 (tombstone)
+    is_deleted = Column(Boolean, default=False)
+    updated_at = Column(DateTime, default=datetime.now)
+
+class BidHistory(Base):
+    """입찰가 변경 이력 (추가 전용, day 컬럼 기준으로 기간 파티션/보관 관리)"""
+    __tablename__ = "bid_history"
+    __table_args__ = (
+        Index("ix_bid_history_user_day", "user_id", "day"),
+        Index("ix_bid_history_user_kwd_ts", "user_id", "keyword_id", "ts"),
+    )
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"))
+    day = Column(String)  # YYYY-MM-DD (파티션 키)
+    ts = Column(DateTime)
+    adgroup_id = Column(String)
+    group_name = Column(String)
+    keyword_id = Column(String)
+    keyword = Column(String)
+    old_bid = Column(Integer)
+    new_bid = Column(Integer)
+    rank = Column(Float, default=0.0)
+    reason = Column(String)
+
 Base.metadata.create_all(bind=engine)
 
 # -------------------------------------------------------------------
@@ -108,6 +154,32 @@ class Token(BaseModel):
 class HeartbeatItem(BaseModel):
     status: str
 
+class BidRuleItem(BaseModel):
+    adgroup_id: str
+    name: str = ""
+    target_rank: int = 3
+    max_bid: int = 20000
+    bid_step: int = 500
+    probe_limit: int = 5000
+    min_imp: int = 20
+    min_bid: int = 70
+
+class BidRuleSync(BaseModel):
+    # upsert 할 규칙 목록과 삭제할 광고그룹 ID 목록
+    rules: List[BidRuleItem] = []
+    deleted: List[str] = []
+
+class BidEventItem(BaseModel):
+    ts: datetime
+    adgroup_id: str
+    group_name: str = ""
+    keyword_id: str
+    keyword: str = ""
+    old_bid: int
+    new_bid: int
+    rank: float = 0.0
+    reason: str = ""
+
 def get_db():
     db = SessionLocal()
     try:
@@ -234,7 +306,221 @@ def client_heartbeat(item: HeartbeatItem, current_user: User = Depends(get_curre
     db.commit()
     return {"status": "alive"}
 
-# 4. [관리자] 라이센스 및 모니터링
+# 4. [자동입찰 설정] 버전/ETag 기반 동기화
+BID_RULE_FIELDS = ("name", "target_rank", "max_bid", "bid_step", "probe_limit", "min_imp", "min_bid")
+
+def get_bid_rules_version(db: Session, user_id: int) -> int:
+    version = db.query(func.max(BidRule.version)).filter(BidRule.user_id == user_id).scalar()
+    return version or 0
+
+def make_bid_rules_etag(user_id: int, version: int) -> str:
+    return f'W/"bid-rules-{user_id}-{version}"'
+
+def bid_rule_to_dict(rule: BidRule) -> dict:
+    data = {"adgroup_id": rule.adgroup_id, "version": rule.version}
+    for field in BID_RULE_FIELDS:
+        data[field] = getattr(rule, field)
+    return data
+
+@app.get("/api/bid-rules")
+def get_bid_rules(response: Response, if_none_match: Optional[str] = Header(None), current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+    version = get_bid_rules_version(db, current_user.id)
+    etag = make_bid_rules_etag(current_user.id, version)
+    # 클라이언트가 가진 버전과 같으면 본문 없이 304 반환
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    rules = db.query(BidRule).filter(BidRule.user_id == current_user.id, BidRule.is_deleted == False).all()
+    response.headers["ETag"] = etag
+    return {"version": version, "rules": [bid_rule_to_dict(r) for r in rules]}
+
+@app.get("/api/bid-rules/delta")
+def get_bid_rules_delta(response: Response, since: int = 0, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+    version = get_bid_rules_version(db, current_user.id)
+    changed_rows = db.query(BidRule).filter(BidRule.user_id == current_user.id, BidRule.version > since).all()
+    changed = [bid_rule_to_dict(r) for r in changed_rows if not r.is_deleted]
+    deleted = [r.adgroup_id for r in changed_rows if r.is_deleted]
+    response.headers["ETag"] = make_bid_rules_etag(current_user.id, version)
+    return {"version": version, "since": since, "changed": changed, "deleted": deleted}
+
+@app.put("/api/bid-rules")
+def sync_bid_rules(payload: BidRuleSync, response: Response, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+    # 한 번의 요청으로 들어온 변경은 모두 같은 버전을 부여받음
+    new_version = get_bid_rules_version(db, current_user.id) + 1
+    target_ids = [r.adgroup_id for r in payload.rules] + list(payload.deleted)
+    existing = {}
+    if target_ids:
+        rows = db.query(BidRule).filter(BidRule.user_id == current_user.id, BidRule.adgroup_id.in_(target_ids)).all()
+        existing = {r.adgroup_id: r for r in rows}
+
+    changed_cnt = 0
+    for item in payload.rules:
+        rule = existing.get(item.adgroup_id)
+        if rule is None:
+            rule = BidRule(user_id=current_user.id, adgroup_id=item.adgroup_id)
+            db.add(rule)
+            existing[item.adgroup_id] = rule
+        elif not rule.is_deleted and all(getattr(rule, f) == getattr(item, f) for f in BID_RULE_FIELDS):
+            continue  # 값이 같으면 버전을 올리지 않음
+        for field in BID_RULE_FIELDS:
+            setattr(rule, field, getattr(item, field))
+        rule.is_deleted = False
+        rule.version = new_version
+        rule.updated_at = datetime.now()
+        changed_cnt += 1
+
+    for gid in payload.deleted:
+        rule = existing.get(gid)
+        if rule is None or rule.is_deleted:
+            continue
+        rule.is_deleted = True
+        rule.version = new_version
+        rule.updated_at = datetime.now()
+        changed_cnt += 1
+
+    if changed_cnt == 0:
+        new_version -= 1
+    else:
+        db.commit()
+    response.headers["ETag"] = make_bid_rules_etag(current_user.id, new_version)
+    return {"status": "success", "version": new_version, "changed": changed_cnt}
+
+# 5. [입찰 이력] 대량 수집 + 집계
+_last_retention_day = None
+
+def purge_old_bid_history(db: Session):
+    """보관 기간이 지난 파티션(day) 삭제 - 프로세스당 하루 1회만 수행"""
+    global _last_retention_day
+    today = datetime.now().strftime("%Y-%m-%d")
+    if _last_retention_day == today:
+        return
+    cutoff = (datetime.now() - timedelta(days=BID_HISTORY_RETENTION_DAYS)).strftime("%Y-%m-%d")
+    deleted = db.query(BidHistory).filter(BidHistory.day < cutoff).delete(synchronize_session=False)
+    db.commit()
+    _last_retention_day = today
+    if deleted:
+        print(f"🧹 [입찰이력] {cutoff} 이전 {deleted}건 삭제")
+
+@app.post("/api/bid-history/bulk")
+async def ingest_bid_history(request: Request, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+    # 클라이언트는 gzip 압축된 JSON 배열을 보냄 (Content-Encoding: gzip)
+    # 본문만 비동기로 읽고, 해제/파싱/DB 저장은 스레드 풀에서 (이벤트 루프를 막지 않도록)
+    too_large = HTTPException(status_code=413, detail="요청 본문이 너무 큽니다.")
+    if int(request.headers.get("content-length") or 0) > BID_HISTORY_MAX_BYTES:
+        raise too_large
+    # Content-Length 없이 보내는 경우도 읽으면서 크기 제한
+    raw = bytearray()
+    async for chunk in request.stream():
+        raw.extend(chunk)
+        if len(raw) > BID_HISTORY_MAX_BYTES:
+            raise too_large
+    gzipped = request.headers.get("content-encoding", "").lower() == "gzip"
+    return await run_in_threadpool(store_bid_history, bytes(raw), gzipped, current_user.id, db)
+
+def gunzip_limited(raw: bytes, limit: int) -> bytes:
+    """gzip 해제 - 결과가 limit 를 넘으면 413 (압축 폭탄 방지)"""
+    d = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    out = d.decompress(raw, limit)
+    if not d.eof:
+        if len(out) >= limit:
+            raise HTTPException(status_code=413, detail="압축 해제한 본문이 너무 큽니다.")
+        raise ValueError("gzip 본문이 잘렸습니다.")
+    return out
+
+def store_bid_history(raw: bytes, gzipped: bool, user_id: int, db: Session):
+    try:
+        if gzipped:
+            raw = gunzip_limited(raw, BID_HISTORY_MAX_BYTES)
+        items = json.loads(raw)
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=400, detail="본문을 해석할 수 없습니다.")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="이벤트 배열이 필요합니다.")
+    if len(items) > BID_HISTORY_MAX_BATCH:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {BID_HISTORY_MAX_BATCH}건까지 전송할 수 있습니다.")
+
+    rows = []
+    for item in items:
+        try:
+            ev = BidEventItem(**item)
+        except Exception:
+            continue  # 형식이 잘못된 이벤트는 건너뜀
+        rows.append({
+            "user_id": user_id,
+            "day": ev.ts.strftime("%Y-%m-%d"),
+            "ts": ev.ts,
+            "adgroup_id": ev.adgroup_id,
+            "group_name": ev.group_name,
+            "keyword_id": ev.keyword_id,
+            "keyword": ev.keyword,
+            "old_bid": ev.old_bid,
+            "new_bid": ev.new_bid,
+            "rank": ev.rank,
+            "reason": ev.reason,
+        })
+    if rows:
+        db.bulk_insert_mappings(BidHistory, rows)
+        db.commit()
+    purge_old_bid_history(db)
+    return {"status": "success", "accepted": len(rows), "rejected": len(items) - len(rows)}
+
+@app.get("/api/bid-history/daily")
+def bid_history_daily(since: Optional[str] = None, until: Optional[str] = None, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+    """그룹별/일별 입찰 변경 건수 (인상/인하 구분)"""
+    until = until or datetime.now().strftime("%Y-%m-%d")
+    since = since or (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+    rows = db.query(
+        BidHistory.day, BidHistory.adgroup_id, func.max(BidHistory.group_name),
+        func.count(BidHistory.id),
+        func.sum(case((BidHistory.new_bid > BidHistory.old_bid, 1), else_=0)),
+        func.sum(case((BidHistory.new_bid < BidHistory.old_bid, 1), else_=0)),
+    ).filter(
+        BidHistory.user_id == current_user.id, BidHistory.day >= since, BidHistory.day <= until
+    ).group_by(BidHistory.day, BidHistory.adgroup_id).order_by(BidHistory.day).all()
+    return [
+        {"day": day, "adgroup_id": gid, "group_name": gname, "changes": cnt, "raises": raises or 0, "cuts": cuts or 0}
+        for day, gid, gname, cnt, raises, cuts in rows
+    ]
+
+@app.get("/api/bid-history/oscillation")
+def bid_history_oscillation(days: int = 7, min_flips: int = 3, current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)):
+    """인상/인하가 반복(방향 전환)되는 키워드 탐지"""
+    since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    query = db.query(
+        BidHistory.keyword_id, BidHistory.keyword, BidHistory.group_name, BidHistory.old_bid, BidHistory.new_bid
+    ).filter(
+        BidHistory.user_id == current_user.id, BidHistory.day >= since
+    ).order_by(BidHistory.keyword_id, BidHistory.ts)
+
+    result = []
+    cur_id, cur, last_dir = None, None, 0
+
+    def close_current():
+        if cur and cur["flips"] >= min_flips:
+            result.append(cur)
+
+    # 키워드 순으로 정렬된 행을 한 번만 훑으면서 방향 전환 횟수 계산
+    for kid, kwd, gname, old_bid, new_bid in query.yield_per(1000):
+        if kid != cur_id:
+            close_current()
+            cur_id, last_dir = kid, 0
+            cur = {"keyword_id": kid, "keyword": kwd, "group_name": gname, "changes": 0, "flips": 0, "min_bid": new_bid, "max_bid": new_bid}
+        direction = (new_bid > old_bid) - (new_bid < old_bid)
+        if direction and last_dir and direction != last_dir:
+            cur["flips"] += 1
+        if direction:
+            last_dir = direction
+        cur["changes"] += 1
+        cur["min_bid"] = min(cur["min_bid"], new_bid)
+        cur["max_bid"] = max(cur["max_bid"], new_bid)
+    close_current()
+
+    result.sort(key=lambda r: r["flips"], reverse=True)
+    return result
+
+# 6. [관리자] 라이센스 및 모니터링
 @app.get("/admin/users", response_model=List[UserOut])
 def get_all_users(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     if not current_user.is_superuser:
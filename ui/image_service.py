@@ -0,0 +1,164 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QImage
+
+# -------------------------------------------------------------------------
+# [이미지 서비스] 확장소재 미리보기 이미지 공용 로더
+# - 다운로드/디코딩은 고정 크기 스레드 풀에서 (카드마다 QThread 생성 X)
+# - 같은 URL 을 여러 카드가 요청하면 한 번만 받고 콜백에 모두 전달
+# - 디코딩된 QImage 는 메모리 LRU (바이트 한도), 원본 파일은 디스크 캐시 (URL SHA-1 파일명, 용량 한도)
+# - 콜백은 항상 메인 스레드에서 호출 (실패 시 null QImage)
+# -------------------------------------------------------------------------
+class ImageService(QObject):
+    CACHE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'image_cache'))
+    WORKERS = 4
+    MAX_EDGE = 512                    # 메모리에 둘 이미지 최대 변 길이 (미리보기는 250px)
+    MEMORY_LIMIT = 64 * 1024 * 1024   # 디코딩된 이미지 합계 한도
+    DISK_LIMIT = 200 * 1024 * 1024    # 디스크 캐시 합계 한도 (넘으면 오래 안 쓴 파일부터 삭제)
+    TIMEOUT = 10
+
+    _loaded = pyqtSignal(str, QImage)  # 작업 스레드 -> 메인 스레드
+
+    def __init__(self, cache_dir=None):
+        super().__init__()
+        self.cache_dir = cache_dir or self.CACHE_DIR
+        self._memory = OrderedDict()  # url -> QImage
+        self._memory_bytes = 0
+        self._waiting = {}            # url -> [콜백] (진행 중인 요청)
+        self._disk_bytes = None       # 첫 저장 때 계산
+        self._disk_lock = threading.Lock()
+        self._session = requests.Session()
+        self._executor = ThreadPoolExecutor(max_workers=self.WORKERS, thread_name_prefix="img")
+        self._loaded.connect(self._on_loaded)
+
+    def request(self, url, callback):
+        """url 이미지를 callback(QImage) 로 전달 (메모리에 있으면 즉시 호출)"""
+        img = self._memory.get(url)
+        if img is not None:
+            self._memory.move_to_end(url)
+            callback(img)
+            return
+        waiting = self._waiting.get(url)
+        if waiting is not None:
+            waiting.append(callback)  # 이미 받는 중 -> 결과만 같이 받음
+            return
+        self._waiting[url] = [callback]
+        self._executor.submit(self._fetch, url)
+
+    # ---------------------------------------------------------------------
+    # 작업 스레드
+    # ---------------------------------------------------------------------
+    def _path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+    def _fetch(self, url):
+        img = QImage()
+        try:
+            data = self._read_disk(url)
+            if data is None:
+                resp = self._session.get(url, timeout=self.TIMEOUT)
+                if resp.status_code == 200:
+                    data = resp.content
+                else:
+                    print(f"[IMG] HTTP {resp.status_code} for: {url}")
+            if data is not None:
+                if img.loadFromData(data):
+                    self._write_disk(url, data)
+                    if max(img.width(), img.height()) > self.MAX_EDGE:
+                        img = img.scaled(self.MAX_EDGE, self.MAX_EDGE,
+                                         Qt.AspectRatioMode.KeepAspectRatio,
+                                         Qt.TransformationMode.SmoothTransformation)
+                else:
+                    print(f"[IMG] QImage loadFromData failed for: {url}")
+                    self._drop_disk(url)
+        except Exception as e:
+            print(f"[IMG] Image load failed: {e}")
+        self._loaded.emit(url, img)
+
+    def _read_disk(self, url):
+        path = self._path(url)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # 최근 사용 시각 갱신 (정리 순서 기준)
+            return data
+        except OSError:
+            return None
+
+    def _write_disk(self, url, data):
+        path = self._path(url)
+        if os.path.exists(path):
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.part"
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[IMG] 디스크 캐시 저장 실패: {e}")
+            return
+        with self._disk_lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(e.stat().st_size for e in os.scandir(self.cache_dir) if e.is_file())
+            else:
+                self._disk_bytes += len(data)
+            if self._disk_bytes > self.DISK_LIMIT:
+                self._prune_disk()
+
+    def _prune_disk(self):
+        """오래 안 쓴 파일부터 지워 한도의 80% 까지 줄임 (_disk_lock 안에서 호출)"""
+        entries = sorted((e for e in os.scandir(self.cache_dir) if e.is_file()), key=lambda e: e.stat().st_mtime)
+        total = sum(e.stat().st_size for e in entries)
+        for e in entries:
+            if total <= self.DISK_LIMIT * 0.8:
+                break
+            try:
+                size = e.stat().st_size
+                os.remove(e.path)
+                total -= size
+            except OSError:
+                pass
+        self._disk_bytes = total
+
+    def _drop_disk(self, url):
+        try:
+            os.remove(self._path(url))
+        except OSError:
+            pass
+
+    # ---------------------------------------------------------------------
+    # 메인 스레드
+    # ---------------------------------------------------------------------
+    def _on_loaded(self, url, img):
+        if not img.isNull():
+            self._remember(url, img)
+        for callback in self._waiting.pop(url, []):
+            try:
+                callback(img)
+            except RuntimeError:
+                pass  # 기다리던 카드가 이미 삭제됨
+
+    def _remember(self, url, img):
+        self._memory[url] = img
+        self._memory_bytes += img.sizeInBytes()
+        while self._memory_bytes > self.MEMORY_LIMIT and len(self._memory) > 1:
+            _, old = self._memory.popitem(last=False)
+            self._memory_bytes -= old.sizeInBytes()
+
+
+_service = None
+
+
+def image_service():
+    """QApplication 생성 후 처음 쓸 때 만듦 (시그널이 메인 스레드에 묶이도록)"""
+    global _service
+    if _service is None:
+        _service = ImageService()
+    return _service
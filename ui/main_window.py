@@ -1,25 +1,22 @@
 import sys
 import os
+import importlib
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-import requests
-from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QLabel, QLineEdit, QPushButton, QMessageBox, QDialog, 
-    QStackedWidget, QListWidget, QFrame, QGraphicsDropShadowEffect
-)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QColor
+from ui import startup_profile
 
-# 모듈 불러오기
-from api.api_client import api
-from ui.tab_autobidder import AutoBidderWidget
-from ui.tab_creative import CreativeManagerWidget
-from ui.tab_extension import ExtensionManagerWidget
-from ui.tab_keyword import KeywordExpanderWidget
-from ui.tab_admin import AdminDashboardWidget
-from ui.tab_settings import SettingsWidget
-from ui.tab_guide import UserGuideWidget
-from ui.tab_dashboard import DashboardWidget
+with startup_profile.section("import requests / PyQt6"):
+    import requests
+    from PyQt6.QtWidgets import (
+        QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+        QLabel, QLineEdit, QPushButton, QMessageBox, QDialog, 
+        QStackedWidget, QListWidget, QFrame, QGraphicsDropShadowEffect
+    )
+    from PyQt6.QtCore import Qt, QTimer
+    from PyQt6.QtGui import QFont, QColor
+
+# 모듈 불러오기 (탭 모듈은 처음 열 때 import - TAB 목록 참고)
+with startup_profile.section("import api.api_client"):
+    from api.api_client import api
 
 # [한글 깨짐 방지]
 if sys.platform.startswith('win'):
@@ -30,6 +27,24 @@ if sys.platform.startswith('win'):
     if sys.stderr:
         sys.stderr = io.TextIOWrapper(sys.stderr.detach(), encoding='utf-8')
 
+# -------------------------------------------------------------------------
+# [탭 목록] (사이드바 메뉴, 헤더 제목, 모듈, 위젯 클래스)
+# - 탭 위젯은 처음 선택될 때 생성 (모듈 import 포함) -> 로그인 창까지 즉시 표시
+# - PyInstaller 는 문자열 import 를 추적하지 못하므로 spec 의 hiddenimports 에도 등록
+# -------------------------------------------------------------------------
+TAB_DASHBOARD = ("📊  대시보드", "대시보드", "ui.tab_dashboard", "DashboardWidget")
+TAB_ADMIN = ("👥  회원 관리", "회원 관리", "ui.tab_admin", "AdminDashboardWidget")
+TAB_BID = ("🚀  자동 입찰 (Auto Bid)", "자동 입찰", "ui.tab_autobidder", "AutoBidderWidget")
+TAB_CREATIVE = ("🎨  소재 관리 (Creatives)", "소재 관리", "ui.tab_creative", "CreativeManagerWidget")
+TAB_EXTENSION = ("🔗  확장 소재 (Extensions)", "확장 소재", "ui.tab_extension", "ExtensionManagerWidget")
+TAB_KEYWORD = ("✨  키워드 확장 (Expansion)", "키워드 확장", "ui.tab_keyword", "KeywordExpanderWidget")
+TAB_SETTINGS = ("⚙️  설정 (Settings)", "설정", "ui.tab_settings", "SettingsWidget")
+TAB_GUIDE = ("📖  사용 가이드", "사용 가이드", "ui.tab_guide", "UserGuideWidget")
+
+# 대시보드(TAB_DASHBOARD) 임시 비활성화
+ADMIN_TABS = [TAB_ADMIN, TAB_BID, TAB_CREATIVE, TAB_EXTENSION, TAB_KEYWORD, TAB_SETTINGS]
+USER_TABS = [TAB_BID, TAB_CREATIVE, TAB_EXTENSION, TAB_KEYWORD, TAB_SETTINGS, TAB_GUIDE]
+
 DEFAULT_FONT = "font-family: 'Malgun Gothic', 'Apple SD Gothic Neo', sans-serif;"
 
 STYLESHEET = """
@@ -211,27 +226,9 @@ class MainWindow(QMainWindow):
         
         is_admin = getattr(api, 'is_superuser', False)
         
-        # [메뉴 목록]
-        if is_admin:
-            items = [
-                # "📊  대시보드",                # 0 - 임시 비활성화
-                "👥  회원 관리",                # 0
-                "🚀  자동 입찰 (Auto Bid)",    # 1
-                "🎨  소재 관리 (Creatives)",   # 2
-                "🔗  확장 소재 (Extensions)",  # 3
-                "✨  키워드 확장 (Expansion)", # 4
-                "⚙️  설정 (Settings)"          # 5
-            ]
-        else:
-            items = [
-                # "📊  대시보드",                # 0 - 임시 비활성화
-                "🚀  자동 입찰 (Auto Bid)",    # 0
-                "🎨  소재 관리 (Creatives)",   # 1
-                "🔗  확장 소재 (Extensions)",  # 2
-                "✨  키워드 확장 (Expansion)", # 3
-                "⚙️  설정 (Settings)",         # 4
-                "📖  사용 가이드"              # 5
-            ]
+        # [메뉴 목록] - 순서가 페이지 스택 인덱스와 1:1로 매칭
+        self.tabs = ADMIN_TABS if is_admin else USER_TABS
+        items = [t[0] for t in self.tabs]
         self.sidebar.addItems(items)
         self.sidebar.setCurrentRow(0)
         self.sidebar.currentRowChanged.connect(self.change_tab)
@@ -247,39 +244,19 @@ class MainWindow(QMainWindow):
         
         # 헤더
         hbox = QHBoxLayout()
-        self.title = QLabel("자동 입찰" if not is_admin else "회원 관리"); self.title.setObjectName("TitleLabel")
+        self.title = QLabel(self.tabs[0][1]); self.title.setObjectName("TitleLabel")
         hbox.addWidget(self.title); hbox.addStretch()
         
         user_txt = f"👑 관리자 ({api.naver_customer_id})" if getattr(api, 'is_superuser', False) else f"👤 {api.naver_customer_id}"
         hbox.addWidget(QLabel(user_txt))
         vbox.addLayout(hbox)
         
-        # [페이지 스택 구성] - 순서가 사이드바 인덱스와 1:1로 매칭되어야 함
+        # [페이지 스택 구성] - 빈 자리만 만들어 두고 실제 탭은 처음 열 때 생성
         self.pages = QStackedWidget()
-        
-        # 대시보드 임시 비활성화
-        # self.pages.addWidget(DashboardWidget())
-        
-        if is_admin:
-            # [0] 회원 관리 (관리자 전용)
-            self.pages.addWidget(AdminDashboardWidget())  # 0: 회원관리
-            
-            # [1~5] 나머지 탭들
-            self.pages.addWidget(AutoBidderWidget())          # 1: 자동입찰
-            self.pages.addWidget(CreativeManagerWidget())     # 2: 소재관리
-            self.pages.addWidget(ExtensionManagerWidget())    # 3: 확장소재
-            self.pages.addWidget(KeywordExpanderWidget())     # 4: 키워드확장
-            self.pages.addWidget(SettingsWidget())            # 5: 설정
-        else:
-            # [0~4] 나머지 탭들
-            self.pages.addWidget(AutoBidderWidget())          # 0: 자동입찰
-            self.pages.addWidget(CreativeManagerWidget())     # 1: 소재관리
-            self.pages.addWidget(ExtensionManagerWidget())    # 2: 확장소재
-            self.pages.addWidget(KeywordExpanderWidget())     # 3: 키워드확장
-            self.pages.addWidget(SettingsWidget())            # 4: 설정
-            
-            # [5] 가이드
-            self.pages.addWidget(UserGuideWidget())           # 5: 가이드
+        self.built_pages = set()
+        for _ in self.tabs:
+            self.pages.addWidget(QWidget())
+        self.ensure_page(0)
         
         frame = QFrame(); frame.setObjectName("ContentFrame")
         fl = QVBoxLayout(frame); fl.setContentsMargins(20,20,20,20); fl.addWidget(self.pages)
@@ -291,14 +268,28 @@ class MainWindow(QMainWindow):
         vbox.addWidget(frame)
         layout.addWidget(content)
 
+    def ensure_page(self, idx):
+        """ idx 탭 위젯이 아직 없으면 모듈 import 후 생성해 빈 자리와 교체 """
+        if idx in self.built_pages or not (0 <= idx < len(self.tabs)):
+            return
+        _, _, module_name, class_name = self.tabs[idx]
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            with startup_profile.section(f"tab {class_name}"):
+                widget = getattr(importlib.import_module(module_name), class_name)()
+        finally:
+            QApplication.restoreOverrideCursor()
+        placeholder = self.pages.widget(idx)
+        self.pages.removeWidget(placeholder)
+        self.pages.insertWidget(idx, widget)
+        placeholder.deleteLater()
+        self.built_pages.add(idx)
+
     def change_tab(self, idx):
+        self.ensure_page(idx)
         self.pages.setCurrentIndex(idx)
-        is_admin = getattr(api, 'is_superuser', False)
-        if is_admin:
-            titles = ["회원 관리", "자동 입찰", "소재 관리", "확장 소재", "키워드 확장", "설정"]
-        else:
-            titles = ["자동 입찰", "소재 관리", "확장 소재", "키워드 확장", "설정", "사용 가이드"]
-        if 0 <= idx < len(titles): self.title.setText(titles[idx])
+        if 0 <= idx < len(self.tabs): self.title.setText(self.tabs[idx][1])
+        startup_profile.report(f"탭 전환: {self.title.text()}")
 
     def send_heartbeat(self):
         try: api.send_heartbeat("Active")
@@ -311,10 +302,15 @@ if __name__ == "__main__":
     default_font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
     app.setFont(default_font)
     
-    if LoginDialog().exec() == QDialog.DialogCode.Accepted:
+    login = LoginDialog()
+    startup_profile.mark("로그인 창 생성")
+    QTimer.singleShot(0, lambda: startup_profile.report("로그인 창 표시까지"))
+    if login.exec() == QDialog.DialogCode.Accepted:
         # 일반 유저도 API 키 없으면 설정 탭에서 입력하도록 유도 (강제 종료 X)
-        window = MainWindow()
+        with startup_profile.section("메인 윈도우 생성 (첫 탭 포함)"):
+            window = MainWindow()
         window.show()
+        startup_profile.report("메인 윈도우")
         sys.exit(app.exec())
     else:
         sys.exit(0)
\ No newline at end of file
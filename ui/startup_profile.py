@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# -------------------------------------------------------------------------
+# [시작 시간 프로파일] NAVER_AD_PROFILE=1 로 실행하면 구간별 소요 시간 기록
+# - mark(label): 프로세스 시작 기준 경과 시간 기록
+# - section(label): with 블록 소요 시간 기록 (모듈 import, 탭 생성 등)
+# - report(): 모인 기록 출력 후 비움 - 콘솔 + startup_profile.log (콘솔 없는 빌드 대비)
+# 꺼져 있으면 아무 것도 기록하지 않음
+# -------------------------------------------------------------------------
+ENABLED = os.environ.get("NAVER_AD_PROFILE") == "1"
+
+_T0 = time.perf_counter()
+_records = []  # (시작 경과, 소요, 라벨)
+
+
+def mark(label):
+    if ENABLED:
+        now = time.perf_counter() - _T0
+        _records.append((now, 0.0, label))
+
+
+@contextmanager
+def section(label):
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        _records.append((start - _T0, end - start, label))
+
+
+def _log_path():
+    # PyInstaller 빌드는 실행 파일 옆, 소스 실행은 프로젝트 루트
+    if getattr(sys, 'frozen', False):
+        base = os.path.dirname(sys.executable)
+    else:
+        base = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    return os.path.normpath(os.path.join(base, 'startup_profile.log'))
+
+
+def report(title="startup"):
+    if not ENABLED or not _records:
+        return
+    lines = [f"[PROFILE] {title} - 총 {time.perf_counter() - _T0:.3f}s"]
+    for at, took, label in sorted(_records):
+        took_txt = f"{took * 1000:8.1f}ms" if took else "        -"
+        lines.append(f"[PROFILE] {at:7.3f}s {took_txt}  {label}")
+    _records.clear()
+    text = "\n".join(lines)
+    if sys.stdout:
+        print(text)
+    try:
+        with open(_log_path(), 'a', encoding='utf-8') as f:
+            f.write(text + "\n\n")
+    except OSError as e:
+        if sys.stdout:
+            print(f"[PROFILE] 로그 저장 실패: {e}")
@@ -0,0 +1,235 @@
+import math
+from collections import OrderedDict
+
+# -------------------------------------------------------------------------
+# [matplotlib 지연 로딩] 모듈 import 만으로 백엔드/폰트 설정이 일어나지 않도록
+# 차트를 처음 만들 때 1회만 불러옴 -> (Figure, FigureCanvas)
+# -------------------------------------------------------------------------
+_mpl = None
+
+
+def load_matplotlib():
+    global _mpl
+    if _mpl is None:
+        import matplotlib
+        matplotlib.use('Qt5Agg')
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
+        # 한글 폰트 설정
+        try:
+            matplotlib.rcParams['font.family'] = 'Malgun Gothic'
+            matplotlib.rcParams['axes.unicode_minus'] = False
+        except:
+            pass
+        _mpl = (Figure, FigureCanvas)
+    return _mpl
+
+
+BAR_STYLE = dict(alpha=0.85, edgecolor='white', linewidth=2)
+TEXT_STYLE = dict(ha='center', va='bottom', fontweight='bold')
+
+DONUT_RING = 0.30      # 도넛 두께 (바깥 반지름 1.0)
+DONUT_LABEL_R = 1.12   # 항목 이름 위치
+DONUT_PCT_R = 0.85     # 비율 위치 (링 가운데)
+
+
+# -------------------------------------------------------------------------
+# [통계 차트] 대시보드 차트 탭 내용
+# - 축/막대/텍스트/도넛 조각을 처음 1번만 만들고, 선택이 바뀌면 값만 교체
+#   (figure.clear() + 서브플롯 재생성 + tight_layout 반복 없음)
+# - 표시용 값은 (항목 ID, 시작일, 종료일) 별로 계산해 LRU 캐시에 보관
+#   같은 항목을 다시 선택하면 계산 없이 바로 적용, 이미 표시 중이면 그리지 않음
+# - 다시 그리기는 draw_idle 로 예약 -> 트리를 빠르게 넘겨도 마지막 선택만 1번 렌더링
+# -------------------------------------------------------------------------
+class StatsChart:
+    CACHE_SIZE = 512
+
+    def __init__(self, layout):
+        """layout 에 캔버스를 붙임 - 차트 탭이 처음 보일 때 생성 (matplotlib 도 이때 로드)"""
+        Figure, FigureCanvas = load_matplotlib()
+        self.figure = Figure(figsize=(8, 6), facecolor='white')
+        self.canvas = FigureCanvas(self.figure)
+        layout.addWidget(self.canvas)
+
+        self._cache = OrderedDict()  # (항목 ID, since, until) -> 표시용 값
+        self._shown = None
+        self._build()
+        self.canvas.mpl_connect('resize_event', self._relayout)
+
+    # ---------------------------------------------------------------------
+    # 최초 1회 - 아티스트 생성
+    # ---------------------------------------------------------------------
+    def _build(self):
+        fig = self.figure
+        ax1 = fig.add_subplot(2, 2, 1)
+        ax2 = fig.add_subplot(2, 2, 2)
+        ax3 = fig.add_subplot(2, 2, 3)
+        ax4 = fig.add_subplot(2, 2, 4)
+
+        # [1] 주요 지표 막대 그래프 (전환수 포함)
+        self.title1 = ax1.set_title('', fontweight='bold', fontsize=11, pad=10)
+        ax1.set_ylabel('수치', fontsize=9)
+        self.bars1, self.texts1 = self._bar_group(
+            ax1, ['노출수', '클릭수', '전환수', '비용(천원)'],
+            ['#0d6efd', '#198754', '#dc3545', '#ffc107'], 8)
+        ax1.tick_params(axis='x', rotation=15, labelsize=9)
+
+        # [2] CTR & CVR 비율 비교
+        ax2.set_title('클릭률 & 전환율', fontweight='bold', fontsize=11, pad=10)
+        ax2.set_ylabel('%', fontsize=9)
+        self.bars2, self.texts2 = self._bar_group(ax2, ['CTR', 'CVR'], ['#17a2b8', '#28a745'], 9)
+
+        # [3] CPC & CPA 비용 비교
+        ax3.set_title('평균 클릭비용 & 전환당비용', fontweight='bold', fontsize=11, pad=10)
+        ax3.set_ylabel('원', fontsize=9)
+        self.bars3, self.texts3 = self._bar_group(ax3, ['CPC', 'CPA'], ['#fd7e14', '#dc3545'], 8)
+
+        # [4] 전환 퍼널 도넛 - 조각 3개를 미리 만들고 각도만 바꿈
+        self.wedges, self.wedge_labels, self.wedge_pcts = ax4.pie(
+            [1, 1, 1], labels=['', '', ''], autopct='%1.1f%%', startangle=90,
+            wedgeprops=dict(width=DONUT_RING), textprops={'fontsize': 8})
+        for t in self.wedge_pcts:
+            t.set_color('white')
+            t.set_fontweight('bold')
+        self.title4 = ax4.set_title('전환 퍼널', fontweight='bold', fontsize=11, pad=10)
+        self.no_data = ax4.text(0.5, 0.5, '📊\n데이터 없음', ha='center', va='center',
+                                transform=ax4.transAxes, fontsize=12, color='#999')
+        ax4.set_xlim(-1.4, 1.4)
+        ax4.set_ylim(-1.3, 1.3)
+        ax4.axis('off')
+
+        self.axes = (ax1, ax2, ax3)
+        self._relayout()
+
+    @staticmethod
+    def _bar_group(ax, labels, colors, fontsize):
+        bars = ax.bar(labels, [0] * len(labels), color=colors, **BAR_STYLE)
+        ax.grid(axis='y', alpha=0.3, linestyle='--')
+        texts = [ax.text(bar.get_x() + bar.get_width() / 2., 0, '', fontsize=fontsize, **TEXT_STYLE)
+                 for bar in bars]
+        return bars, texts
+
+    def _relayout(self, *_):
+        # 레이아웃 계산은 비싸므로 생성/크기 변경 시에만
+        try:
+            self.figure.tight_layout(pad=2.0)
+        except ValueError:
+            pass  # 창이 너무 작을 때
+
+    # ---------------------------------------------------------------------
+    # 표시
+    # ---------------------------------------------------------------------
+    def show(self, key, name, stats):
+        imp = stats.get('impCnt', 0)
+        clk = stats.get('clkCnt', 0)
+        cost = stats.get('salesAmt', 0)
+        conv = stats.get('convCnt', 0)
+        src = (name, imp, clk, cost, conv)
+
+        state = self._cache.get(key)
+        if state is None or state['src'] != src:
+            # 같은 기간이라도 재조회로 값이 바뀌었으면 다시 계산
+            state = self._prepare(src)
+            self._cache[key] = state
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+
+        if state is self._shown:
+            return
+        self._apply(state)
+        self._shown = state
+        self.canvas.draw_idle()
+
+    @staticmethod
+    def _prepare(src):
+        """화면에 넣을 값을 미리 계산 (캐시 대상)"""
+        name, imp, clk, cost, conv = src
+        ctr = (clk / imp * 100) if imp > 0 else 0
+        cpc = (cost / clk) if clk > 0 else 0
+        cvr = (conv / clk * 100) if clk > 0 else 0
+        cpa = (cost / conv) if conv > 0 else 0
+
+        values1 = [imp, clk, conv, cost / 1000]
+        values2 = [ctr, cvr]
+        values3 = [cpc, cpa]
+        state = {
+            'src': src,
+            'title': f'{name[:20]}...' if len(name) > 20 else name,
+            'bars': [
+                (values1, [f'{v:,.0f}' for v in values1]),
+                (values2, [f'{v:.2f}%' for v in values2]),
+                (values3, [f'{v:,.0f}' for v in values3]),
+            ],
+        }
+
+        # 노출 -> 클릭 -> 전환 퍼널 (전환이 클릭보다 많게 잡히는 경우도 있어 음수 방지)
+        if imp > 0 and clk > 0 and conv > 0:
+            state['donut_title'] = '전환 퍼널'
+            slices = [(conv, '전환', '#dc3545', 0.08),
+                      (max(clk - conv, 0), '클릭(미전환)', '#ffc107', 0.03),
+                      (max(imp - clk, 0), '노출만', '#e9ecef', 0)]
+        elif imp > 0 and clk > 0:
+            state['donut_title'] = '노출 대비 클릭'
+            slices = [(clk, '클릭', '#28a745', 0.05),
+                      (max(imp - clk, 0), '노출만', '#e9ecef', 0)]
+        else:
+            state['donut_title'] = '전환 퍼널'
+            slices = []
+
+        total = sum(s[0] for s in slices)
+        donut = []
+        theta = 90.0
+        for size, label, color, explode in slices:
+            span = 360.0 * size / total
+            mid = math.radians(theta + span / 2)
+            cx, cy = math.cos(mid), math.sin(mid)
+            donut.append({
+                'theta1': theta, 'theta2': theta + span,
+                'center': (explode * cx, explode * cy),
+                'color': color,
+                'label': label,
+                'label_pos': ((DONUT_LABEL_R + explode) * cx, (DONUT_LABEL_R + explode) * cy),
+                'label_ha': 'left' if cx >= 0 else 'right',
+                'pct': f'{size / total * 100:.1f}%',
+                'pct_pos': ((DONUT_PCT_R + explode) * cx, (DONUT_PCT_R + explode) * cy),
+            })
+            theta += span
+        state['donut'] = donut
+        return state
+
+    def _apply(self, state):
+        self.title1.set_text(state['title'])
+
+        groups = ((self.bars1, self.texts1), (self.bars2, self.texts2), (self.bars3, self.texts3))
+        for ax, (bars, texts), (values, labels) in zip(self.axes, groups, state['bars']):
+            for bar, text, v, label in zip(bars, texts, values, labels):
+                bar.set_height(v)
+                text.set_y(v)
+                text.set_text(label)
+            top = max(values)
+            ax.set_ylim(0, top * 1.15 if top > 0 else 1)
+
+        self.title4.set_text(state['donut_title'])
+        donut = state['donut']
+        self.no_data.set_visible(not donut)
+        for i, (wedge, label, pct) in enumerate(zip(self.wedges, self.wedge_labels, self.wedge_pcts)):
+            if i >= len(donut):
+                wedge.set_visible(False)
+                label.set_visible(False)
+                pct.set_visible(False)
+                continue
+            d = donut[i]
+            wedge.set_center(d['center'])
+            wedge.set_theta1(d['theta1'])
+            wedge.set_theta2(d['theta2'])
+            wedge.set_facecolor(d['color'])
+            label.set_text(d['label'])
+            label.set_position(d['label_pos'])
+            label.set_horizontalalignment(d['label_ha'])
+            pct.set_text(d['pct'])
+            pct.set_position(d['pct_pos'])
+            for artist in (wedge, label, pct):
+                artist.set_visible(True)
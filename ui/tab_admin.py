@@ -1,13 +1,14 @@
 import sys
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget, 
-    QTableWidgetItem, QHeaderView, QPushButton, QFrame, 
-    QMessageBox, QSplitter, QGroupBox, QMenu, QComboBox
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
+    QHeaderView, QPushButton, QFrame, 
+    QMessageBox, QSplitter, QGroupBox, QMenu, QComboBox, QTableView
 )
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QColor, QBrush
+from PyQt6.QtGui import QColor
 
 from api.api_client import api
+from ui.table_models import ColumnarTableModel
 
 class AdminDashboardWidget(QWidget):
     def __init__(self):
@@ -33,9 +34,13 @@ class AdminDashboardWidget(QWidget):
         left_box = QGroupBox("📡 실시간 클라이언트 모니터링")
         left_layout = QVBoxLayout(left_box)
         
-        self.live_table = QTableWidget()
-        self.live_table.setColumnCount(4)
-        self.live_table.setHorizontalHeaderLabels(["유저명", "상태 (Activity)", "최근 접속", "라이센스"])
+        self.live_model = ColumnarTableModel(
+            ["user", "status", "last_seen", "expiry"], ["유저명", "상태 (Activity)", "최근 접속", "라이센스"],
+            foregrounds={"status": lambda r: QColor("green" if r['status'].startswith("🟢") else "gray")},
+            parent=self
+        )
+        self.live_table = QTableView()
+        self.live_table.setModel(self.live_model)
         self.live_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         left_layout.addWidget(self.live_table)
         
@@ -43,9 +48,16 @@ class AdminDashboardWidget(QWidget):
         right_box = QGroupBox("👥 회원 승인 관리")
         right_layout = QVBoxLayout(right_box)
         
-        self.user_table = QTableWidget()
-        self.user_table.setColumnCount(4)
-        self.user_table.setHorizontalHeaderLabels(["ID", "이름", "권한", "관리"])
+        # [수정] 행마다 버튼 위젯을 만들지 않고 '관리' 셀 클릭 시 메뉴 표시
+        self.user_model = ColumnarTableModel(
+            ["username", "name", "role", "action"], ["ID", "이름", "권한", "관리"],
+            foregrounds={"action": lambda r: QColor("#007bff")},
+            key="id", hidden=("id",), parent=self
+        )
+        self.users = []
+        self.user_table = QTableView()
+        self.user_table.setModel(self.user_model)
+        self.user_table.clicked.connect(self.on_user_clicked)
         self.user_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         right_layout.addWidget(self.user_table)
         
@@ -71,50 +83,33 @@ class AdminDashboardWidget(QWidget):
         self.update_user_table(all_users)
 
     def update_live_table(self, data):
-        self.live_table.setRowCount(len(data))
-        for i, row in enumerate(data):
-            # username
-            self.live_table.setItem(i, 0, QTableWidgetItem(f"{row['username']} ({row['name']})"))
-            
+        rows = []
+        for row in data:
             # status (Online/Offline 색상 구분)
-            status_item = QTableWidgetItem(row['status'])
-            if row['is_online']:
-                status_item.setForeground(QBrush(QColor("green")))
-                status_item.setText(f"🟢 {row['status']}")
-            else:
-                status_item.setForeground(QBrush(QColor("gray")))
-                status_item.setText(f"⚫ {row['status']}")
-            self.live_table.setItem(i, 1, status_item)
-            
-            # time
-            self.live_table.setItem(i, 2, QTableWidgetItem(row['last_seen']))
-            
-            # license
+            icon = "🟢" if row['is_online'] else "⚫"
             expiry = row.get('expiry') or "만료됨"
-            self.live_table.setItem(i, 3, QTableWidgetItem(str(expiry).split('T')[0]))
+            rows.append({
+                "user": f"{row['username']} ({row['name']})",
+                "status": f"{icon} {row['status']}",
+                "last_seen": row['last_seen'],
+                "expiry": str(expiry).split('T')[0],
+            })
+        self.live_model.set_rows(rows)
 
     def update_user_table(self, users):
-        self.user_table.setRowCount(len(users))
-        for i, u in enumerate(users):
-            self.user_table.setItem(i, 0, QTableWidgetItem(u['username']))
-            self.user_table.setItem(i, 1, QTableWidgetItem(u['name']))
-            
+        self.users = list(users)
+        rows = []
+        for u in self.users:
             role = "관리자" if u['is_superuser'] else ("유료회원" if u['is_paid'] else "대기회원")
-            self.user_table.setItem(i, 2, QTableWidgetItem(role))
-            
-            # [수정] 모든 회원에 대해 액션 버튼 제공 (대기회원 + 기존 유료회원)
-            btn_container = QWidget()
-            btn_layout = QHBoxLayout(btn_container)
-            btn_layout.setContentsMargins(2, 2, 2, 2)
-            
-            action_btn = QPushButton("⚙️ 관리")
-            action_btn.setStyleSheet("background-color: #007bff; color: white; border-radius: 4px; padding: 5px;")
-            action_btn.setFixedWidth(80)
-            action_btn.clicked.connect(lambda _, uid=u['id'], idx=i: self.show_action_menu(uid, u, idx))
-            btn_layout.addWidget(action_btn)
-            btn_layout.addStretch()
-            
-            self.user_table.setCellWidget(i, 3, btn_container)
+            # [수정] 모든 회원에 대해 액션 메뉴 제공 (대기회원 + 기존 유료회원)
+            rows.append({"username": u['username'], "name": u['name'], "role": role, "action": "⚙️ 관리", "id": u['id']})
+        self.user_model.set_rows(rows)
+
+    def on_user_clicked(self, index):
+        if index.column() != 3 or index.row() >= len(self.users):
+            return
+        u = self.users[index.row()]
+        self.show_action_menu(u['id'], u, index.row())
 
     def approve_user(self, user_id):
         if QMessageBox.question(self, "승인", "해당 회원의 사용을 승인하시겠습니까?") == QMessageBox.StandardButton.Yes:
@@ -6,49 +6,18 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QTreeWidget, QTreeWidgetItem, QGroupBox, QFormLayout, 
     QSpinBox, QCheckBox, QTableWidget, QTableWidgetItem, 
-    QHeaderView, QMessageBox, QSplitter, QProgressBar, QDoubleSpinBox, QComboBox
+    QHeaderView, QMessageBox, QSplitter, QProgressBar, QDoubleSpinBox, QComboBox,
+    QTableView
 )
 from PyQt6.QtWidgets import QTreeWidgetItemIterator
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QColor, QBrush, QFont
 
 from api.api_client import api
-
-# -------------------------------------------------------------------------
-# [데이터 로더] 안전한 순차 로딩 (1014 에러 방지)
-# -------------------------------------------------------------------------
-class CampaignLoader(QThread):
-    data_signal = pyqtSignal(list)
-    
-    def run(self):
-        try:
-            # 1. 캠페인 조회
-            camps = api.get_campaigns()
-            if not camps:
-                self.data_signal.emit([])
-                return
-
-            result_tree = []
-            # 2. 순차적으로 하나씩 조회 (병렬 처리 제거)
-            for c in camps:
-                camp_data = {
-                    'id': c['nccCampaignId'],
-                    'name': c['name'],
-                    'groups': []
-                }
-                groups = api.get_adgroups(c['nccCampaignId'])
-                for g in groups:
-                    camp_data['groups'].append({
-                        'id': g['nccAdgroupId'],
-                        'name': g['name']
-                    })
-                result_tree.append(camp_data)
-                # [중요] 0.2초 대기
-                time.sleep(0.2)
-            
-            self.data_signal.emit(result_tree)
-        except Exception:
-            self.data_signal.emit([])
+from ui.table_models import ColumnarTableModel
+from logic.event_bridge import BatchingBridge
+from logic.account_tree import AccountTreeLoader, account_tree
+from logic.bid_history import bid_history
 
 # -------------------------------------------------------------------------
 # [입찰 워커] 벌크 업데이트 + 속도 제한 적용
@@ -70,6 +39,8 @@ class BidWorker(QThread):
         self.consecutive_errors = 0
         self.max_consecutive_errors = 5
         self.cooldown_map = self._load_cooldown()
+        # 서버 업로드 대기 중인 입찰 변경 이력
+        self.history_buffer = []
 
     def _load_cooldown(self):
         try:
@@ -107,6 +78,23 @@ class BidWorker(QThread):
     def _record_adjustment(self, keyword_id):
         self.cooldown_map[keyword_id] = datetime.now().isoformat()
 
+    HISTORY_UPLOAD_SIZE = 500
+    HISTORY_BUFFER_LIMIT = 20000
+
+    def _upload_history(self, force=False):
+        """입찰 변경 이력을 모아서 서버로 일괄 업로드 (실패 시 다음 기회에 재시도)"""
+        if not self.history_buffer: return
+        if not force and len(self.history_buffer) < self.HISTORY_UPLOAD_SIZE: return
+        # 서버 한 번 요청 한도(BID_HISTORY_MAX_BATCH) 단위로 나눠 보내고, 받아들여진 묶음만 버퍼에서 제거
+        while self.history_buffer:
+            batch = self.history_buffer[:api.BID_HISTORY_MAX_BATCH]
+            if not api.upload_bid_history(batch):
+                break
+            del self.history_buffer[:len(batch)]
+        if len(self.history_buffer) > self.HISTORY_BUFFER_LIMIT:
+            # 서버 장애가 길어질 때 메모리가 무한히 늘지 않도록 오래된 이력부터 버림
+            self.history_buffer = self.history_buffer[-self.HISTORY_BUFFER_LIMIT:]
+
     def run(self):
         while self.is_running:
             total_targets = len(self.target_list)
@@ -132,71 +120,40 @@ class BidWorker(QThread):
                 self.status_signal.emit(f"분석 중: {cfg['name']}")
                 
                 try:
-                    # [핵심 변경] 100개씩 조회하고 처리하는 방식
-                    chunk_size = 100
+                    # [핵심 변경] 100개 페이지 스트리밍 (다음 페이지는 처리 중에 미리 조회, 1014는 내부 재시도)
                     processed_count = 0
-                    base_search_id = None  # 페이징을 위한 ID
                     
-                    while self.is_running:
-                        # 100개씩 키워드 조회
-                        keywords = api.get_keywords_paged(gid, base_search_id, chunk_size)
+                    for page in api.iter_keyword_pages(gid, record_size=100):
+                        if not self.is_running: break
                         
                         # API 응답 확인 (밴/한도 초과 감지)
-                        if keywords is None or (isinstance(keywords, dict) and keywords.get('error')):
-                            error_code = keywords.get('code') if isinstance(keywords, dict) else None
-                            
-                            # 1014 오류 (한도 초과) - 재시도 전에 충분히 대기
-                            if error_code == 1014:
-                                self.status_signal.emit(f"⏸️ API 한도 초과 (1014). 30초 대기 후 재시도...")
-                                time.sleep(30)
-                                self.consecutive_errors = 0  # 한도 초과는 일시적이므로 카운터 리셋
-                                continue
-                            
+                        if page.error:
                             self.consecutive_errors += 1
                             self.status_signal.emit(f"⚠️ API 오류 ({self.consecutive_errors}/{self.max_consecutive_errors}): {cfg['name']}")
                             time.sleep(2)
                             break
                         
+                        keywords = page.keywords
+                        
                         # 키워드가 없으면 종료
-                        if not keywords or len(keywords) == 0:
+                        if not keywords:
                             break
                         
-                        # 다음 페이지를 위한 base_search_id 업데이트
-                        if len(keywords) == chunk_size:
-                            base_search_id = keywords[-1]['nccKeywordId']
-                        else:
-                            base_search_id = None  # 마지막 페이지
-                        
                         # API 속도 제한 - 키워드 조회 후 대기
                         time.sleep(0.5)
                         
                         # 유효한 키워드만 필터링
-                        valid_kwds = [k for k in keywords if k['status'] in ['ELIGIBLE', 'ON']]
+                        valid_kwds = [k for k in keywords if k.is_active]
                         if not valid_kwds:
                             continue
                         
-                        kwd_ids = [k['nccKeywordId'] for k in valid_kwds]
+                        kwd_ids = [k.id for k in valid_kwds]
                         processed_count += len(valid_kwds)
                         
                         print(f"[AUTOBID] {cfg['name']}: {len(kwd_ids)}개 유효 키워드 (총 {processed_count}개 처리 중)")
                         
-                        # 통계 조회
-                        stats_map = api.get_stats(kwd_ids)
-
-                        # 에러 응답 처리
-                        if isinstance(stats_map, dict) and stats_map.get('error'):
-                            error_code = stats_map.get('code')
-                            if error_code == 1014:
-                                print(f"[AUTOBID] API 한도 초과 (1014) - 30초 대기")
-                                self.status_signal.emit(f"⏸️ 통계 API 한도 초과. 30초 대기...")
-                                time.sleep(30)
-                                self.consecutive_errors = 0
-                                continue
-                            print(f"[AUTOBID_ERROR] 통계 조회 오류 - 코드: {error_code}")
-                            self.consecutive_errors += 1
-                            self.status_signal.emit(f"⚠️ 통계 조회 실패 ({self.consecutive_errors}/{self.max_consecutive_errors})")
-                            time.sleep(2)
-                            continue
+                        # 통계 조회 ({kid: StatRow})
+                        stats_map = api.get_stat_rows(kwd_ids)
 
                         # 통계 없으면 빈 딕셔너리 (신규 키워드 탐색 모드)
                         if not stats_map:
@@ -207,27 +164,8 @@ class BidWorker(QThread):
                         print(f"[AUTOBID] {cfg['name']}: 통계 {len(stats_map)}개 수집")
                         time.sleep(1.0)
 
-                        # 키워드 데이터 수집
-                        all_keywords = []
-                        keyword_data_map = {}
-
-                        for k in valid_kwds:
-                            kid = k['nccKeywordId']
-                            cur_bid = k['bidAmt']
-                            stat = stats_map.get(kid, {})
-                            cur_rank = stat.get('avgRnk', 0.0)
-                            imp_cnt = stat.get('impCnt', 0)
-                            keyword = k['keyword']
-
-                            keyword_data_map[keyword] = {
-                                'kid': kid,
-                                'cur_bid': cur_bid,
-                                'cur_rank': cur_rank,
-                                'imp_cnt': imp_cnt
-                            }
-                            all_keywords.append(keyword)
-
                         # estimate API 호출
+                        all_keywords = [k.keyword for k in valid_kwds]
                         estimate_map = {}
                         if all_keywords:
                             print(f"[AUTOBID] {cfg['name']}: {len(all_keywords)}개 키워드 estimate 조회")
@@ -235,31 +173,35 @@ class BidWorker(QThread):
                             estimate_map = api.get_estimate_bid(all_keywords, target_position=target_position)
                             time.sleep(0.5)
 
-                        # 입찰가 계산
+                        # 입찰가 계산 (Keyword 레코드 + StatRow 직접 사용)
                         for k in valid_kwds:
-                            keyword = k['keyword']
-                            data = keyword_data_map[keyword]
-                            estimated_bid = estimate_map.get(keyword) if estimate_map else None
+                            stat = stats_map.get(k.id)
+                            cur_rank = stat.avg_rnk if stat else 0.0
+                            imp_cnt = stat.imp_cnt if stat else 0
+                            estimated_bid = estimate_map.get(k.keyword) if estimate_map else None
 
                             new_bid, reason = self.calculate_bid_with_data(
-                                data['cur_bid'], data['cur_rank'], data['imp_cnt'],
-                                estimated_bid, cfg, data['kid']
+                                k.bid_amt, cur_rank, imp_cnt,
+                                estimated_bid, cfg, k.id
                             )
 
-                            if new_bid != data['cur_bid']:
+                            if new_bid != k.bid_amt:
                                 bulk_updates.append({
-                                    "nccKeywordId": data['kid'],
+                                    "nccKeywordId": k.id,
                                     "nccAdgroupId": gid,
                                     "bidAmt": new_bid,
                                     "useGroupBidAmt": False
                                 })
                                 logs_buffer.append({
                                     "time": datetime.now().strftime("%H:%M:%S"),
+                                    "ts": datetime.now().isoformat(),
+                                    "gid": gid,
+                                    "kid": k.id,
                                     "group": cfg['name'],
-                                    "keyword": keyword,
-                                    "old": data['cur_bid'],
+                                    "keyword": k.keyword,
+                                    "old": k.bid_amt,
                                     "new": new_bid,
-                                    "rank": round(data['cur_rank'], 1) if data['cur_rank'] else 0,
+                                    "rank": round(cur_rank, 1) if cur_rank else 0,
                                     "reason": reason
                                 })
                         
@@ -272,10 +214,6 @@ class BidWorker(QThread):
                         
                         # 다음 청크로 이동 전 대기 (API 한도 방지)
                         time.sleep(2.0)
-                        
-                        # 마지막 페이지면 종료
-                        if base_search_id is None:
-                            break
 
                 except Exception as e:
                     print(f"Err {gid}: {e}")
@@ -286,10 +224,13 @@ class BidWorker(QThread):
                 
                 self.row_status_signal.emit(idx, "Waiting")
                 self._save_cooldown()
+                self._upload_history()
 
                 # [중요] 각 그룹 처리 후 추가 대기 (API 한도 방지) - 3초로 증가
                 time.sleep(3.0)
 
+            self._upload_history(force=True)
+            api.log_transfer_report()
             if not self.is_loop: break
             
             self.status_signal.emit(f"사이클 완료. {self.interval}분 대기...")
@@ -298,6 +239,7 @@ class BidWorker(QThread):
                 if not self.is_running: break
                 time.sleep(1)
 
+        self._upload_history(force=True)
         self.finished_signal.emit()
 
     # [수정] BidWorker의 flush_updates 메서드 수정 (대기 시간 증가)
@@ -308,8 +250,22 @@ class BidWorker(QThread):
         try:
             res = api.update_keywords_bulk(updates)
             if isinstance(res, list):
+                events = []
                 for log in logs:
                     self.log_signal.emit(log)
+                    events.append({
+                        "ts": log['ts'],
+                        "adgroup_id": log['gid'],
+                        "group_name": log['group'],
+                        "keyword_id": log['kid'],
+                        "keyword": log['keyword'],
+                        "old_bid": log['old'],
+                        "new_bid": log['new'],
+                        "rank": log['rank'],
+                        "reason": log['reason']
+                    })
+                self.history_buffer.extend(events)
+                bid_history.append(events)  # 리포트용 로컬 이력
                 # 성공 시 오류 카운터 리셋
                 self.consecutive_errors = 0
             elif isinstance(res, dict) and res.get('error'):
@@ -437,67 +393,70 @@ class BulkBidFixWorker(QThread):
         try:
             self.status_signal.emit("캠페인 그룹 조회 중...")
             
-            # 1. 캠페인의 모든 그룹 조회
-            groups = api.get_adgroups(self.campaign_id)
+            # 1. 캠페인의 모든 그룹 (공용 계정 트리 스냅샷 - 최신이면 API 호출 없음)
+            account_tree.load()
+            groups = account_tree.groups_of(self.campaign_id)
             if not groups:
                 self.status_signal.emit("그룹이 없습니다.")
                 self.finished_signal.emit()
                 return
             
-            total_keywords = 0
-            processed = 0
-            all_updates = []
+            group_names = {g.id: g.name for g in groups}
+            done_groups = set()
+            total_updates = 0
+            pending = []
             
-            # 2. 각 그룹의 모든 키워드 조회
-            for g in groups:
+            # 2. 모든 그룹의 키워드를 페이지 단위로 스트리밍하며 100개씩 바로 반영 (전체 목록을 쌓지 않음)
+            for page in api.iter_keyword_pages(list(group_names)):
                 if not self.is_running: break
                 
-                gid = g['nccAdgroupId']
-                gname = g['name']
-                keywords = api.get_keywords(gid)
+                gid = page.adgroup_id
+                gname = group_names.get(gid, gid)
                 
-                if keywords:
-                    for k in keywords:
-                        if k['status'] in ['ELIGIBLE', 'ON']:
-                            kid = k['nccKeywordId']
-                            old_bid = k['bidAmt']
-                            
-                            # 기존 금액과 다를 때만 업데이트 추가
-                            if old_bid != self.fixed_bid_amt:
-                                all_updates.append({
-                                    'nccKeywordId': kid,
-                                    'nccAdgroupId': gid,
-                                    'bidAmt': self.fixed_bid_amt
-                                })
-                                
-                                # 로그 출력
-                                self.log_signal.emit({
-                                    'time': datetime.now().strftime("%H:%M:%S"),
-                                    'group': gname,
-                                    'keyword': k['keyword'],
-                                    'old': old_bid,
-                                    'new': self.fixed_bid_amt,
-                                    'reason': f'일괄 설정'
-                                })
-                            
-                            total_keywords += 1
-                            processed += 1
-                            self.progress_signal.emit(processed, len(groups))
+                if page.error:
+                    self.status_signal.emit(f"⚠️ {gname} 키워드 조회 실패 ({page.error.get('code')})")
                 
-                time.sleep(0.2)  # 속도 제한
-            
-            # 3. 일괄 업데이트
-            if all_updates:
-                self.status_signal.emit(f"업데이트 중... ({len(all_updates)}개 키워드)")
+                for k in page.keywords:
+                    if not k.is_active:
+                        continue
+                    # 기존 금액과 다를 때만 업데이트 추가
+                    if k.bid_amt != self.fixed_bid_amt:
+                        pending.append({
+                            'nccKeywordId': k.id,
+                            'nccAdgroupId': gid,
+                            'bidAmt': self.fixed_bid_amt
+                        })
+                        
+                        # 로그 출력
+                        self.log_signal.emit({
+                            'time': datetime.now().strftime("%H:%M:%S"),
+                            'group': gname,
+                            'keyword': k.keyword,
+                            'old': k.bid_amt,
+                            'new': self.fixed_bid_amt,
+                            'reason': f'일괄 설정'
+                        })
                 
-                # 100개씩 묶어서 업데이트
-                for i in range(0, len(all_updates), 100):
-                    if not self.is_running: break
-                    chunk = all_updates[i:i+100]
-                    api.update_keywords_bulk(chunk)
+                # 3. 100개 모이면 즉시 업데이트
+                while len(pending) >= 100 and self.is_running:
+                    self.status_signal.emit(f"업데이트 중... (누적 {total_updates + 100}개 키워드)")
+                    api.update_keywords_bulk(pending[:100])
+                    total_updates += 100
+                    pending = pending[100:]
                     time.sleep(0.5)  # 요청 간격
                 
-                self.status_signal.emit(f"완료! 총 {len(all_updates)}개 키워드 업데이트")
+                # 그룹의 마지막 페이지를 받으면 진행률 갱신
+                if page.cursor is None or page.cursor[0] != gid:
+                    done_groups.add(gid)
+                    self.progress_signal.emit(len(done_groups), len(groups))
+                    time.sleep(0.2)  # 속도 제한
+            
+            if pending and self.is_running:
+                api.update_keywords_bulk(pending)
+                total_updates += len(pending)
+            
+            if total_updates:
+                self.status_signal.emit(f"완료! 총 {total_updates}개 키워드 업데이트")
             else:
                 self.status_signal.emit("변경할 키워드가 없습니다.")
             
@@ -509,16 +468,41 @@ class BulkBidFixWorker(QThread):
     def stop(self):
         self.is_running = False
 
+# -------------------------------------------------------------------------
+# [입찰 설정 동기화 워커] 서버 입찰 설정 delta 조회 (UI 스레드 블로킹 방지)
+# -------------------------------------------------------------------------
+class BidRuleSyncWorker(QThread):
+    data_signal = pyqtSignal(bool, object)  # (서버 동기화 여부, {그룹ID: 규칙})
+
+    def run(self):
+        synced = bool(api.server_token)
+        try:
+            rules = dict(api.sync_bid_rules())
+        except Exception as e:
+            print(f"[BID_RULES] 입찰 설정 동기화 오류: {e}")
+            synced, rules = False, {}
+        self.data_signal.emit(synced, rules)
+
 # -------------------------------------------------------------------------
 # [메인 UI]
 # -------------------------------------------------------------------------
 class AutoBidderWidget(QWidget):
+    LOG_MAX_ROWS = 5000  # 입찰 로그 보관 행 수 (초과 시 오래된 행부터 제거)
+
     def __init__(self):
         super().__init__()
         self.worker = None
         self.loader = None
+        self.rule_sync = None
         self.added_groups_row = {} 
         self.init_ui()
+        # 워커 이벤트 묶음 전달 (로그 / 상태 문구 / 행 상태)
+        self.log_bridge = BatchingBridge(parent=self)
+        self.log_bridge.batch_signal.connect(self.add_logs)
+        self.status_bridge = BatchingBridge(coalesce=True, parent=self)
+        self.status_bridge.batch_signal.connect(lambda batch: self.lbl_status.setText(batch[-1]))
+        self.row_bridge = BatchingBridge(parent=self)
+        self.row_bridge.batch_signal.connect(self.update_row_colors)
         
     def init_ui(self):
         layout = QHBoxLayout(self)
@@ -625,9 +609,16 @@ class AutoBidderWidget(QWidget):
         self.lbl_status.setAlignment(Qt.AlignmentFlag.AlignCenter)
         right_layout.addWidget(self.lbl_status)
         
-        self.table_log = QTableWidget()
-        self.table_log.setColumnCount(6)
-        self.table_log.setHorizontalHeaderLabels(["시간", "그룹", "키워드", "기존", "변경", "사유"])
+        # [수정] 로그는 최근 LOG_MAX_ROWS 행만 보관하는 링 버퍼 모델 (QTableWidgetItem 미사용)
+        self.log_model = ColumnarTableModel(
+            ["time", "group", "keyword", "old", "new", "reason"],
+            ["시간", "그룹", "키워드", "기존", "변경", "사유"],
+            foregrounds={"new": lambda r: QColor("red" if r['new'] > r['old'] else "blue")},
+            max_rows=self.LOG_MAX_ROWS, parent=self
+        )
+        self.table_log = QTableView()
+        self.table_log.setModel(self.log_model)
+        self.table_log.verticalHeader().setDefaultSectionSize(22)
         self.table_log.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         right_layout.addWidget(self.table_log)
         
@@ -639,34 +630,89 @@ class AutoBidderWidget(QWidget):
         layout.addWidget(splitter)
 
     def start_loading(self):
+        if self.loader and self.loader.isRunning(): return
+        # 이미 불러온 상태에서 다시 누르면 새로 조회, 처음이면 공용 스냅샷 사용
+        force = self.tree.topLevelItemCount() > 0
         self.tree.clear()
+        self.combo_camp_bulk.clear()
+        self.combo_camp_bulk.addItem("캠페인 선택", "")
         self.lbl_status.setText("로딩 중...")
-        self.loader = CampaignLoader()
+        self.loader = AccountTreeLoader(force=force)
+        self.loader.campaign_signal.connect(self.add_campaign_item)
         self.loader.data_signal.connect(self.on_loaded)
         self.loader.start()
 
+    def add_campaign_item(self, camp, groups):
+        """캠페인 하나씩 도착하는 대로 트리/콤보박스에 추가"""
+        c_item = QTreeWidgetItem(self.tree)
+        c_item.setText(0, camp.name)
+        c_item.setFlags(c_item.flags() | Qt.ItemFlag.ItemIsAutoTristate | Qt.ItemFlag.ItemIsUserCheckable)
+        c_item.setCheckState(0, Qt.CheckState.Unchecked)
+        c_item.setExpanded(True)
+        # 콤보박스에 캠페인 ID 추가
+        self.combo_camp_bulk.addItem(camp.name, camp.id)
+        for g in groups:
+            g_item = QTreeWidgetItem(c_item)
+            g_item.setText(0, g.name)
+            g_item.setData(0, Qt.ItemDataRole.UserRole, g.id)
+            g_item.setFlags(g_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            g_item.setCheckState(0, Qt.CheckState.Unchecked)
+        self.lbl_status.setText(f"로딩 중... (캠페인 {self.tree.topLevelItemCount()}개)")
+
     def on_loaded(self, data):
         self.lbl_status.setText(f"로딩 완료. (캠페인 {len(data)}개)")
         if not data: return
-        
-        # 콤보박스에 캠페인 추가
-        self.combo_camp_bulk.clear()
-        self.combo_camp_bulk.addItem("캠페인 선택", "")
-        
-        for c in data:
-            c_item = QTreeWidgetItem(self.tree)
-            c_item.setText(0, c['name'])
-            c_item.setFlags(c_item.flags() | Qt.ItemFlag.ItemIsAutoTristate | Qt.ItemFlag.ItemIsUserCheckable)
-            c_item.setCheckState(0, Qt.CheckState.Unchecked)
-            c_item.setExpanded(True)
-            # 콤보박스에 캠페인 ID 추가
-            self.combo_camp_bulk.addItem(c['name'], c['id'])
-            for g in c['groups']:
-                g_item = QTreeWidgetItem(c_item)
-                g_item.setText(0, g['name'])
-                g_item.setData(0, Qt.ItemDataRole.UserRole, g['id'])
-                g_item.setFlags(g_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                g_item.setCheckState(0, Qt.CheckState.Unchecked)
+
+        # 서버에 저장된 입찰 설정으로 대기열 복원 (조회는 백그라운드)
+        if self.rule_sync and self.rule_sync.isRunning(): return
+        self.rule_sync = BidRuleSyncWorker()
+        self.rule_sync.data_signal.connect(self.restore_saved_rules)
+        self.rule_sync.start()
+
+    def restore_saved_rules(self, synced, rules):
+        """서버 입찰 설정(버전 동기화)으로 대기열 복원 - 서버에서 삭제된 그룹은 대기열에서도 제거"""
+        removed = 0
+        # 입찰 중에는 워커가 행 번호로 상태를 갱신하므로 행 삭제는 다음 동기화로 미룸
+        if synced and not (self.worker and self.worker.isRunning()):
+            for r in range(self.table_target.rowCount() - 1, -1, -1):
+                if self.table_target.item(r, 7).text() not in rules:
+                    self.table_target.removeRow(r)
+                    removed += 1
+            if removed:
+                self.added_groups_row = {self.table_target.item(r, 7).text(): r for r in range(self.table_target.rowCount())}
+
+        restored = 0
+        for gid, rule in rules.items():
+            if gid in self.added_groups_row:
+                row = self.added_groups_row[gid]
+            else:
+                row = self.table_target.rowCount()
+                self.table_target.insertRow(row)
+                self.table_target.setItem(row, 6, QTableWidgetItem("Ready"))
+                self.table_target.setItem(row, 7, QTableWidgetItem(gid))
+                self.added_groups_row[gid] = row
+                restored += 1
+            self.table_target.setItem(row, 0, QTableWidgetItem(rule.get('name') or gid))
+            self.table_target.setItem(row, 1, QTableWidgetItem(str(rule['target_rank'])))
+            self.table_target.setItem(row, 2, QTableWidgetItem(str(rule['max_bid'])))
+            self.table_target.setItem(row, 3, QTableWidgetItem(str(rule['bid_step'])))
+            self.table_target.setItem(row, 4, QTableWidgetItem(str(rule['probe_limit'])))
+            self.table_target.setItem(row, 5, QTableWidgetItem(str(rule['min_imp'])))
+        msgs = ([f"저장된 입찰 설정 {restored}개 복원"] if restored else []) + ([f"삭제된 설정 {removed}개 제거"] if removed else [])
+        if msgs:
+            self.lbl_status.setText(", ".join(msgs))
+
+    def row_to_rule(self, r):
+        return {
+            'adgroup_id': self.table_target.item(r, 7).text(),
+            'name': self.table_target.item(r, 0).text(),
+            'target_rank': int(self.table_target.item(r, 1).text()),
+            'max_bid': int(self.table_target.item(r, 2).text()),
+            'bid_step': int(self.table_target.item(r, 3).text()),
+            'probe_limit': int(self.table_target.item(r, 4).text()),
+            'min_imp': int(self.table_target.item(r, 5).text()),
+            'min_bid': 70
+        }
 
     def add_or_update_groups(self):
         target = self.sb_target.value()
@@ -676,6 +722,7 @@ class AutoBidderWidget(QWidget):
         min_imp = self.sb_imp.value()
         
         cnt = 0
+        changed_rows = []
         iterator = QTreeWidgetItemIterator(self.tree, QTreeWidgetItemIterator.IteratorFlag.Checked)
         while iterator.value():
             item = iterator.value()
@@ -690,6 +737,7 @@ class AutoBidderWidget(QWidget):
                         self.table_target.setItem(row, 3, QTableWidgetItem(str(step)))
                         self.table_target.setItem(row, 4, QTableWidgetItem(str(probe)))
                         self.table_target.setItem(row, 5, QTableWidgetItem(str(min_imp)))
+                        changed_rows.append(row)
                 else:
                     r = self.table_target.rowCount()
                     self.table_target.insertRow(r)
@@ -702,19 +750,27 @@ class AutoBidderWidget(QWidget):
                     self.table_target.setItem(r, 6, QTableWidgetItem("Ready"))
                     self.table_target.setItem(r, 7, QTableWidgetItem(gid))
                     self.added_groups_row[gid] = r
+                    changed_rows.append(r)
                 cnt += 1
             iterator += 1
         
         if cnt == 0: QMessageBox.warning(self, "알림", "체크된 그룹이 없습니다.")
-        else: self.lbl_status.setText(f"{cnt}개 적용 완료")
+        else:
+            # 변경된 그룹 설정만 서버에 저장 (재시작 후 복원용)
+            saved = api.save_bid_rules(rules=[self.row_to_rule(r) for r in changed_rows])
+            self.lbl_status.setText(f"{cnt}개 적용 완료" + ("" if saved else " (서버 저장 실패)"))
 
     def remove_rows(self):
         rows = sorted(set(i.row() for i in self.table_target.selectedIndexes()), reverse=True)
+        deleted_gids = []
         for r in rows:
             gid = self.table_target.item(r, 7).text()
             if gid in self.added_groups_row: del self.added_groups_row[gid]
+            deleted_gids.append(gid)
             self.table_target.removeRow(r)
         self.added_groups_row = {self.table_target.item(r, 7).text(): r for r in range(self.table_target.rowCount())}
+        if deleted_gids:
+            api.save_bid_rules(deleted=deleted_gids)
 
     def toggle_bidding(self):
         if self.worker and self.worker.isRunning():
@@ -745,13 +801,25 @@ class AutoBidderWidget(QWidget):
         except: return QMessageBox.warning(self, "오류", "테이블 값 오류")
 
         self.worker = BidWorker(target_list, self.chk_loop.isChecked(), self.sb_interval.value())
-        self.worker.log_signal.connect(self.add_log)
-        self.worker.status_signal.connect(self.lbl_status.setText)
-        self.worker.row_status_signal.connect(self.update_row_color)
+        # 종료 문구보다 남은 로그/상태가 먼저 반영되도록 flush 를 먼저 연결
+        self.worker.finished_signal.connect(self.flush_bridges)
         self.worker.finished_signal.connect(lambda: self.lbl_status.setText("완료"))
+        self.log_bridge.attach(self.worker.log_signal)
+        self.status_bridge.attach(self.worker.status_signal)
+        self.row_bridge.attach(self.worker.row_status_signal)
         self.worker.start()
         self.btn_start.setText("🛑 중단"); self.btn_start.setStyleSheet("background-color: #dc3545; color: white; font-weight: bold;")
 
+    def flush_bridges(self):
+        self.log_bridge.flush()
+        self.status_bridge.flush()
+        self.row_bridge.flush()
+
+    def update_row_colors(self, batch):
+        """ batch: [(row, 상태), ...] - 행별 마지막 상태만 반영 """
+        for row, status in dict(batch).items():
+            self.update_row_color(row, status)
+
     def update_row_color(self, row, status):
         if row >= self.table_target.rowCount(): return
         color = QColor("blue") if status == "Running" else QColor("black")
@@ -759,19 +827,9 @@ class AutoBidderWidget(QWidget):
         self.table_target.item(row, 0).setFont(QFont("Malgun Gothic", 9, QFont.Weight.Bold if status == "Running" else QFont.Weight.Normal))
         self.table_target.setItem(row, 6, QTableWidgetItem(status))
 
-    def add_log(self, data):
-        r = self.table_log.rowCount()
-        self.table_log.insertRow(r)
-        self.table_log.setItem(r, 0, QTableWidgetItem(data['time']))
-        self.table_log.setItem(r, 1, QTableWidgetItem(data['group']))
-        self.table_log.setItem(r, 2, QTableWidgetItem(data['keyword']))
-        self.table_log.setItem(r, 3, QTableWidgetItem(str(data['old'])))
-        new_item = QTableWidgetItem(str(data['new']))
-        new_item.setForeground(QBrush(QColor("red" if data['new'] > data['old'] else "blue")))
-        self.table_log.setItem(r, 4, new_item)
-        self.table_log.setItem(r, 5, QTableWidgetItem(data['reason']))
+    def add_logs(self, batch):
+        self.log_model.append_rows(batch)
         self.table_log.scrollToBottom()
-        if r > 1000: self.table_log.removeRow(0)
 
     def start_bulk_bid_fix(self):
         """일괄 입찰가 설정 시작"""
@@ -791,9 +849,10 @@ class AutoBidderWidget(QWidget):
         
         # 워커 실행
         self.bulk_bid_worker = BulkBidFixWorker(camp_id, bid_amt)
-        self.bulk_bid_worker.log_signal.connect(self.add_log)
-        self.bulk_bid_worker.status_signal.connect(self.lbl_status.setText)
+        self.bulk_bid_worker.finished_signal.connect(self.flush_bridges)
         self.bulk_bid_worker.finished_signal.connect(lambda: self.btn_bulk_fix.setEnabled(True))
+        self.log_bridge.attach(self.bulk_bid_worker.log_signal)
+        self.status_bridge.attach(self.bulk_bid_worker.status_signal)
         self.bulk_bid_worker.start()
         
         self.btn_bulk_fix.setEnabled(False)
@@ -10,6 +10,7 @@ from PyQt6.QtCore import Qt, QSize, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QColor, QAction
 
 from api.api_client import api
+from logic.account_tree import AccountTreeLoader, account_tree, load_tree_async
 
 # -------------------------------------------------------------------------
 # [커스텀 위젯] 소재 카드 (리스트에 표시될 아이템)
@@ -143,56 +144,52 @@ class BulkCopyDialog(QDialog):
         self.log_view.setReadOnly(True)
         layout.addWidget(self.log_view)
         
+        # 목록 조회는 백그라운드에서 (대화상자는 바로 표시)
+        self.loader = None
         self.load_targets()
 
     def load_targets(self):
         self.tree.clear()
-        try:
-            camps = api.get_campaigns()
-            if not camps:
-                self.log_view.append("캠페인 목록을 가져올 수 없습니다.")
-                return
-            
-            for c in camps:
-                c_item = QTreeWidgetItem(self.tree)
-                c_item.setText(0, c['name'])
-                # PyQt6에서 ItemIsTristate 제거하고 ItemIsAutoTristate 사용
-                c_item.setFlags(c_item.flags() | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsAutoTristate)
-                c_item.setCheckState(0, Qt.CheckState.Unchecked)
-                
-                try:
-                    groups = api.get_adgroups(c['nccCampaignId'])
-                    if not groups:
-                        continue
-                    
-                    added_count = 0
-                    for g in groups:
-                        # 원본 그룹만 제외 (같은 캠페인의 다른 그룹들은 표시)
-                        if g['nccAdgroupId'] == self.source_id: 
-                            continue
-                        
-                        g_item = QTreeWidgetItem(c_item)
-                        g_item.setText(0, g['name'])
-                        g_item.setData(0, Qt.ItemDataRole.UserRole, g['nccAdgroupId'])
-                        g_item.setFlags(g_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                        g_item.setCheckState(0, Qt.CheckState.Unchecked)
-                        added_count += 1
-                    
-                    # 그룹이 하나도 추가되지 않은 캠페인 항목 제거 (원본 그룹만 있는 경우)
-                    if added_count == 0:
-                        self.tree.invisibleRootItem().removeChild(c_item)
-                        
-                except Exception as e:
-                    print(f"그룹 로드 실패 ({c['name']}): {e}")
-                    self.tree.invisibleRootItem().removeChild(c_item)
-                    continue
-                    
-            self.tree.expandAll()
-            total_campaigns = self.tree.topLevelItemCount()
-            self.log_view.append(f"{total_campaigns}개 캠페인 로드 완료")
-        except Exception as e:
-            self.log_view.append(f"오류: {e}")
-            print(f"캠페인 로드 실패: {e}")
+        self.btn_run.setEnabled(False)
+        self.log_view.append("캠페인 / 그룹 목록 불러오는 중...")
+        # 공용 계정 트리 스냅샷 사용 (다른 탭에서 불러왔으면 API 호출 없음)
+        self.loader = AccountTreeLoader()
+        self.loader.campaign_signal.connect(self.add_campaign_item)
+        self.loader.data_signal.connect(self.on_targets_loaded)
+        self.loader.start()
+
+    def add_campaign_item(self, camp, groups):
+        # 원본 그룹만 제외 (같은 캠페인의 다른 그룹들은 표시)
+        groups = [g for g in groups if g.id != self.source_id]
+        if not groups:
+            return
+        c_item = QTreeWidgetItem(self.tree)
+        c_item.setText(0, camp.name)
+        # PyQt6에서 ItemIsTristate 제거하고 ItemIsAutoTristate 사용
+        c_item.setFlags(c_item.flags() | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsAutoTristate)
+        c_item.setCheckState(0, Qt.CheckState.Unchecked)
+        c_item.setExpanded(True)
+        for g in groups:
+            g_item = QTreeWidgetItem(c_item)
+            g_item.setText(0, g.name)
+            g_item.setData(0, Qt.ItemDataRole.UserRole, g.id)
+            g_item.setFlags(g_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            g_item.setCheckState(0, Qt.CheckState.Unchecked)
+
+    def on_targets_loaded(self, data):
+        if not data:
+            self.log_view.append("캠페인 목록을 가져올 수 없습니다.")
+        self.btn_run.setEnabled(True)
+        self.log_view.append(f"{self.tree.topLevelItemCount()}개 캠페인 로드 완료")
+
+    def done(self, result):
+        # 조회 중에 닫으면 스레드 종료까지 대기 (실행 중인 QThread 파괴 방지)
+        if self.loader and self.loader.isRunning():
+            self.loader.campaign_signal.disconnect()
+            self.loader.data_signal.disconnect()
+            self.loader.stop()
+            self.loader.wait()
+        super().done(result)
 
     def get_selected_targets(self):
         targets = []
@@ -359,23 +356,20 @@ class CreativeManagerWidget(QWidget):
 
     # --- 데이터 로딩 로직 ---
     def load_campaigns(self):
+        # 공용 계정 트리 스냅샷 사용 (최신이면 API 호출 없음, 아니면 백그라운드 조회)
+        load_tree_async(self.on_tree_loaded)
+
+    def on_tree_loaded(self, tree):
         self.combo_camp.clear()
-        try:
-            camps = api.get_campaigns()
-            for c in camps:
-                self.combo_camp.addItem(c['name'], c['nccCampaignId'])
-        except Exception as e:
-            pass
+        for c, _ in tree:
+            self.combo_camp.addItem(c.name, c.id)
 
     def on_campaign_changed(self):
         self.combo_group.clear()
         camp_id = self.combo_camp.currentData()
         if not camp_id: return
-        try:
-            groups = api.get_adgroups(camp_id)
-            for g in groups:
-                self.combo_group.addItem(g['name'], g['nccAdgroupId'])
-        except: pass
+        for g in account_tree.groups_of(camp_id):
+            self.combo_group.addItem(g.name, g.id)
 
     def on_group_changed(self):
         group_id = self.combo_group.currentData()
@@ -1,93 +1,184 @@
-import time
+import os
 from datetime import datetime, timedelta
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTreeWidget, QTreeWidgetItem,
     QTableWidget, QTableWidgetItem, QHeaderView, QPushButton, QDateEdit,
     QMessageBox, QSplitter, QProgressBar, QComboBox, QTabWidget, QFrame,
-    QListWidget, QListWidgetItem
+    QListWidget, QListWidgetItem, QApplication, QTableView, QCheckBox, QLineEdit, QFileDialog
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QDate
 from PyQt6.QtGui import QColor, QBrush, QFont
 
-import matplotlib
-matplotlib.use('Qt5Agg')
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-
 from api.api_client import api
-
-# 한글 폰트 설정
-try:
-    plt.rcParams['font.family'] = 'Malgun Gothic'
-    plt.rcParams['axes.unicode_minus'] = False
-except:
-    pass
+from logic.account_tree import account_tree
+from logic.stats_store import stats_store, previous_range
+from logic.keyword_stats import SORT_KEYS, load_keyword_stats
+from logic import reports
+from ui.stats_chart import StatsChart
+from ui.table_models import ColumnarTableModel
 
 # -------------------------------------------------------------------------
-# [대시보드 데이터 로더] 전체 캠페인 리스트 조회
+# [대시보드 데이터 로더] 선택 캠페인 + 소속 그룹 통계를 한 번에 묶어서 조회
+# 1) 그룹 구조는 공용 계정 트리 스냅샷에서 (캠페인별 그룹 조회는 동시 실행)
+# 2) 로컬 통계 저장소에 없는 날짜만 50개씩 꽉 채운 일별 통계 요청으로 적재 (동시 전송)
+# 3) 구조 -> 통계 청크 순으로 바로 전달해 트리를 점진적으로 채움
+#    (이미 적재된 기간은 API 호출 없이 로컬 합계로 즉시 표시)
+# 4) 합계는 로컬 주/월 롤업으로 계산 - 기간 프리셋은 API 조회 전에 먼저 표시
+# 5) compare=True: 같은 길이의 직전 기간도 적재해 'prev_stats' 로 함께 전달
 # -------------------------------------------------------------------------
 class DashboardLoader(QThread):
+    campaign_signal = pyqtSignal(object)  # {'id', 'name', 'groups': [{'id', 'name'}]} (통계 전)
+    stats_signal = pyqtSignal(object)     # {id: 통계} - 청크 단위
     data_signal = pyqtSignal(list)
     status_signal = pyqtSignal(str)
     
-    def __init__(self, selected_campaign_ids, since, until):
+    def __init__(self, selected_campaigns, since, until, compare=False, refresh=False):
+        """
+        selected_campaigns: [(캠페인ID, 캠페인명), ...]
+        refresh: 최근 날짜를 재조회 간격과 무관하게 다시 조회 (조회 버튼)
+        """
         super().__init__()
-        self.selected_campaign_ids = selected_campaign_ids
+        self.selected_campaigns = selected_campaigns
         self.since = since
         self.until = until
+        self.compare = compare
+        self.refresh = refresh
+        self.totals = None       # 선택 캠페인 전체 합계/지표 (완료 후)
+        self.prev_totals = None  # 비교 기간 합계/지표 (compare 일 때)
+        self.is_running = True
+
+    def stop(self):
+        """다음 단계 전에 중단 (새 조회가 시작된 경우)"""
+        self.is_running = False
 
     def run(self):
         try:
-            if not self.selected_campaign_ids:
+            if not self.selected_campaigns:
                 self.status_signal.emit("캠페인을 선택해주세요")
                 self.data_signal.emit([])
                 return
             
-            result = []
+            # 1. 그룹 구조 (스냅샷이 최신이면 API 호출 없음)
+            self.status_signal.emit("광고그룹 구조 조회 중...")
+            tree = {c.id: groups for c, groups in account_tree.load()}
             
-            # 선택된 캠페인들만 조회
-            for camp_id in self.selected_campaign_ids:
-                self.status_signal.emit(f"조회 중: {camp_id}")
-                
-                # 캠페인 통계
-                camp_stats_map = api.get_stats([camp_id], since=self.since, until=self.until)
-                camp_stats = camp_stats_map.get(camp_id, {})
-                
-                # 광고그룹 조회
-                groups = api.get_adgroups(camp_id)
-                
-                # 그룹 통계 일괄 조회
-                group_ids = [g['nccAdgroupId'] for g in groups]
-                group_stats_map = {}
-                if group_ids:
-                    group_stats_map = api.get_stats(group_ids, since=self.since, until=self.until)
-                
-                # 그룹 데이터 구성
-                group_data_list = []
-                for group in groups:
-                    gid = group['nccAdgroupId']
-                    gname = group['name']
-                    
-                    group_data_list.append({
-                        'id': gid,
-                        'name': gname,
-                        'stats': group_stats_map.get(gid, {})
-                    })
-                
-                result.append({
-                    'id': camp_id,
-                    'stats': camp_stats,
-                    'groups': group_data_list
+            result = []
+            for camp_id, camp_name in self.selected_campaigns:
+                groups = [{'id': g.id, 'name': g.name, 'stats': {}} for g in tree.get(camp_id, [])]
+                camp = {'id': camp_id, 'name': camp_name, 'stats': {}, 'groups': groups}
+                result.append(camp)
+                self.campaign_signal.emit({
+                    'id': camp_id, 'name': camp_name,
+                    'groups': [{'id': g['id'], 'name': g['name']} for g in groups]
                 })
-                
-                time.sleep(0.2)
+            
+            if not self.is_running:
+                return
+            ids = [c['id'] for c in result] + [g['id'] for c in result for g in c['groups']]
+            camp_ids = [c['id'] for c in result]
+            
+            # 2. 저장소에 있는 만큼 먼저 표시 (롤업 합계 - API 호출 없음)
+            local = stats_store.frame(ids, self.since, self.until)
+            self.stats_signal.emit({sid: local.stats_dict(i) for i, sid in enumerate(local.ids)})
+            
+            # 3. 일별 통계 적재 - 로컬 저장소에 없는 날짜만 API 조회 (캠페인 합계 먼저)
+            def on_chunk(done, total, chunk, label):
+                if not self.is_running:
+                    return
+                part = stats_store.frame(chunk, self.since, self.until)
+                self.stats_signal.emit({sid: part.stats_dict(i) for i, sid in enumerate(part.ids)})
+                self.status_signal.emit(f"{label} 통계 조회 중... ({done}/{total})")
+            
+            recent_ttl = 0 if self.refresh else None
+            periods = [(self.since, self.until)]
+            if self.compare:
+                periods.append(previous_range(self.since, self.until))
+            for since, until in periods:
+                stats_store.backfill(
+                    "campaign", [(c['id'], None, c['name']) for c in result], since, until,
+                    progress=lambda d, t, chunk: on_chunk(d, t, chunk, "캠페인"), recent_ttl=recent_ttl
+                )
+                stats_store.backfill(
+                    "adgroup", [(g['id'], c['id'], g['name']) for c in result for g in c['groups']], since, until,
+                    progress=lambda d, t, chunk: on_chunk(d, t, chunk, "광고그룹"), recent_ttl=recent_ttl
+                )
+                if not self.is_running:
+                    return
+            
+            # 4. 기간 합계는 로컬 데이터로 계산
+            for key, (since, until) in zip(('stats', 'prev_stats'), periods):
+                frame = stats_store.frame(ids, since, until)
+                stats_map = {sid: frame.stats_dict(i) for i, sid in enumerate(frame.ids)}
+                totals = stats_store.frame(camp_ids, since, until).totals()
+                if key == 'stats':
+                    self.totals = totals
+                else:
+                    self.prev_totals = totals
+                for camp in result:
+                    camp[key] = stats_map.get(camp['id'], {})
+                    for group in camp['groups']:
+                        group[key] = stats_map.get(group['id'], {})
             
             self.data_signal.emit(result)
         except Exception as e:
             self.status_signal.emit(f"오류: {str(e)}")
             self.data_signal.emit([])
 
+# -------------------------------------------------------------------------
+# [키워드 드릴다운 로더] 선택 범위 그룹들의 키워드 성과 -> KeywordStats
+# -------------------------------------------------------------------------
+class KeywordStatsLoader(QThread):
+    data_signal = pyqtSignal(object)  # KeywordStats / 실패·중단 시 None
+    status_signal = pyqtSignal(str)
+
+    def __init__(self, groups, since, until):
+        super().__init__()
+        self.groups = groups  # [(adgroup_id, 그룹명, campaign_id)]
+        self.since = since
+        self.until = until
+        self.is_running = True
+
+    def stop(self):
+        self.is_running = False
+
+    def run(self):
+        try:
+            result = load_keyword_stats(
+                self.groups, self.since, self.until,
+                progress=self.status_signal.emit, should_stop=lambda: not self.is_running
+            )
+            self.data_signal.emit(result)
+        except Exception as e:
+            self.status_signal.emit(f"키워드 분석 오류: {str(e)}")
+            self.data_signal.emit(None)
+
+# -------------------------------------------------------------------------
+# [리포트 내보내기] 로컬 캐시 -> 파일 (API 호출 없음)
+# -------------------------------------------------------------------------
+class ReportExportWorker(QThread):
+    finished_signal = pyqtSignal(str, int)  # 저장 경로 (실패 시 ""), 행 수
+    status_signal = pyqtSignal(str)
+
+    def __init__(self, source, fmt, since, until, path):
+        super().__init__()
+        self.source = source
+        self.fmt = fmt
+        self.since = since
+        self.until = until
+        self.path = path
+
+    def run(self):
+        try:
+            path, count = reports.export(
+                self.source, self.fmt, self.since, self.until, path=self.path,
+                customer_id=str(api.naver_customer_id or '') or None,
+                progress=lambda n: self.status_signal.emit(f"내보내는 중... {n:,}행")
+            )
+            self.finished_signal.emit(path, count)
+        except Exception as e:
+            self.status_signal.emit(f"내보내기 실패: {e}")
+            self.finished_signal.emit("", 0)
+
 # -------------------------------------------------------------------------
 # [메인 대시보드 UI]
 # -------------------------------------------------------------------------
@@ -95,8 +186,16 @@ class DashboardWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.loader = None
+        self.stale_loaders = []  # 중단 요청한 이전 로더 (스레드가 끝날 때까지 참조 유지)
         self.campaign_data = []
+        self.tree_items = {}  # id -> (트리 아이템, 이름)
         self.all_campaigns = []  # 전체 캠페인 리스트
+        self.view_range = ("", "")  # 마지막 조회 기간 (since, until)
+        self.chart = None  # 차트 탭을 처음 열 때 생성
+        self.chart_pending = None  # (캐시 키, 이름, 통계)
+        self.kw_loader = None
+        self.export_worker = None
+        self.kw_stats = None  # KeywordStats (마지막 키워드 분석 결과)
         self.init_ui()
         self.load_campaign_list()  # 초기 캠페인 리스트 로드
     
@@ -190,6 +289,10 @@ class DashboardWidget(QWidget):
         top_layout.addWidget(btn_this_month)
         top_layout.addSpacing(10)
         
+        self.chk_compare = QCheckBox("이전 기간 비교")
+        top_layout.addWidget(self.chk_compare)
+        top_layout.addSpacing(10)
+        
         btn_refresh = QPushButton("🔄 조회")
         btn_refresh.setStyleSheet("""
             QPushButton {
@@ -210,7 +313,7 @@ class DashboardWidget(QWidget):
                 background: #0a58ca;
             }
         """)
-        btn_refresh.clicked.connect(self.load_data)
+        btn_refresh.clicked.connect(lambda: self.load_data(refresh=True))
         top_layout.addWidget(btn_refresh)
         
         top_layout.addStretch()
@@ -386,14 +489,15 @@ class DashboardWidget(QWidget):
         """)
         self.tab_view.addTab(self.table_stats, "📊 테이블")
         
-        # [탭2] 차트 뷰 (선택된 캠페인/그룹만)
+        # [탭2] 차트 뷰 (선택된 캠페인/그룹만) - 탭을 처음 열 때 차트 생성
         self.chart_widget = QWidget()
-        chart_layout = QVBoxLayout(self.chart_widget)
-        chart_layout.setContentsMargins(10, 10, 10, 10)
-        self.figure = Figure(figsize=(8, 6), facecolor='white')
-        self.canvas = FigureCanvas(self.figure)
-        chart_layout.addWidget(self.canvas)
+        self.chart_layout = QVBoxLayout(self.chart_widget)
+        self.chart_layout.setContentsMargins(10, 10, 10, 10)
         self.tab_view.addTab(self.chart_widget, "📈 차트")
+        self.tab_view.currentChanged.connect(self.on_view_tab_changed)
+        
+        # [탭3] 키워드 드릴다운 (선택한 캠페인/그룹, 선택 없으면 조회한 전체)
+        self.tab_view.addTab(self.create_keyword_view(), "🔑 키워드")
         
         right_layout.addWidget(self.tab_view)
         
@@ -465,17 +569,20 @@ class DashboardWidget(QWidget):
             item = self.campaign_list.item(i)
             item.setCheckState(Qt.CheckState.Unchecked)
 
-    def load_data(self):
-        """선택한 캠페인과 기간으로 데이터 조회"""
+    def load_data(self, refresh=False):
+        """
+        선택한 캠페인과 기간으로 데이터 조회
+        refresh=False (기간 프리셋): 저장소 + 롤업으로 바로 표시, 최근 날짜는 재조회 간격이 지났을 때만 API 조회
+        """
         # 체크된 캠페인 ID 수집
-        selected_ids = []
+        selected = []
         for i in range(self.campaign_list.count()):
             item = self.campaign_list.item(i)
             if item.checkState() == Qt.CheckState.Checked:
                 campaign_id = item.data(Qt.ItemDataRole.UserRole)
-                selected_ids.append(campaign_id)
+                selected.append((campaign_id, item.text()))
         
-        if not selected_ids:
+        if not selected:
             self.lbl_status.setText("캠페인을 선택해주세요")
             return
         
@@ -486,51 +593,90 @@ class DashboardWidget(QWidget):
         self.tree.clear()
         self.table_stats.setRowCount(0)
         
-        self.loader = DashboardLoader(selected_ids, since, until)
-        self.loader.data_signal.connect(self.on_data_loaded)
-        self.loader.status_signal.connect(self.lbl_status.setText)
-        self.loader.start()
+        self.campaign_data = []
+        self.tree_items = {}
+        self.view_range = (since, until)
+        self.kw_stats = None
+        self.kw_model.clear()
+        self.drop_loader(self.loader)
+        # 이전 기간의 키워드 분석은 새 기간 화면에 쓰지 않음
+        self.drop_loader(self.kw_loader)
+        self.kw_loader = None
+        self.btn_kw_load.setEnabled(True)
+        
+        loader = self.loader = DashboardLoader(selected, since, until, compare=self.chk_compare.isChecked(), refresh=refresh)
+        loader.campaign_signal.connect(self.from_current(loader, self.on_campaign_loaded))
+        loader.stats_signal.connect(self.from_current(loader, self.on_stats_loaded))
+        loader.data_signal.connect(self.from_current(loader, self.on_data_loaded))
+        loader.status_signal.connect(self.from_current(loader, self.lbl_status.setText))
+        loader.start()
+
+    def drop_loader(self, loader):
+        """실행 중인 로더 중단 요청 (스레드가 끝날 때까지 stale_loaders 에 참조 유지)"""
+        if loader and loader.isRunning():
+            loader.stop()
+            self.stale_loaders.append(loader)
+            loader.finished.connect(lambda l=loader: self.stale_loaders.remove(l))
+
+    def from_current(self, loader, slot, attr="loader"):
+        """이전 조회 로더가 늦게 보낸 시그널은 버림 (새 기간의 트리/데이터를 덮어쓰지 않도록)"""
+        return lambda *args: slot(*args) if loader is getattr(self, attr) else None
+
+    @staticmethod
+    def stats_summary(stats):
+        imp = stats.get('impCnt', 0)
+        clk = stats.get('clkCnt', 0)
+        cost = stats.get('salesAmt', 0)
+        return f"노출:{imp} | 클릭:{clk} | 비용:{cost:,.0f}원"
+
+    def on_campaign_loaded(self, camp):
+        """구조만 먼저 표시 (통계는 청크가 도착하는 대로 채움)"""
+        camp_item = QTreeWidgetItem(self.tree)
+        camp_item.setText(0, f"{camp['name']} (조회 중...)")
+        camp_item.setData(0, Qt.ItemDataRole.UserRole, ('campaign', camp['id']))
+        camp_item.setFont(0, QFont("Malgun Gothic", 10, QFont.Weight.Bold))
+        self.tree_items[camp['id']] = (camp_item, camp['name'])
+        
+        # 광고그룹
+        for group in camp['groups']:
+            group_item = QTreeWidgetItem(camp_item)
+            group_item.setText(0, group['name'])
+            group_item.setData(0, Qt.ItemDataRole.UserRole, ('group', group['id']))
+            self.tree_items[group['id']] = (group_item, group['name'])
+        camp_item.setExpanded(True)
+
+    def on_stats_loaded(self, part):
+        for sid, stats in part.items():
+            entry = self.tree_items.get(sid)
+            if entry:
+                item, name = entry
+                item.setText(0, f"{name} ({self.stats_summary(stats)})")
 
     def on_data_loaded(self, data):
-        """조회된 데이터로 트리 구성"""
+        """조회 완료 - 상세 표시용 데이터 보관, 통계가 없는 항목 정리"""
         self.campaign_data = data
-        self.tree.clear()
         
         if not data:
+            self.tree.clear()
             self.lbl_status.setText("데이터 없음")
             return
         
-        # 캠페인별로 트리 아이템 생성
         for camp in data:
-            camp_item = QTreeWidgetItem(self.tree)
-            camp_item.setText(0, camp['name'])
-            camp_item.setData(0, Qt.ItemDataRole.UserRole, ('campaign', camp['id']))
-            camp_item.setFont(0, QFont("Malgun Gothic", 10, QFont.Weight.Bold))
-            
-            # 캠페인 통계 요약
-            stats = camp['stats']
-            imp = stats.get('impCnt', 0)
-            clk = stats.get('clkCnt', 0)
-            cost = stats.get('salesAmt', 0)
-            summary = f"노출:{imp} | 클릭:{clk} | 비용:{cost:,.0f}원"
-            camp_item.setText(0, f"{camp['name']} ({summary})")
-            
-            # 광고그룹
-            for group in camp['groups']:
-                group_item = QTreeWidgetItem(camp_item)
-                group_item.setText(0, group['name'])
-                group_item.setData(0, Qt.ItemDataRole.UserRole, ('group', group['id']))
-                
-                # 그룹 통계 요약
-                g_stats = group['stats']
-                g_imp = g_stats.get('impCnt', 0)
-                g_clk = g_stats.get('clkCnt', 0)
-                g_cost = g_stats.get('salesAmt', 0)
-                g_summary = f"노출:{g_imp} | 클릭:{g_clk} | 비용:{g_cost:,.0f}원"
-                group_item.setText(0, f"{group['name']} ({g_summary})")
-        
-        self.tree.expandAll()
-        self.lbl_status.setText(f"조회 완료 ({len(data)}개 캠페인)")
+            self.on_stats_loaded({camp['id']: camp['stats']})
+            self.on_stats_loaded({g['id']: g['stats'] for g in camp['groups']})
+        
+        t = self.loader.totals if self.loader else None
+        if t:
+            text = (
+                f"조회 완료 ({len(data)}개 캠페인) | 노출 {t['imp']:,} · 클릭 {t['clk']:,} · 비용 {t['cost']:,.0f}원 · "
+                f"CTR {t['ctr']:.2f}% · CPC {t['cpc']:,.0f}원 · CVR {t['cvr']:.2f}% · CPA {t['cpa']:,.0f}원"
+            )
+            p = self.loader.prev_totals
+            if p:
+                text += f" | 이전 기간 대비 비용 {self.change_text(t['cost'], p['cost'])} · 전환 {self.change_text(t['conv'], p['conv'])}"
+            self.lbl_status.setText(text)
+        else:
+            self.lbl_status.setText(f"조회 완료 ({len(data)}개 캠페인)")
 
     def on_tree_selection_changed(self):
         """트리 선택 변경 시 상세 통계 표시"""
@@ -544,91 +690,249 @@ class DashboardWidget(QWidget):
         
         # 데이터에서 찾기
         stats = None
+        prev = None
         name = ""
         
         for camp in self.campaign_data:
             if item_type == 'campaign' and camp['id'] == item_id:
                 stats = camp['stats']
+                prev = camp.get('prev_stats')
                 name = camp['name']
                 break
             elif item_type == 'group':
                 for group in camp['groups']:
                     if group['id'] == item_id:
                         stats = group['stats']
+                        prev = group.get('prev_stats')
                         name = group['name']
                         break
         
         if stats is None:
             return
         
-        # 테이블에 통계 표시
-        self.display_stats(name, stats)
+        # 테이블에 통계 표시 (비교 모드면 이전 기간 / 증감 열 추가)
+        self.display_stats(name, stats, prev)
         
-        # 차트 업데이트
-        self.display_chart(name, stats)
+        # 차트 업데이트 (항목 + 조회 기간 단위로 캐시)
+        self.display_chart((item_id,) + self.view_range, name, stats)
 
-    def display_stats(self, name, stats):
-        """통계를 테이블에 표시"""
-        self.table_stats.setRowCount(0)
-        
-        # 주요 통계 추출
+    @staticmethod
+    def stat_values(stats):
+        """주요/효율 지표 -> {키: 값}"""
         imp = stats.get('impCnt', 0)
         clk = stats.get('clkCnt', 0)
         cost = stats.get('salesAmt', 0)
         conv = stats.get('convCnt', 0)  # 전환수
+        return {
+            'imp': imp, 'clk': clk, 'cost': cost, 'conv': conv,
+            'ctr': (clk / imp * 100) if imp > 0 else 0,
+            'cpc': (cost / clk) if clk > 0 else 0,
+            'cvr': (conv / clk * 100) if clk > 0 else 0,
+            'cpa': (cost / conv) if conv > 0 else 0,
+        }
+
+    @staticmethod
+    def change_text(cur, prev):
+        if not prev:
+            return "-" if not cur else "신규"
+        return f"{(cur - prev) / prev * 100:+.1f}%"
+
+    def display_stats(self, name, stats, prev=None):
+        """통계를 테이블에 표시 - prev 가 있으면 이전 기간 값과 증감률 열 추가"""
+        self.table_stats.setRowCount(0)
+        compare = prev is not None
+        if compare:
+            self.table_stats.setColumnCount(4)
+            self.table_stats.setHorizontalHeaderLabels(["항목", "수치", "이전 기간", "증감"])
+        else:
+            self.table_stats.setColumnCount(2)
+            self.table_stats.setHorizontalHeaderLabels(["항목", "수치"])
         
-        # 계산된 지표
-        ctr = (clk / imp * 100) if imp > 0 else 0
-        cpc = (cost / clk) if clk > 0 else 0
-        cvr = (conv / clk * 100) if clk > 0 else 0
-        cpa = (cost / conv) if conv > 0 else 0
+        cur = self.stat_values(stats)
+        old = self.stat_values(prev or {})
         
-        # 테이블 데이터
+        # 테이블 데이터 (라벨, 지표 키, 표시 형식)
         data = [
-            ("📌 대상", name),
-            ("", ""),  # 구분선
-            ("📊 주요 지표", ""),
-            ("노출수", f"{imp:,}"),
-            ("클릭수", f"{clk:,}"),
-            ("총비용", f"{cost:,.0f}원"),
-            ("전환수", f"{conv:,}"),
-            ("", ""),  # 구분선
-            ("📈 효율 지표", ""),
-            ("클릭률 (CTR)", f"{ctr:.2f}%"),
-            ("평균 클릭비용 (CPC)", f"{cpc:,.0f}원"),
-            ("전환율 (CVR)", f"{cvr:.2f}%"),
-            ("전환당비용 (CPA)", f"{cpa:,.0f}원"),
+            ("📌 대상", name, None),
+            ("", "", None),  # 구분선
+            ("📊 주요 지표", "", None),
+            ("노출수", 'imp', "{:,}"),
+            ("클릭수", 'clk', "{:,}"),
+            ("총비용", 'cost', "{:,.0f}원"),
+            ("전환수", 'conv', "{:,}"),
+            ("", "", None),  # 구분선
+            ("📈 효율 지표", "", None),
+            ("클릭률 (CTR)", 'ctr', "{:.2f}%"),
+            ("평균 클릭비용 (CPC)", 'cpc', "{:,.0f}원"),
+            ("전환율 (CVR)", 'cvr', "{:.2f}%"),
+            ("전환당비용 (CPA)", 'cpa', "{:,.0f}원"),
         ]
         
         self.table_stats.setRowCount(len(data))
         
-        for row, (label, value) in enumerate(data):
-            # 라벨
-            label_item = QTableWidgetItem(label)
-            if label == "":
-                label_item.setBackground(QBrush(QColor("#f8f9fa")))
-            elif label.startswith("📌") or label.startswith("📊") or label.startswith("📈"):
-                label_item.setFont(QFont("Malgun Gothic", 10, QFont.Weight.Bold))
-                label_item.setBackground(QBrush(QColor("#e7f1ff")))
-                label_item.setForeground(QBrush(QColor("#0d6efd")))
-            
-            self.table_stats.setItem(row, 0, label_item)
-            
-            # 값
-            value_item = QTableWidgetItem(value)
-            if label == "":
-                value_item.setBackground(QBrush(QColor("#f8f9fa")))
-            elif label.startswith("📌") or label.startswith("📊") or label.startswith("📈"):
-                value_item.setFont(QFont("Malgun Gothic", 10, QFont.Weight.Bold))
-                value_item.setBackground(QBrush(QColor("#e7f1ff")))
-                value_item.setForeground(QBrush(QColor("#0d6efd")))
-            else:
-                # 일반 값 스타일
-                value_item.setFont(QFont("Malgun Gothic", 10))
-                if any(x in label for x in ["클릭", "비용"]):
-                    value_item.setForeground(QBrush(QColor("#198754")))
+        for row, (label, key, fmt) in enumerate(data):
+            values = [label, fmt.format(cur[key]) if fmt else key]
+            if compare:
+                values += [fmt.format(old[key]), self.change_text(cur[key], old[key])] if fmt else ["", ""]
             
-            self.table_stats.setItem(row, 1, value_item)
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if label == "":
+                    item.setBackground(QBrush(QColor("#f8f9fa")))
+                elif label.startswith("📌") or label.startswith("📊") or label.startswith("📈"):
+                    item.setFont(QFont("Malgun Gothic", 10, QFont.Weight.Bold))
+                    item.setBackground(QBrush(QColor("#e7f1ff")))
+                    item.setForeground(QBrush(QColor("#0d6efd")))
+                elif col == 3:
+                    # 증감: 증가 빨강 / 감소 파랑
+                    item.setFont(QFont("Malgun Gothic", 10))
+                    if value.startswith("+"):
+                        item.setForeground(QBrush(QColor("#dc3545")))
+                    elif value.startswith("-") and value != "-":
+                        item.setForeground(QBrush(QColor("#0d6efd")))
+                elif col >= 1:
+                    # 일반 값 스타일
+                    item.setFont(QFont("Malgun Gothic", 10))
+                    if col == 1 and any(x in label for x in ["클릭", "비용"]):
+                        item.setForeground(QBrush(QColor("#198754")))
+                
+                self.table_stats.setItem(row, col, item)
+
+    # [키워드 드릴다운]
+    def create_keyword_view(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(10, 10, 10, 10)
+        
+        controls = QHBoxLayout()
+        self.btn_kw_load = QPushButton("🔍 키워드 분석")
+        self.btn_kw_load.clicked.connect(self.load_keyword_stats)
+        controls.addWidget(self.btn_kw_load)
+        
+        self.kw_sort = QComboBox()
+        for key, label in SORT_KEYS:
+            self.kw_sort.addItem(label, key)
+        self.kw_top = QComboBox()
+        for n in (100, 500, 1000, 0):
+            self.kw_top.addItem(f"상위 {n}" if n else "전체", n)
+        self.kw_wasted = QCheckBox("전환 없는 비용만")
+        self.kw_search = QLineEdit()
+        self.kw_search.setPlaceholderText("키워드 검색")
+        self.btn_kw_export = QPushButton("📥 내보내기")
+        self.btn_kw_export.clicked.connect(self.export_keyword_report)
+        for w in (self.kw_sort, self.kw_top, self.kw_wasted, self.kw_search, self.btn_kw_export):
+            controls.addWidget(w)
+        self.kw_sort.currentIndexChanged.connect(self.apply_keyword_filter)
+        self.kw_top.currentIndexChanged.connect(self.apply_keyword_filter)
+        self.kw_wasted.toggled.connect(self.apply_keyword_filter)
+        self.kw_search.textChanged.connect(self.apply_keyword_filter)
+        layout.addLayout(controls)
+        
+        won = lambda v: f"{v:,.0f}"
+        self.kw_model = ColumnarTableModel(
+            ["keyword", "group", "imp", "clk", "cost", "conv", "ctr", "cpc", "cpa", "rnk", "rank_dev"],
+            ["키워드", "광고그룹", "노출", "클릭", "비용", "전환", "CTR", "CPC", "CPA", "평균순위", "순위편차"],
+            formatters={
+                "imp": won, "clk": won, "cost": won, "conv": won, "cpc": won,
+                "cpa": lambda v: f"{v:,.0f}" if v else "-",
+                "ctr": lambda v: f"{v:.2f}%",
+                "rnk": lambda v: f"{v:.1f}" if v else "-",
+                "rank_dev": lambda v: f"{v:+.1f}" if v else "-",
+            },
+            foregrounds={
+                "cost": lambda r: QColor("#dc3545") if r['cost'] > 0 and r['conv'] == 0 else None,
+                "rank_dev": lambda r: QColor("#dc3545" if r['rank_dev'] > 0 else "#0d6efd") if r['rank_dev'] else None,
+            },
+            key="id", hidden=("id",), parent=self
+        )
+        self.kw_table = QTableView()
+        self.kw_table.setModel(self.kw_model)
+        self.kw_table.verticalHeader().setDefaultSectionSize(22)
+        self.kw_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.kw_table)
+        
+        self.lbl_kw_summary = QLabel("캠페인/그룹을 선택하고 키워드 분석을 누르세요 (선택 없으면 조회한 전체)")
+        self.lbl_kw_summary.setStyleSheet("color: #6c757d;")
+        layout.addWidget(self.lbl_kw_summary)
+        return widget
+
+    def keyword_scope(self):
+        """트리 선택 기준 분석 대상 그룹 [(그룹ID, 그룹명, 캠페인ID)]"""
+        selected = self.tree.selectedItems()
+        item_type, item_id = selected[0].data(0, Qt.ItemDataRole.UserRole) if selected else (None, None)
+        groups = []
+        for camp in self.campaign_data:
+            for group in camp['groups']:
+                if item_type is None or item_id in (camp['id'], group['id']):
+                    groups.append((group['id'], group['name'], camp['id']))
+        return groups
+
+    def load_keyword_stats(self):
+        if self.kw_loader and self.kw_loader.isRunning():
+            return
+        groups = self.keyword_scope()
+        if not groups:
+            self.lbl_kw_summary.setText("먼저 기간을 조회해주세요")
+            return
+        
+        self.btn_kw_load.setEnabled(False)
+        loader = self.kw_loader = KeywordStatsLoader(groups, *self.view_range)
+        loader.status_signal.connect(self.from_current(loader, self.lbl_kw_summary.setText, "kw_loader"))
+        loader.data_signal.connect(self.from_current(loader, self.on_keyword_stats_loaded, "kw_loader"))
+        loader.start()
+
+    def on_keyword_stats_loaded(self, result):
+        self.btn_kw_load.setEnabled(True)
+        if result is None:
+            return
+        self.kw_stats = result
+        self.apply_keyword_filter()
+
+    def apply_keyword_filter(self, *_):
+        """정렬/필터 변경 - API 호출 없이 메모리 배열로 다시 선택"""
+        ks = self.kw_stats
+        if ks is None:
+            return
+        idx = ks.select(
+            sort_by=self.kw_sort.currentData(), top_n=self.kw_top.currentData() or None,
+            wasted_only=self.kw_wasted.isChecked(), text=self.kw_search.text().strip()
+        )
+        self.kw_model.set_rows(ks.rows(idx))
+        cost, conv = ks.summary(idx)
+        self.lbl_kw_summary.setText(
+            f"키워드 {len(ks):,}개 중 {len(idx):,}개 표시 | 비용 {cost:,.0f}원 · 전환 {conv:,}"
+        )
+
+    def export_keyword_report(self):
+        """조회 기간의 키워드 성과 전체를 파일로 (화면 필터와 무관, 저장된 키워드 통계 기준)"""
+        if self.export_worker and self.export_worker.isRunning():
+            return
+        since, until = self.view_range
+        if not since:
+            self.lbl_kw_summary.setText("먼저 기간을 조회해주세요")
+            return
+        formats = reports.available_formats()
+        path, _ = QFileDialog.getSaveFileName(
+            self, "키워드 성과 내보내기", reports.default_path("keyword_performance", formats[0], since, until),
+            ";;".join(f"{fmt.upper()} (*.{fmt})" for fmt in formats)
+        )
+        if not path:
+            return
+        fmt = os.path.splitext(path)[1].lstrip('.').lower()
+        if fmt not in formats:
+            fmt = formats[0]
+            path += f".{fmt}"
+        
+        self.btn_kw_export.setEnabled(False)
+        self.export_worker = ReportExportWorker("keyword_performance", fmt, since, until, path)
+        self.export_worker.status_signal.connect(self.lbl_kw_summary.setText)
+        self.export_worker.finished_signal.connect(self.on_report_exported)
+        self.export_worker.start()
+
+    def on_report_exported(self, path, count):
+        self.btn_kw_export.setEnabled(True)
+        if path:
+            self.lbl_kw_summary.setText(f"내보내기 완료: {count:,}행 -> {path}")
 
     # [기간 선택 함수들]
     def select_yesterday(self):
@@ -652,103 +956,22 @@ class DashboardWidget(QWidget):
         self.load_data()
 
     # [차트 시각화 함수]
-    def display_chart(self, name, stats):
-        """선택된 항목의 차트 표시"""
-        self.figure.clear()
-        
-        # 데이터 추출
-        imp = stats.get('impCnt', 0)
-        clk = stats.get('clkCnt', 0)
-        cost = stats.get('salesAmt', 0)
-        conv = stats.get('convCnt', 0)
-        
-        ctr = (clk / imp * 100) if imp > 0 else 0
-        cpc = (cost / clk) if clk > 0 else 0
-        cvr = (conv / clk * 100) if clk > 0 else 0
-        cpa = (cost / conv) if conv > 0 else 0
-        
-        # 2x2 서브플롯
-        ax1 = self.figure.add_subplot(2, 2, 1)
-        ax2 = self.figure.add_subplot(2, 2, 2)
-        ax3 = self.figure.add_subplot(2, 2, 3)
-        ax4 = self.figure.add_subplot(2, 2, 4)
-        
-        # [1] 주요 지표 막대 그래프 (전환수 포함)
-        metrics = ['노출수', '클릭수', '전환수', '비용(천원)']
-        values = [imp, clk, conv, cost/1000]
-        colors = ['#0d6efd', '#198754', '#dc3545', '#ffc107']
-        
-        bars = ax1.bar(metrics, values, color=colors, alpha=0.85, edgecolor='white', linewidth=2)
-        ax1.set_title(f'{name[:20]}...' if len(name) > 20 else name, 
-                     fontweight='bold', fontsize=11, pad=10)
-        ax1.set_ylabel('수치', fontsize=9)
-        ax1.tick_params(axis='x', rotation=15, labelsize=9)
-        ax1.grid(axis='y', alpha=0.3, linestyle='--')
-        for bar, v in zip(bars, values):
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{v:,.0f}', ha='center', va='bottom', fontsize=8, fontweight='bold')
-        
-        # [2] CTR & CVR 비율 비교
-        ax2.bar(['CTR', 'CVR'], [ctr, cvr], color=['#17a2b8', '#28a745'], alpha=0.85, edgecolor='white', linewidth=2)
-        ax2.set_title('클릭률 & 전환율', fontweight='bold', fontsize=11, pad=10)
-        ax2.set_ylabel('%', fontsize=9)
-        ax2.grid(axis='y', alpha=0.3, linestyle='--')
-        for i, (label, val) in enumerate([('CTR', ctr), ('CVR', cvr)]):
-            ax2.text(i, val, f'{val:.2f}%', ha='center', va='bottom', fontsize=9, fontweight='bold')
-        
-        # [3] CPC & CPA 비용 비교
-        ax3.bar(['CPC', 'CPA'], [cpc, cpa], color=['#fd7e14', '#dc3545'], alpha=0.85, edgecolor='white', linewidth=2)
-        ax3.set_title('평균 클릭비용 & 전환당비용', fontweight='bold', fontsize=11, pad=10)
-        ax3.set_ylabel('원', fontsize=9)
-        ax3.grid(axis='y', alpha=0.3, linestyle='--')
-        for i, (label, val) in enumerate([('CPC', cpc), ('CPA', cpa)]):
-            ax3.text(i, val, f'{val:,.0f}', ha='center', va='bottom', fontsize=8, fontweight='bold')
-        
-        # [4] 전환 퍼널 도넛 차트
-        if imp > 0 and clk > 0 and conv > 0:
-            # 노출 → 클릭 → 전환 퍼널
-            sizes = [conv, clk-conv, imp-clk]
-            labels = ['전환', '클릭(미전환)', '노출만']
-            colors_pie = ['#dc3545', '#ffc107', '#e9ecef']
-            explode = (0.08, 0.03, 0)
-            
-            wedges, texts, autotexts = ax4.pie(sizes, labels=labels, 
-                   autopct='%1.1f%%', colors=colors_pie, startangle=90,
-                   explode=explode, shadow=False, textprops={'fontsize': 8})
-            
-            # 도넛 효과
-            centre_circle = plt.Circle((0,0), 0.70, fc='white')
-            ax4.add_artist(centre_circle)
-            
-            ax4.set_title('전환 퍼널', fontweight='bold', fontsize=11, pad=10)
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
-                autotext.set_fontsize(8)
-        elif imp > 0 and clk > 0:
-            # 전환 없을 때는 클릭만 표시
-            sizes = [clk, imp-clk]
-            labels = ['클릭', '노출만']
-            colors_pie = ['#28a745', '#e9ecef']
-            explode = (0.05, 0)
-            
-            wedges, texts, autotexts = ax4.pie(sizes, labels=labels, 
-                   autopct='%1.1f%%', colors=colors_pie, startangle=90,
-                   explode=explode, shadow=False, textprops={'fontsize': 9})
-            
-            centre_circle = plt.Circle((0,0), 0.70, fc='white')
-            ax4.add_artist(centre_circle)
-            
-            ax4.set_title('노출 대비 클릭', fontweight='bold', fontsize=11, pad=10)
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontweight('bold')
-        else:
-            ax4.text(0.5, 0.5, '📊\n데이터 없음', ha='center', va='center', 
-                    transform=ax4.transAxes, fontsize=12, color='#999')
-            ax4.set_title('전환 퍼널', fontweight='bold', fontsize=11, pad=10)
-            ax4.axis('off')
-        
-        self.figure.tight_layout(pad=2.0)
-        self.canvas.draw()
+    def on_view_tab_changed(self, index):
+        if self.tab_view.widget(index) is self.chart_widget:
+            self.render_chart()
+
+    def display_chart(self, key, name, stats):
+        """선택된 항목의 차트 표시 - 차트 탭이 안 보이면 마지막 선택만 기억"""
+        self.chart_pending = (key, name, stats)
+        if self.tab_view.currentWidget() is self.chart_widget:
+            self.render_chart()
+
+    def render_chart(self):
+        if self.chart is None:
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+            try:
+                self.chart = StatsChart(self.chart_layout)
+            finally:
+                QApplication.restoreOverrideCursor()
+        if self.chart_pending:
+            self.chart.show(*self.chart_pending)
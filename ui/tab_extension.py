@@ -1,53 +1,73 @@
 import sys
 import json
-import time
-import concurrent.futures
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, 
-    QPushButton, QScrollArea, QFrame, QMessageBox, QGroupBox, 
+    QPushButton, QFrame, QMessageBox, QGroupBox, 
     QCheckBox, QProgressBar, QSplitter, QTabWidget, QGridLayout,
-    QApplication, QDialog
+    QDialog, QSpinBox, QListWidget, QListWidgetItem
 )
 from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QFont, QColor
 
 from api.api_client import api
+from logic.account_tree import account_tree, load_tree_async
+from logic.extension_index import extension_index
+from logic.bulk_ops import BulkOperationWorker, BULK_WORKERS, copy_task, delete_task, toggle_task
 
-import requests
 from PyQt6.QtCore import QThread, pyqtSignal
-from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtGui import QPixmap
+from ui.image_service import image_service
+from ui.virtual_list import VirtualCardList
 
-class ImageLoaderWorker(QThread):
-    """워커 스레드에서 QImage로 다운로드 후 메인 스레드에서 QPixmap 변환"""
-    image_loaded = pyqtSignal(QImage)
+# -------------------------------------------------------------------------
+# [확장소재 동기화 워커] 캠페인 그룹 목록 + 오래된 소유자만 인덱스 갱신
+# -------------------------------------------------------------------------
+class ExtensionSyncWorker(QThread):
+    groups_signal = pyqtSignal(str, list)   # 캠페인ID, [{'nccAdgroupId', 'name'}]
+    progress_signal = pyqtSignal(int)
+    finished_signal = pyqtSignal(str, int)  # 캠페인ID, 다시 조회한 소유자 수 (-1: 그룹 조회 실패)
 
-    def __init__(self, url):
+    def __init__(self, camp_id):
         super().__init__()
-        self.url = url
+        self.camp_id = camp_id
 
     def run(self):
         try:
-            resp = requests.get(self.url, timeout=10)
-            if resp.status_code == 200:
-                img = QImage()
-                if img.loadFromData(resp.content):
-                    self.image_loaded.emit(img)
-                else:
-                    print(f"[IMG_WORKER] QImage loadFromData failed for: {self.url}")
-            else:
-                print(f"[IMG_WORKER] HTTP {resp.status_code} for: {self.url}")
+            # 공용 계정 트리 스냅샷 (최신이면 API 호출 없음)
+            account_tree.load()
+            if not account_tree.is_fresh():
+                # 그룹 목록이 불완전하면 사라진 그룹 정리를 할 수 없으므로 인덱스 그대로 유지
+                print("[EXT_SYNC] 광고그룹 조회 실패")
+                self.finished_signal.emit(self.camp_id, -1)
+                return
+            groups = account_tree.groups_of(self.camp_id)
+            self.groups_signal.emit(self.camp_id, [{'nccAdgroupId': g.id, 'name': g.name} for g in groups])
+            fetched = extension_index.sync_campaign(
+                self.camp_id, [g.id for g in groups],
+                progress=lambda done, total: self.progress_signal.emit(int(done / total * 100))
+            )
+            self.finished_signal.emit(self.camp_id, fetched)
         except Exception as e:
-            print(f"[IMG_WORKER] Image load failed: {e}")
+            print(f"[EXT_SYNC] 동기화 오류: {e}")
+            self.finished_signal.emit(self.camp_id, -1)
 
 # -------------------------------------------------------------------------
 # [커스텀 위젯] 확장 소재 그룹 카드
 # -------------------------------------------------------------------------
 class ExtensionGroupCard(QFrame):
-    def __init__(self, ext_group_data, all_adgroups, parent_widget):
+    """
+    확장소재 그룹 카드 - 가상 목록에서 재사용됨
+    골격(헤더/미리보기/적용 관리/배포 관리)은 한 번만 만들고 bind(data) 로 내용만 교체
+    그룹 체크 상태는 카드가 아니라 parent_widget.selection 에 보관 (다른 그룹에 재사용돼도 유지)
+    """
+    def __init__(self, parent_widget):
         super().__init__()
-        self.data = ext_group_data
-        self.all_groups = all_adgroups 
         self.parent_widget = parent_widget
+        self.data = None
+        self.bind_token = 0  # 이미지 콜백이 재사용된 카드에 잘못 그려지지 않도록
+        self.used_group_ids = set()
+        self.unused_groups = []
+        self.used_groups = []
         
         self.setFrameShape(QFrame.Shape.StyledPanel)
         self.setStyleSheet("""
@@ -55,23 +75,11 @@ class ExtensionGroupCard(QFrame):
                 background-color: white;
                 border: 1px solid #ddd;
                 border-radius: 8px;
-                margin-bottom: 10px;
             }
             ExtensionGroupCard:hover {
                 border: 1px solid #6610f2;
             }
         """)
-        
-        # 사용 중인 그룹 ID 집합
-        self.used_group_ids = set(self.data['ownerIds'])
-        
-        # [수정됨] nccAdGroupId -> nccAdgroupId (소문자 g)
-        self.unused_groups = [g for g in self.all_groups if g['nccAdgroupId'] not in self.used_group_ids]
-        
-        # [버그 패치] 그룹이 전부 할당되어 배포관리 영역이 그려지지 않아도 hasattr 에러 방지용 초기화
-        self.check_boxes = []
-        self.workers = []
-        
         self.init_ui()
 
     def init_ui(self):
@@ -79,17 +87,12 @@ class ExtensionGroupCard(QFrame):
         
         # 1. 헤더
         header = QHBoxLayout()
-        type_lbl = QLabel(self.data['type'])
-        type_lbl.setStyleSheet("background-color: #e2e6ea; color: #495057; padding: 3px 6px; border-radius: 4px; font-weight: bold; font-size: 11px;")
-        header.addWidget(type_lbl)
-        
-        usage_percent = int(len(self.used_group_ids) / len(self.all_groups) * 100) if self.all_groups else 0
-        usage_color = "#28a745" if not self.unused_groups else "#dc3545"
-        usage_text = "✅ 모든 그룹 적용됨" if not self.unused_groups else f"⚠️ {len(self.unused_groups)}개 그룹 미사용"
+        self.type_lbl = QLabel()
+        self.type_lbl.setStyleSheet("background-color: #e2e6ea; color: #495057; padding: 3px 6px; border-radius: 4px; font-weight: bold; font-size: 11px;")
+        header.addWidget(self.type_lbl)
         
-        status_lbl = QLabel(usage_text)
-        status_lbl.setStyleSheet(f"color: {usage_color}; font-weight: bold; font-size: 12px;")
-        header.addWidget(status_lbl)
+        self.status_lbl = QLabel()
+        header.addWidget(self.status_lbl)
         header.addStretch()
 
         # 전체 끄기/켜기 버튼
@@ -114,97 +117,109 @@ class ExtensionGroupCard(QFrame):
 
         layout.addLayout(header)
 
-        # 2. 본문 미리보기
+        # 2. 본문 미리보기 (bind 때마다 내용만 다시 그림)
         content_frame = QFrame()
         content_frame.setStyleSheet("background-color: #f8f9fa; border-radius: 5px; padding: 10px;")
-        c_layout = QVBoxLayout(content_frame)
-        self.render_preview(c_layout)
+        self.c_layout = QVBoxLayout(content_frame)
         layout.addWidget(content_frame)
 
         # 3. 적용 관리 (사용 중인 그룹)
-        used_groups = [g for g in self.all_groups if g['nccAdgroupId'] in self.used_group_ids]
-        if used_groups:
-            mgmt_box = QGroupBox(f"적용 관리 (사용 중 그룹 {len(used_groups)}개)")
-            mgmt_box.setStyleSheet("QGroupBox { font-weight: bold; color: #666; border: 1px solid #eee; margin-top: 10px; }")
-            mgmt_layout = QVBoxLayout(mgmt_box)
-
-            mgmt_scroll = QScrollArea()
-            mgmt_scroll.setFixedHeight(100)
-            mgmt_scroll.setWidgetResizable(True)
-            mgmt_scroll.setStyleSheet("border: none;")
-
-            mgmt_chk_widget = QWidget()
-            mgmt_chk_layout = QVBoxLayout(mgmt_chk_widget)
-            mgmt_chk_layout.setContentsMargins(0,0,0,0)
-
-            self.mgmt_check_all = QCheckBox("전체 선택")
-            self.mgmt_check_all.clicked.connect(self.toggle_mgmt_all)
-            mgmt_chk_layout.addWidget(self.mgmt_check_all)
-
-            self.mgmt_check_boxes = []
-            for grp in used_groups:
-                chk = QCheckBox(grp['name'])
-                chk.setProperty('groupId', grp['nccAdgroupId'])
-                self.mgmt_check_boxes.append(chk)
-                mgmt_chk_layout.addWidget(chk)
-
-            mgmt_scroll.setWidget(mgmt_chk_widget)
-            mgmt_layout.addWidget(mgmt_scroll)
-
-            btn_row = QHBoxLayout()
-            btn_sel_toggle = QPushButton("⏸ 선택 끄기")
-            btn_sel_toggle.setStyleSheet("background-color: #fd7e14; color: white; font-weight: bold;")
-            btn_sel_toggle.clicked.connect(lambda: self.toggle_selected_items(True))
-            btn_row.addWidget(btn_sel_toggle)
-
-            btn_sel_enable = QPushButton("▶ 선택 켜기")
-            btn_sel_enable.setStyleSheet("background-color: #20c997; color: white; font-weight: bold;")
-            btn_sel_enable.clicked.connect(lambda: self.toggle_selected_items(False))
-            btn_row.addWidget(btn_sel_enable)
-
-            btn_sel_delete = QPushButton("🗑 선택 삭제")
-            btn_sel_delete.setStyleSheet("background-color: #dc3545; color: white; font-weight: bold;")
-            btn_sel_delete.clicked.connect(self.delete_selected_items)
-            btn_row.addWidget(btn_sel_delete)
-
-            mgmt_layout.addLayout(btn_row)
-            layout.addWidget(mgmt_box)
-
-        # 4. 배포 관리
-        if self.unused_groups:
-            exp_box = QGroupBox(f"배포 관리 (미사용 그룹 {len(self.unused_groups)}개)")
-            exp_box.setStyleSheet("QGroupBox { font-weight: bold; color: #666; border: 1px solid #eee; margin-top: 10px; }")
-            exp_layout = QVBoxLayout(exp_box)
-            
-            scroll = QScrollArea()
-            scroll.setFixedHeight(100)
-            scroll.setWidgetResizable(True)
-            scroll.setStyleSheet("border: none;")
-            
-            chk_widget = QWidget()
-            self.chk_layout = QVBoxLayout(chk_widget)
-            self.chk_layout.setContentsMargins(0,0,0,0)
-            
-            self.btn_check_all = QCheckBox("전체 선택")
-            self.btn_check_all.clicked.connect(self.toggle_all)
-            self.chk_layout.addWidget(self.btn_check_all)
-            
-            for grp in self.unused_groups:
-                chk = QCheckBox(grp['name'])
-                # [수정됨] nccAdGroupId -> nccAdgroupId
-                chk.setProperty('groupId', grp['nccAdgroupId'])
-                self.check_boxes.append(chk)
-                self.chk_layout.addWidget(chk)
-                
-            scroll.setWidget(chk_widget)
-            exp_layout.addWidget(scroll)
-            
-            btn_copy = QPushButton("선택한 그룹에 복사하기")
-            btn_copy.setStyleSheet("background-color: #6610f2; color: white; font-weight: bold;")
-            btn_copy.clicked.connect(self.copy_extension)
-            exp_layout.addWidget(btn_copy)
-            
-            layout.addWidget(exp_box)
+        self.mgmt_box = QGroupBox()
+        self.mgmt_box.setStyleSheet("QGroupBox { font-weight: bold; color: #666; border: 1px solid #eee; margin-top: 10px; }")
+        mgmt_layout = QVBoxLayout(self.mgmt_box)
+
+        self.mgmt_check_all = QCheckBox("전체 선택")
+        self.mgmt_check_all.clicked.connect(self.toggle_mgmt_all)
+        mgmt_layout.addWidget(self.mgmt_check_all)
+        self.mgmt_list = self._make_group_list('mgmt')
+        mgmt_layout.addWidget(self.mgmt_list)
+
+        btn_row = QHBoxLayout()
+        btn_sel_toggle = QPushButton("⏸ 선택 끄기")
+        btn_sel_toggle.setStyleSheet("background-color: #fd7e14; color: white; font-weight: bold;")
+        btn_sel_toggle.clicked.connect(lambda: self.toggle_selected_items(True))
+        btn_row.addWidget(btn_sel_toggle)
+
+        btn_sel_enable = QPushButton("▶ 선택 켜기")
+        btn_sel_enable.setStyleSheet("background-color: #20c997; color: white; font-weight: bold;")
+        btn_sel_enable.clicked.connect(lambda: self.toggle_selected_items(False))
+        btn_row.addWidget(btn_sel_enable)
+
+        btn_sel_delete = QPushButton("🗑 선택 삭제")
+        btn_sel_delete.setStyleSheet("background-color: #dc3545; color: white; font-weight: bold;")
+        btn_sel_delete.clicked.connect(self.delete_selected_items)
+        btn_row.addWidget(btn_sel_delete)
+
+        mgmt_layout.addLayout(btn_row)
+        layout.addWidget(self.mgmt_box)
+
+        # 4. 배포 관리 (미사용 그룹)
+        self.exp_box = QGroupBox()
+        self.exp_box.setStyleSheet("QGroupBox { font-weight: bold; color: #666; border: 1px solid #eee; margin-top: 10px; }")
+        exp_layout = QVBoxLayout(self.exp_box)
+        
+        self.btn_check_all = QCheckBox("전체 선택")
+        self.btn_check_all.clicked.connect(self.toggle_all)
+        exp_layout.addWidget(self.btn_check_all)
+        self.copy_list = self._make_group_list('copy')
+        exp_layout.addWidget(self.copy_list)
+        
+        btn_copy = QPushButton("선택한 그룹에 복사하기")
+        btn_copy.setStyleSheet("background-color: #6610f2; color: white; font-weight: bold;")
+        btn_copy.clicked.connect(self.copy_extension)
+        exp_layout.addWidget(btn_copy)
+        
+        layout.addWidget(self.exp_box)
+
+    def _make_group_list(self, kind):
+        """그룹 체크 목록 - 체크박스 위젯 대신 체크 가능한 리스트 항목 (그룹 수백 개도 가벼움)"""
+        lst = QListWidget()
+        lst.setFixedHeight(100)
+        lst.setStyleSheet("border: none;")
+        lst.itemChanged.connect(lambda item, k=kind: self.on_group_checked(k, item))
+        return lst
+
+    def bind(self, data):
+        self.data = data
+        self.bind_token += 1
+        all_groups = self.parent_widget.all_adgroups
+        
+        # 사용 중인 그룹 ID 집합
+        self.used_group_ids = set(data['ownerIds'])
+        self.unused_groups = [g for g in all_groups if g['nccAdgroupId'] not in self.used_group_ids]
+        self.used_groups = [g for g in all_groups if g['nccAdgroupId'] in self.used_group_ids]
+
+        self.type_lbl.setText(data['type'])
+        usage_color = "#28a745" if not self.unused_groups else "#dc3545"
+        usage_text = "✅ 모든 그룹 적용됨" if not self.unused_groups else f"⚠️ {len(self.unused_groups)}개 그룹 미사용"
+        self.status_lbl.setText(usage_text)
+        self.status_lbl.setStyleSheet(f"color: {usage_color}; font-weight: bold; font-size: 12px;")
+
+        while self.c_layout.count():
+            item = self.c_layout.takeAt(0)
+            if item.widget(): item.widget().deleteLater()
+        self.render_preview(self.c_layout)
+
+        selection = self.parent_widget.selection_of(data['key'])
+        self.mgmt_box.setVisible(bool(self.used_groups))
+        self.mgmt_box.setTitle(f"적용 관리 (사용 중 그룹 {len(self.used_groups)}개)")
+        self._fill_group_list(self.mgmt_list, self.mgmt_check_all, self.used_groups, selection['mgmt'])
+        self.exp_box.setVisible(bool(self.unused_groups))
+        self.exp_box.setTitle(f"배포 관리 (미사용 그룹 {len(self.unused_groups)}개)")
+        self._fill_group_list(self.copy_list, self.btn_check_all, self.unused_groups, selection['copy'])
+
+    @staticmethod
+    def _fill_group_list(lst, check_all, groups, selected):
+        lst.blockSignals(True)
+        lst.clear()
+        for grp in groups:
+            item = QListWidgetItem(grp['name'])
+            item.setData(Qt.ItemDataRole.UserRole, grp['nccAdgroupId'])
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked if grp['nccAdgroupId'] in selected else Qt.CheckState.Unchecked)
+            lst.addItem(item)
+        lst.blockSignals(False)
+        check_all.setChecked(bool(groups) and all(g['nccAdgroupId'] in selected for g in groups))
 
     def render_preview(self, layout):
         data = self.data['content']
@@ -280,7 +295,9 @@ class ExtensionGroupCard(QFrame):
                     img_lbl.setStyleSheet("border: 1px solid #ccc; background-color: #fff; padding: 4px;")
                     layout.addWidget(img_lbl)
 
-                    def on_image_loaded(qimage, lbl=img_lbl):
+                    def on_image_loaded(qimage, lbl=img_lbl, token=self.bind_token):
+                        if token != self.bind_token:
+                            return  # 그 사이 다른 그룹에 재사용된 카드
                         if not qimage.isNull():
                             px = QPixmap.fromImage(qimage)
                             lbl.setPixmap(px.scaled(
@@ -291,10 +308,7 @@ class ExtensionGroupCard(QFrame):
                         else:
                             lbl.setText("이미지 로드 실패")
 
-                    worker = ImageLoaderWorker(img_url)
-                    worker.image_loaded.connect(on_image_loaded)
-                    self.workers.append(worker)
-                    worker.start()
+                    image_service().request(img_url, on_image_loaded)
 
             # 항상 raw data 표시 (디버깅용)
             debug_lbl = QLabel(f"[raw] {json.dumps(data, ensure_ascii=False)}")
@@ -326,15 +340,34 @@ class ExtensionGroupCard(QFrame):
             lbl.setWordWrap(True)
             layout.addWidget(lbl)
 
+    def on_group_checked(self, kind, item):
+        selected = self.parent_widget.selection_of(self.data['key'])[kind]
+        gid = item.data(Qt.ItemDataRole.UserRole)
+        if item.checkState() == Qt.CheckState.Checked:
+            selected.add(gid)
+        else:
+            selected.discard(gid)
+
+    def _set_all(self, kind, groups, lst, state):
+        selected = self.parent_widget.selection_of(self.data['key'])[kind]
+        ids = [g['nccAdgroupId'] for g in groups]
+        if state:
+            selected.update(ids)
+        else:
+            selected.difference_update(ids)
+        self._fill_group_list(lst, self.btn_check_all if kind == 'copy' else self.mgmt_check_all, groups, selected)
+
     def toggle_all(self):
-        state = self.btn_check_all.isChecked()
-        for chk in self.check_boxes:
-            chk.setChecked(state)
+        self._set_all('copy', self.unused_groups, self.copy_list, self.btn_check_all.isChecked())
 
     def toggle_mgmt_all(self):
-        state = self.mgmt_check_all.isChecked()
-        for chk in self.mgmt_check_boxes:
-            chk.setChecked(state)
+        self._set_all('mgmt', self.used_groups, self.mgmt_list, self.mgmt_check_all.isChecked())
+
+    def selected_groups(self, kind):
+        """체크된 그룹 ID (현재 표시 순서) - kind: 'copy' 미사용 그룹 / 'mgmt' 사용 중 그룹"""
+        selected = self.parent_widget.selection_of(self.data['key'])[kind]
+        groups = self.unused_groups if kind == 'copy' else self.used_groups
+        return [g['nccAdgroupId'] for g in groups if g['nccAdgroupId'] in selected]
 
     def _get_ext_ids_for_groups(self, group_ids):
         """특정 그룹들에 해당하는 nccAdExtensionId 리스트 반환"""
@@ -357,9 +390,7 @@ class ExtensionGroupCard(QFrame):
             self.parent_widget.run_bulk_toggle(ext_ids, user_lock)
 
     def delete_selected_items(self):
-        if not hasattr(self, 'mgmt_check_boxes'):
-            return
-        selected_gids = [chk.property('groupId') for chk in self.mgmt_check_boxes if chk.isChecked()]
+        selected_gids = self.selected_groups('mgmt')
         if not selected_gids:
             QMessageBox.warning(self, "경고", "삭제할 그룹을 선택해주세요.")
             return
@@ -368,9 +399,7 @@ class ExtensionGroupCard(QFrame):
             self.parent_widget.run_bulk_delete(ext_ids)
 
     def toggle_selected_items(self, user_lock):
-        if not hasattr(self, 'mgmt_check_boxes'):
-            return
-        selected_gids = [chk.property('groupId') for chk in self.mgmt_check_boxes if chk.isChecked()]
+        selected_gids = self.selected_groups('mgmt')
         if not selected_gids:
             QMessageBox.warning(self, "경고", "대상 그룹을 선택해주세요.")
             return
@@ -380,7 +409,7 @@ class ExtensionGroupCard(QFrame):
             self.parent_widget.run_bulk_toggle(ext_ids, user_lock)
 
     def copy_extension(self):
-        targets = [chk.property('groupId') for chk in self.check_boxes if chk.isChecked()]
+        targets = self.selected_groups('copy')
         if not targets:
             QMessageBox.warning(self, "경고", "복사할 대상을 선택해주세요.")
             return
@@ -392,11 +421,25 @@ class ExtensionGroupCard(QFrame):
 # [메인 위젯] 확장 소재 관리 탭
 # -------------------------------------------------------------------------
 class ExtensionManagerWidget(QWidget):
+    # 탭 순서별 표시 타입 (None = 전체)
+    TAB_TYPES = (None, ('PHONE',), ('PLACE', 'LOCATION'), ('SUB_LINKS',), ('POWER_LINK_IMAGE', 'IMAGE_SUB_LINKS'))
+    IMAGE_TYPES = ('POWER_LINK_IMAGE', 'IMAGE_SUB_LINKS')
+
     def __init__(self):
         super().__init__()
         self.grouped_extensions = [] 
         self.all_adgroups = []
         self.channels = []
+        self.channel_index = {}  # 채널ID -> 채널 dict
+        self.adgroups_by_campaign = {}  # 캠페인ID -> 그룹 목록 (이번 세션에서 조회한 것)
+        self.sync_worker = None
+        self.pending_sync = None  # 동기화 중 다른 캠페인을 고르면 끝난 뒤 이어서 실행
+        self.sync_groups_changed = False
+        self.bulk_worker = None
+        self.shown_campaign = None
+        self.type_index = {}     # 타입 -> grouped_extensions 위치 목록 (탭 필터용)
+        self.visible_groups = []  # 현재 탭에 표시 중인 그룹
+        self.selection = {}      # 그룹 key -> {'copy': 체크한 미사용 그룹ID, 'mgmt': 체크한 사용 중 그룹ID}
         self.init_ui()
         QTimer.singleShot(100, self.load_channels)
 
@@ -410,11 +453,17 @@ class ExtensionManagerWidget(QWidget):
         self.combo_camp.currentIndexChanged.connect(self.on_campaign_changed)
         
         btn_refresh = QPushButton("새로고침 / 분석 시작")
-        btn_refresh.clicked.connect(self.load_campaigns)
+        btn_refresh.clicked.connect(self.refresh_extensions)
         
         ctrl_layout.addWidget(QLabel("대상 캠페인:"))
         ctrl_layout.addWidget(self.combo_camp, 1)
         ctrl_layout.addWidget(btn_refresh)
+        ctrl_layout.addWidget(QLabel("동시 작업:"))
+        self.spin_workers = QSpinBox()
+        self.spin_workers.setRange(1, 8)
+        self.spin_workers.setValue(BULK_WORKERS)
+        self.spin_workers.setToolTip("일괄 복사/삭제/ON·OFF 동시 실행 수 (전체 호출 속도는 API 제한에 맞춰 자동 조절)")
+        ctrl_layout.addWidget(self.spin_workers)
         layout.addLayout(ctrl_layout)
         
         # 탭 필터
@@ -424,7 +473,7 @@ class ExtensionManagerWidget(QWidget):
         self.tabs.addTab(QWidget(), "위치/플레이스 (PLACE)")
         self.tabs.addTab(QWidget(), "서브링크 (SUB_LINKS)")
         self.tabs.addTab(QWidget(), "이미지 (IMAGES)")
-        self.tabs.currentChanged.connect(self.render_list)
+        self.tabs.currentChanged.connect(lambda _: self.render_list())
         layout.addWidget(self.tabs)
         
         # 일괄 등록 버튼 (NEW)
@@ -435,34 +484,69 @@ class ExtensionManagerWidget(QWidget):
         layout.addWidget(self.btn_bulk_register_multi)
 
         # 리스트 영역
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setStyleSheet("background-color: #f1f3f5; border: 1px solid #ddd;")
-        
-        self.scroll_content = QWidget()
-        self.scroll_vbox = QVBoxLayout(self.scroll_content)
-        self.scroll_vbox.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.scroll.setWidget(self.scroll_content)
-        layout.addWidget(self.scroll)
+        # 리스트 영역 - 보이는 카드만 만들고 스크롤 시 재사용
+        self.card_list = VirtualCardList(
+            make_card=lambda: ExtensionGroupCard(self),
+            estimate=lambda g: 900 if g['type'] in self.IMAGE_TYPES else 380,
+            key=lambda g: g['key'],
+            empty_text="해당하는 확장소재가 없습니다."
+        )
+        self.card_list.setStyleSheet("background-color: #f1f3f5; border: 1px solid #ddd;")
+        layout.addWidget(self.card_list)
         
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         layout.addWidget(self.progress_bar)
         
+        # 일괄 작업 진행 (동기화 진행률과 별도)
+        self.bulk_row = QWidget()
+        bulk_layout = QHBoxLayout(self.bulk_row)
+        bulk_layout.setContentsMargins(0, 0, 0, 0)
+        self.bulk_bar = QProgressBar()
+        self.btn_bulk_cancel = QPushButton("⏹ 중지")
+        self.btn_bulk_cancel.clicked.connect(self.stop_bulk)
+        bulk_layout.addWidget(self.bulk_bar, 1)
+        bulk_layout.addWidget(self.btn_bulk_cancel)
+        self.bulk_row.setVisible(False)
+        layout.addWidget(self.bulk_row)
+        
         self.load_campaigns()
 
     def load_channels(self):
         try: self.channels = api.get_biz_channels()
         except: pass
+        self.channel_index = {c['nccBusinessChannelId']: c for c in self.channels if isinstance(c, dict)}
+        # 채널보다 소재 목록이 먼저 그려졌으면 채널 이름으로 다시 표시
+        camp_id = self.combo_camp.currentData()
+        if camp_id and self.grouped_extensions:
+            self.show_index(camp_id)
+
+    def refresh_extensions(self):
+        """현재 캠페인 소재를 전부 다시 조회 + 캠페인 목록 갱신"""
+        camp_id = self.combo_camp.currentData()
+        if camp_id:
+            extension_index.invalidate(camp_id)
+        account_tree.invalidate()
+        self.load_campaigns()
 
     def load_campaigns(self):
+        # 공용 계정 트리 스냅샷 사용 (최신이면 API 호출 없음, 아니면 백그라운드 조회)
+        load_tree_async(self.on_tree_loaded)
+
+    def on_tree_loaded(self, tree):
+        current = self.combo_camp.currentData()
+        self.combo_camp.blockSignals(True)
         self.combo_camp.clear()
-        try:
-            camps = api.get_campaigns()
-            for c in camps:
-                self.combo_camp.addItem(c['name'], c['nccCampaignId'])
-        except Exception as e:
-            QMessageBox.warning(self, "오류", f"데이터 로드 실패: {e}")
+        for c, _ in tree:
+            self.combo_camp.addItem(c.name, c.id)
+        self.combo_camp.blockSignals(False)
+        if not tree:
+            QMessageBox.warning(self, "오류", "캠페인 목록을 불러오지 못했습니다.")
+            return
+        # 새로고침이면 보던 캠페인 유지
+        idx = self.combo_camp.findData(current) if current else -1
+        self.combo_camp.setCurrentIndex(idx if idx >= 0 else 0)
+        self.on_campaign_changed()
 
     def on_campaign_changed(self):
         camp_id = self.combo_camp.currentData()
@@ -470,242 +554,149 @@ class ExtensionManagerWidget(QWidget):
         self.analyze_extensions(camp_id)
 
     def analyze_extensions(self, camp_id):
-        self.clear_list()
-        self.progress_bar.setValue(0)
-        self.progress_bar.setVisible(True)
+        """인덱스에 있는 소재로 바로 그리고, 오래된 소유자만 백그라운드에서 다시 조회"""
+        groups = self.adgroups_by_campaign.get(camp_id)
+        if groups is None:
+            groups = [{'nccAdgroupId': g.id, 'name': g.name} for g in account_tree.groups_of(camp_id)]
+        self.all_adgroups = groups
+        self.show_index(camp_id)
         
-        try:
-            # 1. 광고그룹 가져오기
-            self.all_adgroups = api.get_adgroups(camp_id)
-            if not self.all_adgroups:
-                self.progress_bar.setVisible(False)
-                return
-
-            raw_exts = []
-            
-            # 2. [수정됨] 멀티스레딩으로 속도 개선 (기존 순차처리 -> 병렬처리)
-            total = len(self.all_adgroups)
-            
-            # 캠페인 레벨 확장소재도 포함 (1회 호출)
-            camp_exts = api.get_extensions(camp_id)
-            if camp_exts: raw_exts.extend(camp_exts)
-            
-            # 헬퍼 함수
-            def fetch_ext(grp):
-                # [안전장치] 너무 빠른 동시 호출 방지 (랜덤 딜레이 미세 추가 가능하지만, requests pool이 처리함)
-                # 필요시 time.sleep(0.1) 추가
-                return api.get_extensions(grp['nccAdgroupId'])
-
-            # 병렬 실행 (최대 10개 스레드)
-            with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-                futures = {executor.submit(fetch_ext, grp): grp for grp in self.all_adgroups}
-                
-                for i, future in enumerate(concurrent.futures.as_completed(futures)):
-                    try:
-                        exts = future.result()
-                        if exts: raw_exts.extend(exts)
-                    except Exception as e:
-                        print(f"Extension fetch failed: {e}")
-                    
-                    # 진행률 업데이트
-                    self.progress_bar.setValue(int((i+1)/total * 100))
-                    QApplication.processEvents() # UI 응답성 유지
-
-            self.progress_bar.setVisible(False)
-            
-            # 3. 그룹핑 로직
-            # [디버깅] 발견된 확장소재 타입 로깅
-            seen_types = set()
-            
-            groups = {}
-            for ext in raw_exts:
-                t = ext['type']
-                if t not in seen_types:
-                    # [DEBUG] 처음 보는 타입이면 샘플 데이터 출력
-                    print(f"[DEBUG_EXT] Type Found: {t}, ID: {ext.get('nccAdExtensionId')}", flush=True)
-                    # HEADLINE, DESCRIPTION 등 문제 타입 상세 출력
-                if t in ['HEADLINE', 'DESCRIPTION', 'VIEW', 'BLOG', 'CAFE', 'POST', 'POWER_CONTENT', 'POWER_LINK_IMAGE', 'IMAGE_SUB_LINKS']:
-                    print(f"[DEBUG_EXT_CONTENT] {t} -> extension: {ext.get('extension')} / adExtension: {ext.get('adExtension')}", flush=True)
-                    print(f"[DEBUG_EXT_FULL] {t} -> full data: {json.dumps(ext, ensure_ascii=False)}", flush=True)
-                seen_types.add(t)
-                
-                # [수정] GET 응답에서는 'adExtension' 필드에 실제 데이터가 들어있음 ('extension' 아님)
-                content_key = json.dumps(ext.get('adExtension') or {}, sort_keys=True)
-                channel_id = ext.get('pcChannelId') or ext.get('mobileChannelId') or ''
-                unique_key = f"{t}|{content_key}|{channel_id}"
-                
-                if unique_key not in groups:
-                    ch_name = channel_id
-                    ch_url = ''
-                    if channel_id:
-                        found_ch = next((c for c in self.channels if c['nccBusinessChannelId'] == channel_id), None)
-                        if found_ch:
-                            ch_name = found_ch['name']
-                            ch_url = found_ch.get('channelKey', '')
-
-                    groups[unique_key] = {
-                        'type': ext['type'],
-                        'content': ext.get('adExtension') or {},
-                        'businessChannelId': channel_id,
-                        'channelName': ch_name,
-                        'channelUrl': ch_url,
-                        'ownerIds': [],
-                        'items': []
-                    }
-                
-                groups[unique_key]['ownerIds'].append(ext['ownerId'])
-                groups[unique_key]['items'].append(ext)
-            
-            self.progress_bar.setVisible(False)
-            print(f"[DEBUG] Found Extension Types in Campaign {camp_id}: {seen_types}")
-            
-            self.grouped_extensions = list(groups.values())
-            self.render_list()
-            
-        except Exception as e:
-            self.progress_bar.setVisible(False)
-            QMessageBox.critical(self, "오류", f"분석 중 오류 발생: {e}")
+        if self.sync_worker and self.sync_worker.isRunning():
+            self.pending_sync = camp_id
+            return
+        self.start_sync(camp_id)
 
-    def render_list(self):
-        self.clear_list()
-        
-        current_tab_idx = self.tabs.currentIndex()
-        target_types = []
-        if current_tab_idx == 1: target_types = ['PHONE']
-        elif current_tab_idx == 2: target_types = ['PLACE', 'LOCATION']
-        elif current_tab_idx == 3: target_types = ['SUB_LINKS']
-        elif current_tab_idx == 4: target_types = ['POWER_LINK_IMAGE', 'IMAGE_SUB_LINKS']
-        
-        cnt = 0
-        for group in self.grouped_extensions:
-            if target_types and group['type'] not in target_types:
-                continue
-            
-            card = ExtensionGroupCard(group, self.all_adgroups, self)
-            self.scroll_vbox.addWidget(card)
-            cnt += 1
-            
-        if cnt == 0:
-            lbl = QLabel("해당하는 확장소재가 없습니다.")
-            lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.scroll_vbox.addWidget(lbl)
-            self.btn_bulk_register_multi.setVisible(False)
+    def start_sync(self, camp_id):
+        self.pending_sync = None
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.sync_worker = ExtensionSyncWorker(camp_id)
+        self.sync_worker.groups_signal.connect(self.on_sync_groups)
+        self.sync_worker.progress_signal.connect(self.progress_bar.setValue)
+        self.sync_worker.finished_signal.connect(self.on_sync_finished)
+        self.sync_worker.start()
+
+    def show_index(self, camp_id):
+        self.grouped_extensions = extension_index.campaign_groups(camp_id, self.channel_index)
+        same_campaign = camp_id == self.shown_campaign
+        if not same_campaign:
+            self.selection = {}
+        self.shown_campaign = camp_id
+        self.type_index = {}
+        for i, group in enumerate(self.grouped_extensions):
+            self.type_index.setdefault(group['type'], []).append(i)
+        # 같은 캠페인 갱신(일괄 작업 후 등)이면 스크롤 위치 유지
+        self.render_list(keep_scroll=same_campaign)
+
+    def selection_of(self, key):
+        return self.selection.setdefault(key, {'copy': set(), 'mgmt': set()})
+
+    def on_sync_groups(self, camp_id, groups):
+        changed = [g['nccAdgroupId'] for g in groups] != [g['nccAdgroupId'] for g in self.adgroups_by_campaign.get(camp_id, [])]
+        self.adgroups_by_campaign[camp_id] = groups
+        if camp_id == self.combo_camp.currentData() and changed:
+            self.all_adgroups = groups
+            self.sync_groups_changed = True
+
+    def on_sync_finished(self, camp_id, fetched):
+        self.progress_bar.setVisible(False)
+        changed, self.sync_groups_changed = self.sync_groups_changed, False
+        if self.pending_sync and self.pending_sync != camp_id:
+            self.start_sync(self.pending_sync)
+            return
+        self.pending_sync = None
+        # 새로 받은 소재가 있거나 그룹 구성이 바뀐 경우에만 다시 그림
+        if camp_id == self.combo_camp.currentData() and (fetched > 0 or changed):
+            self.show_index(camp_id)
+
+    def render_list(self, keep_scroll=False):
+        target_types = self.TAB_TYPES[self.tabs.currentIndex()] if 0 <= self.tabs.currentIndex() < len(self.TAB_TYPES) else None
+        if target_types is None:
+            self.visible_groups = self.grouped_extensions
         else:
-            self.btn_bulk_register_multi.setVisible(True)
-
-    def clear_list(self):
-        while self.scroll_vbox.count():
-            item = self.scroll_vbox.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
+            rows = sorted(i for t in target_types for i in self.type_index.get(t, []))
+            self.visible_groups = [self.grouped_extensions[i] for i in rows]
+        
+        self.card_list.set_items(self.visible_groups, keep_scroll=keep_scroll)
+        self.btn_bulk_register_multi.setVisible(bool(self.visible_groups))
 
     def run_bulk_copy(self, target_group_ids, ext_data):
-        success_cnt = 0
-        fail_cnt = 0
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        total = len(target_group_ids)
-        
-        for i, gid in enumerate(target_group_ids):
-            try:
-                # [속도 조절] 네이버 API 1010/1014 에러 방지 (1.0초 대기)
-                time.sleep(1.0)
-                
-                res = api.create_extension(
-                    owner_id=gid,
-                    type_str=ext_data['type'],
-                    content_dict=ext_data['content'],
-                    channel_id=ext_data['businessChannelId']
-                )
-                
-                # [수정] 응답 검증 - 'nccAdExtensionId'가 있어야 성공
-                if isinstance(res, dict) and 'nccAdExtensionId' in res:
-                    success_cnt += 1
-                elif isinstance(res, dict) and res.get('error'):
-                    # 실제 에러인 경우만 로그 출력
-                    print(f"[EXT_COPY_FAIL] Type:{ext_data['type']} Group:{gid} Res:{res}", flush=True)
-                    fail_cnt += 1
-                else:
-                    # 성공이지만 예상치 못한 응답 구조
-                    print(f"[EXT_COPY_WARN] Type:{ext_data['type']} Group:{gid} Unexpected Res:{res}", flush=True)
-                    success_cnt += 1
-                    fail_cnt += 1
-
-            except Exception as e:
-                print(f"[EXT_COPY_ERR] Group:{gid} Type:{ext_data['type']} Exception:{e}", flush=True)
-                fail_cnt += 1
-            
-            self.progress_bar.setValue(int((i+1)/total * 100))
-            QApplication.processEvents()
-                
-        self.progress_bar.setVisible(False)
-        QMessageBox.information(self, "완료", f"작업이 완료되었습니다.\n성공: {success_cnt}건\n실패: {fail_cnt}건\n(실패 사유는 로그를 확인하세요)")
-        self.on_campaign_changed()
+        names = {g['nccAdgroupId']: g['name'] for g in self.all_adgroups}
+        self.start_bulk([copy_task(gid, ext_data, names.get(gid, "")) for gid in target_group_ids], "복사")
 
     def run_bulk_delete(self, ext_ids):
-        success_cnt = 0
-        fail_cnt = 0
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        total = len(ext_ids)
-
-        for i, eid in enumerate(ext_ids):
-            try:
-                time.sleep(1.0)
-                res = api.delete_extension(eid)
-                if res is not None and not (isinstance(res, dict) and res.get('error')):
-                    success_cnt += 1
-                else:
-                    print(f"[EXT_DEL_FAIL] ID:{eid} Res:{res}", flush=True)
-                    fail_cnt += 1
-            except Exception as e:
-                print(f"[EXT_DEL_ERR] ID:{eid} Exception:{e}", flush=True)
-                fail_cnt += 1
-
-            self.progress_bar.setValue(int((i+1)/total * 100))
-            QApplication.processEvents()
-
-        self.progress_bar.setVisible(False)
-        QMessageBox.information(self, "삭제 완료", f"삭제 완료\n성공: {success_cnt}건\n실패: {fail_cnt}건")
-        self.on_campaign_changed()
+        self.start_bulk([delete_task(eid) for eid in ext_ids], "삭제")
 
     def run_bulk_toggle(self, ext_ids, user_lock):
         action = "끄기" if user_lock else "켜기"
-        success_cnt = 0
-        fail_cnt = 0
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        total = len(ext_ids)
-
-        for i, eid in enumerate(ext_ids):
-            try:
-                time.sleep(1.0)
-                res = api.toggle_extension(eid, user_lock)
-                if res is not None and not (isinstance(res, dict) and res.get('error')):
-                    success_cnt += 1
-                else:
-                    print(f"[EXT_TOGGLE_FAIL] ID:{eid} Lock:{user_lock} Res:{res}", flush=True)
-                    fail_cnt += 1
-            except Exception as e:
-                print(f"[EXT_TOGGLE_ERR] ID:{eid} Exception:{e}", flush=True)
-                fail_cnt += 1
+        self.start_bulk([toggle_task(eid, user_lock) for eid in ext_ids], action)
 
-            self.progress_bar.setValue(int((i+1)/total * 100))
-            QApplication.processEvents()
-
-        self.progress_bar.setVisible(False)
-        QMessageBox.information(self, f"{action} 완료", f"{action} 완료\n성공: {success_cnt}건\n실패: {fail_cnt}건")
+    def start_bulk(self, tasks, title):
+        if not tasks:
+            return
+        if self.bulk_worker and self.bulk_worker.isRunning():
+            QMessageBox.warning(self, "경고", "이미 일괄 작업이 진행 중입니다.")
+            return
+        self.bulk_bar.setRange(0, len(tasks))
+        self.bulk_bar.setValue(0)
+        self.bulk_bar.setFormat(f"{title} %v/%m")
+        self.btn_bulk_cancel.setEnabled(True)
+        self.bulk_row.setVisible(True)
+        self.btn_bulk_register_multi.setEnabled(False)
+
+        self.bulk_worker = BulkOperationWorker(tasks, workers=self.spin_workers.value())
+        self.bulk_worker.progress_signal.connect(lambda done, _total: self.bulk_bar.setValue(done))
+        self.bulk_worker.finished_signal.connect(lambda s, f, c: self.on_bulk_finished(title, s, f, c))
+        self.bulk_worker.start()
+
+    def stop_bulk(self):
+        if self.bulk_worker and self.bulk_worker.isRunning():
+            self.bulk_worker.stop()
+            self.btn_bulk_cancel.setEnabled(False)
+            self.bulk_bar.setFormat("중지 중... %v/%m")
+
+    def on_bulk_finished(self, title, success, fail, skipped):
+        worker = self.bulk_worker
+        self.bulk_row.setVisible(False)
+        self.btn_bulk_register_multi.setEnabled(True)
+
+        msg = f"{title} 완료\n성공: {success}건\n실패: {fail}건"
+        if worker.unknown:
+            msg += f" (등록 여부 확인 필요 {len(worker.unknown)}건 - 재시도 제외)"
+        if skipped:
+            msg += f"\n중지로 미실행: {skipped}건"
+        box = QMessageBox(self)
+        box.setWindowTitle(f"{title} 완료")
+        box.setText(msg)
+        failures = [f"{t.label} - {worker.results[t.key][1]}" for t in worker.tasks
+                    if t.key in worker.results and not worker.results[t.key][0]]
+        if failures:
+            box.setDetailedText("\n".join(failures))
+        btn_retry = None
+        retry = worker.failed_tasks()
+        if retry:
+            btn_retry = box.addButton(f"실패/미실행 {len(retry)}건 재시도", QMessageBox.ButtonRole.ActionRole)
+        box.addButton(QMessageBox.StandardButton.Ok)
+        box.exec()
+
+        # 인덱스는 API 알림으로 이미 갱신됨 -> 다시 그리기만
         self.on_campaign_changed()
+        if btn_retry is not None and box.clickedButton() is btn_retry:
+            self.start_bulk(retry, title)
 
     def on_bulk_register_multi_clicked(self):
         from PyQt6.QtWidgets import QMessageBox
         tasks = []
-        for i in range(self.scroll_vbox.count()):
-            widget = self.scroll_vbox.itemAt(i).widget()
-            if isinstance(widget, ExtensionGroupCard):
-                for chk in widget.check_boxes:
-                    if chk.isChecked():
-                        gid = chk.property('groupId')
-                        tasks.append({"groupId": gid, "ext_data": widget.data})
+        # 화면 밖 카드의 체크도 포함 (체크 상태는 selection 에 보관)
+        for group in self.visible_groups:
+            selected = self.selection.get(group['key'])
+            if not selected or not selected['copy']:
+                continue
+            used = set(group['ownerIds'])
+            for g in self.all_adgroups:
+                gid = g['nccAdgroupId']
+                if gid in selected['copy'] and gid not in used:
+                    tasks.append({"groupId": gid, "ext_data": group})
                         
         if not tasks:
             QMessageBox.warning(self, "경고", "선택된 확장소재-그룹 항목이 없습니다.")
@@ -717,42 +708,5 @@ class ExtensionManagerWidget(QWidget):
         self.run_bulk_copy_multi(tasks)
 
     def run_bulk_copy_multi(self, tasks):
-        from PyQt6.QtWidgets import QApplication, QMessageBox
-        import time
-        success_cnt = 0
-        fail_cnt = 0
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        total = len(tasks)
-        
-        for i, task in enumerate(tasks):
-            gid = task["groupId"]
-            ext_data = task["ext_data"]
-            try:
-                time.sleep(1.0)
-                
-                res = api.create_extension(
-                    owner_id=gid,
-                    type_str=ext_data['type'],
-                    content_dict=ext_data['content'],
-                    channel_id=ext_data.get('businessChannelId')
-                )
-                
-                if isinstance(res, dict) and 'nccAdExtensionId' in res:
-                    success_cnt += 1
-                elif isinstance(res, dict) and res.get('error'):
-                    print(f"[EXT_COPY_FAIL] Type:{ext_data['type']} Group:{gid} Res:{res}", flush=True)
-                    fail_cnt += 1
-                else:
-                    success_cnt += 1
-                    fail_cnt += 1
-            except Exception as e:
-                print(f"[EXT_COPY_ERR] Group:{gid} Type:{ext_data['type']} Exception:{e}", flush=True)
-                fail_cnt += 1
-            
-            self.progress_bar.setValue(int((i+1)/total * 100))
-            QApplication.processEvents()
-                
-        self.progress_bar.setVisible(False)
-        QMessageBox.information(self, "완료", f"일괄 등록이 완료되었습니다.\n성공: {success_cnt}건\n실패: {fail_cnt}건\n(실패 사유는 콘솔 로그 참조)")
-        self.on_campaign_changed()
\ No newline at end of file
+        names = {g['nccAdgroupId']: g['name'] for g in self.all_adgroups}
+        self.start_bulk([copy_task(t["groupId"], t["ext_data"], names.get(t["groupId"], "")) for t in tasks], "일괄 등록")
@@ -1,15 +1,23 @@
 import sys
 import re
-import time
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, 
-    QTextEdit, QPushButton, QTableWidget, QTableWidgetItem, 
+    QTextEdit, QPushButton, 
     QHeaderView, QMessageBox, QGroupBox, QCheckBox, QSplitter,
-    QProgressBar, QTabWidget
+    QProgressBar, QTabWidget, QTableView
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QColor, QBrush
+from PyQt6.QtGui import QColor
 from api.api_client import api
+from logic.keyword_index import keyword_index
+from logic.account_tree import account_tree, load_tree_async
+from logic.keyword_planner import KeywordPlanner
+from logic.asset_cloner import AssetCloner
+from logic.register_journal import RegisterJob
+from logic.keyword_cleanup import KeywordDeleteWorker, DuplicateScanWorker
+from logic.event_bridge import BatchingBridge
+from logic.keyword_expander import KeywordExpansion, parse_mapping, split_keywords
+from ui.table_models import KeywordTaskModel, ColumnarTableModel
 
 # -------------------------------------------------------------------------
 # [작업 스레드] 스마트 키워드 등록 (워터폴 + 강력한 검증 및 에러 핸들링)
@@ -19,17 +27,31 @@ class KeywordRegisterWorker(QThread):
     progress_signal = pyqtSignal(int, int) 
     log_signal = pyqtSignal(int, str, str)
     result_signal = pyqtSignal(int, int)
+    clone_signal = pyqtSignal(str)
     
-    def __init__(self, task_list):
+    def __init__(self, task_list, job=None):
         super().__init__()
         self.task_list = task_list
+        # job 이 주어지면 저널의 남은 작업부터 재개 (task_list 는 무시)
+        self.job = job
+        self.is_resume = job is not None
         self.is_running = True
+        # 신규 그룹 자산 복제는 백그라운드 큐에서 처리 (키워드 등록은 기다리지 않음)
+        self.cloner = AssetCloner(on_status=self.on_clone_status)
 
     def run(self):
+        success_cnt = 0
+        fail_cnt = 0
         try:
+            # 0. 작업 저널 준비 (신규 생성 또는 재개)
+            if self.is_resume:
+                self.job.resumed()
+                self.reconcile_in_doubt()
+                self.task_list = self.job.remaining_tasks()
+            else:
+                self.job = RegisterJob.create(self.task_list)
+
             total = len(self.task_list)
-            success_cnt = 0
-            fail_cnt = 0
             
             # 1. 초기 그룹 ID 기준 작업 분류 (Classifier)
             grouped_tasks = {}
@@ -58,285 +80,85 @@ class KeywordRegisterWorker(QThread):
                     self.progress_signal.emit(current_progress, total)
                     continue
 
-                # Set Navigation Info
-                navigate_gid = initial_gid
+                # Set Planner Info
                 navigate_name = original_grp_info['name']
                 campaign_id = original_grp_info['nccCampaignId']
-                pc_channel_id = original_grp_info.get('pcChannelId')
-                mobile_channel_id = original_grp_info.get('mobileChannelId')
-                adgroup_type = original_grp_info.get('adgroupType', 'WEB_SITE')
                 
                 # Base Name Extraction
                 base_name = re.sub(r'_\d+$', '', navigate_name)
                 
-                # Next Group Index Calculation
-                next_group_index = 1
+                # 원본 그룹이 base_name_N 이면 N번 그룹부터 채움
+                start_index = 0
                 if navigate_name != base_name:
                     try:
-                        next_group_index = int(navigate_name.split('_')[-1]) + 1
+                        start_index = int(navigate_name.split('_')[-1])
                     except:
-                        next_group_index = 1
-
-                # [중요] 전체 관련 그룹의 기존 키워드 수집 (중복 방지)
-                all_existing_keywords = set()
-                try:
-                    all_campaign_groups = api.get_adgroups(campaign_id)
-                    if isinstance(all_campaign_groups, list):
-                        for grp in all_campaign_groups:
-                            grp_name = grp.get('name', '')
-                            # base_name으로 시작하는 모든 그룹의 키워드 수집
-                            if grp_name.startswith(base_name):
-                                grp_id = grp['nccAdgroupId']
-                                grp_kwds = api.get_keywords(grp_id)
-                                if isinstance(grp_kwds, list):
-                                    for k in grp_kwds:
-                                        all_existing_keywords.add(k['keyword'].replace(" ", "").upper())
-                    self.log_batch(tasks, "준비", f"기존 키워드 {len(all_existing_keywords)}개 확인")
-                except Exception as e:
-                    self.log_batch(tasks, "경고", f"기존 키워드 조회 실패: {e}")
-
-                # Task Queues (전체 중복 제거)
-                keyword_queue = [t['keyword'] for t in tasks if t['keyword'].replace(" ", "").upper() not in all_existing_keywords]
-                task_queue = [t for t in tasks if t['keyword'].replace(" ", "").upper() not in all_existing_keywords]
-                
-                # 이미 등록된 키워드들은 스킵으로 처리
-                already_exist_count = len(tasks) - len(task_queue)
-                if already_exist_count > 0:
-                    self.log_batch(tasks[:already_exist_count], "스킵", "이미 등록됨")
-                    success_cnt += already_exist_count
-
-                loop_safety_counter = 0
+                        start_index = 0
 
-                while len(keyword_queue) > 0 and self.is_running:
-                    loop_safety_counter += 1
-                    if loop_safety_counter > 50: # Prevent infinite loop of group creations
-                         self.log_batch(task_queue, "중단", "그룹 생성 반복 횟수 초과 (50회)")
-                         fail_cnt += len(keyword_queue)
-                         break
-
-                    # ---------------------------------------------------------
-                    # [Step 1] Capacity Check
-                    # ---------------------------------------------------------
-                    time.sleep(0.5) 
-                    existing_kwds = api.get_keywords(navigate_gid)
-                    
-                    if isinstance(existing_kwds, dict) and existing_kwds.get('error'):
-                        self.log_batch(task_queue, "대기", "키워드 수 조회 실패. 재시도...")
-                        time.sleep(2.0)
-                        continue 
-                    elif isinstance(existing_kwds, list):
-                        current_count = len(existing_kwds)
-                    else:
-                        time.sleep(2.0)
-                        continue
-
-                    # [중요] 중복 키워드 필터링 (현재 그룹 + 전체 추적 세트)
-                    if isinstance(existing_kwds, list):
-                        exist_set = {k['keyword'].replace(" ", "").upper() for k in existing_kwds}
-                        # 전체 추적 세트와 현재 그룹 키워드를 합쳐서 중복 체크
-                        combined_exist_set = all_existing_keywords | exist_set
-                        
-                        # 큐에서 이미 존재하는 것들은 제거
-                        filtered_keyword_queue = []
-                        filtered_task_queue = []
-                        for i, k in enumerate(keyword_queue):
-                            k_upper = k.replace(" ", "").upper()
-                            if k_upper not in combined_exist_set:
-                                filtered_keyword_queue.append(k)
-                                filtered_task_queue.append(task_queue[i])
-                        
-                        keyword_queue = filtered_keyword_queue
-                        task_queue = filtered_task_queue
-                    
-                    if not keyword_queue:
-                         # 현재 그룹에서 할 게 없으면 다음 로직(확장 등)으로 넘어가거나 종료
-                         # 하지만 Capacity가 남아있는데 큐가 비었다면? -> 이미 다 등록된 것 -> Loop 종료
-                         break
-
-                    current_count = len(existing_kwds) if isinstance(existing_kwds, list) else 0
-                    capacity = 1000 - current_count
-                    
-                    # ---------------------------------------------------------
-                    # [Step 2] Register if Capacity > 0
-                    # ---------------------------------------------------------
-                    if capacity > 0:
-                        register_chunk = keyword_queue[:capacity]
-                        current_chunk_tasks = task_queue[:capacity]
-                        
-                        time.sleep(1.0) 
-                        
-                        res = api.create_keywords_bulk(navigate_gid, register_chunk)
-                        
-                        # [Result Validation]
-                        if isinstance(res, list) and len(res) > 0:
-                            n_success = len(res)
-                            self.log_batch(current_chunk_tasks[:n_success], "성공", f"{navigate_name} 등록함")
-                            success_cnt += n_success
-                            
-                            # 성공한 키워드를 전체 추적 세트에 추가
-                            for kwd in register_chunk[:n_success]:
-                                all_existing_keywords.add(kwd.replace(" ", "").upper())
-                            
-                            keyword_queue = keyword_queue[n_success:]
-                            task_queue = task_queue[n_success:]
-                            
-                            # 키워드가 남아있으면 다시 Step 1로 돌아가서 현재 그룹 capacity 재확인
-                            if keyword_queue:
-                                continue
-                        
-                        elif isinstance(res, dict) and res.get('error'):
-                            # API Error (Validation or System)
-                            err_code = res.get('code')
-                            err_msg = res.get('data', {}).get('message', '알 수 없음')
-                            self.log_batch(current_chunk_tasks, "실패", f"Err {err_code}: {err_msg}")
-                            
-                            # CRITICAL: If registration fails for a chunk, we must skip these keywords 
-                            # or stop to prevent creating new groups infinitely for the SAME bad keywords.
-                            # Here we treat them as failed and remove from queue
-                            fail_cnt += len(register_chunk)
-                            keyword_queue = keyword_queue[len(register_chunk):]
-                            task_queue = task_queue[len(register_chunk):]
-                            
-                        elif isinstance(res, list) and len(res) == 0:
-                             # Returned empty list despite sending -> Validation failed for all
-                             self.log_batch(current_chunk_tasks, "실패", "키워드 등록 실패 (검증 미통과)")
-                             fail_cnt += len(register_chunk)
-                             keyword_queue = keyword_queue[len(register_chunk):]
-                             task_queue = task_queue[len(register_chunk):]
-
-                    if not keyword_queue:
-                        break
-
-                    # ---------------------------------------------------------
-                    # [Step 3] Waterfall Expansion (현재 그룹이 꽉 찬 경우에만)
-                    # ---------------------------------------------------------
-                    # capacity가 0이면 현재 그룹이 꽉 찼으므로 다음 그룹으로 이동
-                    found_next_group = False
-                    retry_limit = 0 
-                    
-                    while not found_next_group and self.is_running and retry_limit < 100:
-                        retry_limit += 1
-                        target_name = f"{base_name}_{next_group_index}"
-                        self.log_batch(task_queue, "이동중", f"{target_name} 탐색...")
-                        
-                        # [Find]
-                        time.sleep(0.5)
-                        all_grps = api.get_adgroups(campaign_id)
-                        
-                        target_grp = None
-                        if isinstance(all_grps, list):
-                            target_grp = next((g for g in all_grps if g['name'].strip() == target_name), None)
-                        
-                        if target_grp:
-                            # Found existing group
-                            navigate_gid = target_grp['nccAdgroupId']
-                            navigate_name = target_grp['name']
-                            found_next_group = True
-                            self.log_batch(task_queue, "전환", f"기존 그룹({navigate_name})로 이동")
-                        
-                        else:
-                            # [Create]
-                            time.sleep(1.0)
-                            new_grp_res = api.create_adgroup(
-                                campaign_id, target_name,
-                                pc_channel_id, mobile_channel_id,
-                                adgroup_type
-                            )
-                            
-                            if new_grp_res and isinstance(new_grp_res, dict) and 'nccAdgroupId' in new_grp_res:
-                                navigate_gid = new_grp_res['nccAdgroupId']
-                                navigate_name = new_grp_res['name']
-                                found_next_group = True
-                                self.log_batch(task_queue, "생성", f"새 그룹({navigate_name}) 생성")
-                                
-                                # [Asset Clone]
-                                self.clone_assets(initial_gid, navigate_gid)
-                            
-                            elif isinstance(new_grp_res, dict) and new_grp_res.get('error'):
-                                code = str(new_grp_res.get('code'))
-                                if code == '3710':
-                                    self.log_batch(task_queue, "재시도", "이름 중복. 그룹 재검색...")
-                                    time.sleep(1.0) 
-                                    continue 
-                                elif code == '1014':
-                                    self.log_batch(task_queue, "대기", "API 1014... 5초 대기")
-                                    time.sleep(5.0)
-                                    continue
-                                else:
-                                    self.log_batch(task_queue, "확장오류", f"생성실패 {code}")
-                                    next_group_index += 1
-                            else:
-                                next_group_index += 1
-                        
-                        if found_next_group:
-                            next_group_index += 1
-                        
-                    if not found_next_group:
-                        self.log_batch(task_queue, "실패", "그룹 확장 실패")
-                        fail_cnt += len(keyword_queue)
-                        keyword_queue = [] 
-                        break
+                # [중요] 묶음 그룹 스냅샷 1회 -> 전체 배치 계획 -> 100개 배치 병렬 등록
+                # 중복 판정은 키워드 인덱스, 그룹 한도(1000)는 스냅샷 시점 키워드 수 기준
+                # 재개 시에는 인덱스(저널 진행분 반영됨)를 그대로 믿고 그룹 재조회를 생략
+                planner = KeywordPlanner(
+                    campaign_id, base_name, original_grp_info,
+                    journal=self.job,
+                    snapshot_max_age=float('inf') if self.is_resume else None
+                )
+                base_progress = current_progress
+                result = planner.run(
+                    tasks, self.log_batch,
+                    start_index=start_index,
+                    on_group_created=lambda gid, src=initial_gid: self.cloner.enqueue(src, gid),
+                    on_progress=lambda done, base=base_progress: self.progress_signal.emit(min(base + done, total), total),
+                    should_stop=lambda: not self.is_running
+                )
+                success_cnt += result.success
+                fail_cnt += result.failed
+                if result.leftover:
+                    self.log_batch(result.leftover, "실패", "그룹 확장 실패 / 중단")
+                    fail_cnt += len(result.leftover)
                 
                 current_progress += len(tasks)
                 self.progress_signal.emit(current_progress, total)
 
+            # 남은 자산 복제 완료 대기 후 결과 보고
+            self.cloner.wait()
+            self.cloner.shutdown()
+            self.job.finish("done" if self.is_running and not self.job.remaining_tasks() else "stopped")
             self.result_signal.emit(success_cnt, fail_cnt)
             
         except Exception as e:
             print(f"Worker Exception: {e}")
+            if self.job:
+                try: self.job.finish("stopped")
+                except: pass
             # Ensure signals work even in error
             try: self.result_signal.emit(success_cnt, fail_cnt)
             except: pass
 
-    def clone_assets(self, src_gid, dst_gid):
-        """ 자산(소재, 확장소재) 복제 - 개선된 로직 """
-        try:
-            # 1. 확장소재 (Refer to tab_extension.py)
-            time.sleep(1.0) 
-            exts = api.get_extensions(src_gid)
-            if isinstance(exts, list):
-                for ext in exts:
-                    if ext.get("type") in ["IMAGE_SUB_LINKS", "POWER_LINK_IMAGE"]: continue
-                    
-                    try:
-                        # [수정] tab_extension.py 방식 적용: content 및 channel_id 안전하게 추출
-                        content = ext.get('extension') or {}
-                        
-                        # PHONE, SUB_LINKS 등은 content 필수
-                        if ext.get("type") in ["PHONE", "SUB_LINKS"] and not content:
-                            continue
-
-                        channel_id = ext.get('pcChannelId') or ext.get('mobileChannelId')
-                        
-                        time.sleep(1.0) # [속도 조절] 0.5s -> 1.0s
-                        api.create_extension(dst_gid, ext['type'], content, channel_id)
-                    except:
-                        pass
+    def reconcile_in_doubt(self):
+        """ 전송 후 결과 기록 전에 중단된 배치: 해당 그룹만 재조회해 실제 등록 여부 판정 """
+        for bid, batch in self.job.in_doubt_batches().items():
+            gid = batch['adgroup_id']
+            if keyword_index.sync_group(gid, name=batch['group_name']) is None:
+                continue  # 조회 실패 시 확인 필요 상태로 유지 (다음 재개 때 다시 판정)
+            ok, retry = [], []
+            for r in batch['rows']:
+                kwd = self.job.tasks[r]['keyword']
+                if any(g == gid for g, _ in keyword_index.lookup(kwd)):
+                    ok.append(r)
+                else:
+                    retry.append(r)
+            self.job.reconciled(bid, ok, retry)
+            self.log_batch([self.job.tasks[r] for r in ok], "성공", f"{batch['group_name']} 등록 확인 (재개)")
 
-            # 2. 소재 (Ads)
-            time.sleep(1.0)
-            ads = api.get_ads(src_gid)
-            if isinstance(ads, list):
-                for ad in ads:
-                    try:
-                        c = ad.get('ad')
-                        if not c: continue
-                        
-                        # [오류 해결 1010] headline 등 필수 필드가 없으면 스킵
-                        if not c.get('headline') or not c.get('description'):
-                            continue
-                            
-                        time.sleep(1.0) # [속도 조절] 0.5s -> 1.0s
-                        api.create_ad(
-                            dst_gid, 
-                            c.get('headline'), 
-                            c.get('description'), 
-                            c.get('pc', {}).get('final'), 
-                            c.get('mobile', {}).get('final')
-                        )
-                    except: pass
-        except Exception as e:
-            print(f"Asset Clone Error: {e}")
+    def on_clone_status(self, status):
+        """ 복제 작업 스레드에서 호출 -> 그룹별 현황 요약을 시그널로 전달 """
+        states = [st.state for st in self.cloner.status()]
+        done = sum(1 for st in states if st in ("완료", "일부실패", "실패"))
+        failed = sum(1 for st in states if st in ("일부실패", "실패"))
+        if status.state in ("일부실패", "실패"):
+            print(f"[CLONE] {status.dst_gid} {status.state}: {status.message}")
+        self.clone_signal.emit(f"자산 복제 {done}/{len(states)}" + (f" (실패 {failed})" if failed else ""))
 
     def log_batch(self, tasks, status, msg):
         for t in tasks:
@@ -353,7 +175,15 @@ class KeywordExpanderWidget(QWidget):
         super().__init__()
         self.adgroups_map = {} 
         self.generated_list = [] 
+        self.expansion = None  # 미리보기 조합 생성기 (KeywordExpansion)
         self.worker = None
+        self.delete_worker = None
+        self.scan_worker = None
+        # 워커 이벤트 묶음 전달 (행 로그 / 진행률)
+        self.log_bridge = BatchingBridge(parent=self)
+        self.log_bridge.batch_signal.connect(self.update_logs)
+        self.progress_bridge = BatchingBridge(coalesce=True, parent=self)
+        self.progress_bridge.batch_signal.connect(lambda batch: self.progress.setValue(batch[-1][0]))
         self.init_ui()
 
     def init_ui(self):
@@ -412,20 +242,28 @@ class KeywordExpanderWidget(QWidget):
         
         right = QWidget(); r_vbox = QVBoxLayout(right)
         r_vbox.addWidget(QLabel("<b>생성 결과</b>"))
-        self.table = QTableWidget(); self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["그룹", "키워드", "상태", "메시지"])
+        # [수정] 대량 조합 미리보기: 가상 모델 + 스크롤 시 점진 로딩 (QTableWidgetItem 미사용)
+        self.task_model = KeywordTaskModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.task_model)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         r_vbox.addWidget(self.table)
         
         bar = QHBoxLayout()
         self.lbl_cnt = QLabel("0개")
+        self.lbl_clone = QLabel("")
         self.progress = QProgressBar()
         self.btn_run = QPushButton("일괄 등록")
         self.btn_run.setMinimumSize(100, 35)
         self.btn_run.setStyleSheet("background-color: #28a745; color: white; font-size: 11pt; font-weight: bold; padding: 8px;")
         self.btn_run.clicked.connect(self.run_register)
         self.btn_run.setEnabled(False)
-        bar.addWidget(self.lbl_cnt); bar.addWidget(self.progress); bar.addWidget(self.btn_run)
+        self.btn_resume = QPushButton("이어서 등록")
+        self.btn_resume.setMinimumSize(100, 35)
+        self.btn_resume.setStyleSheet("background-color: #fd7e14; color: white; font-size: 11pt; font-weight: bold; padding: 8px;")
+        self.btn_resume.clicked.connect(self.resume_register)
+        self.btn_resume.setEnabled(RegisterJob.has_unfinished())
+        bar.addWidget(self.lbl_cnt); bar.addWidget(self.lbl_clone); bar.addWidget(self.progress); bar.addWidget(self.btn_resume); bar.addWidget(self.btn_run)
         r_vbox.addLayout(bar)
         
         splitter = QSplitter(Qt.Orientation.Horizontal)
@@ -462,11 +300,11 @@ class KeywordExpanderWidget(QWidget):
         
         # 버튼
         h3 = QHBoxLayout()
-        btn_scan = QPushButton("🔍 중복 키워드 검색")
-        btn_scan.setMinimumSize(150, 35)
-        btn_scan.setStyleSheet("background-color: #0d6efd; color: white; font-size: 11pt; font-weight: bold; padding: 8px;")
-        btn_scan.clicked.connect(self.scan_duplicates)
-        h3.addWidget(btn_scan)
+        self.btn_cleanup_scan = QPushButton("🔍 중복 키워드 검색")
+        self.btn_cleanup_scan.setMinimumSize(150, 35)
+        self.btn_cleanup_scan.setStyleSheet("background-color: #0d6efd; color: white; font-size: 11pt; font-weight: bold; padding: 8px;")
+        self.btn_cleanup_scan.clicked.connect(self.scan_duplicates)
+        h3.addWidget(self.btn_cleanup_scan)
         
         self.btn_cleanup_delete = QPushButton("🗑️ 선택 항목 삭제")
         self.btn_cleanup_delete.setMinimumSize(140, 35)
@@ -478,9 +316,13 @@ class KeywordExpanderWidget(QWidget):
         layout.addLayout(h3)
         
         # 결과 테이블
-        self.cleanup_table = QTableWidget()
-        self.cleanup_table.setColumnCount(4)
-        self.cleanup_table.setHorizontalHeaderLabels(["선택", "그룹명", "키워드", "키워드 ID"])
+        self.cleanup_model = ColumnarTableModel(
+            ["group", "keyword", "id", "error"], ["그룹명", "키워드", "키워드 ID", "결과"],
+            foregrounds={"error": lambda r: QColor("red")},
+            checkable=True, key="id", parent=self
+        )
+        self.cleanup_table = QTableView()
+        self.cleanup_table.setModel(self.cleanup_model)
         self.cleanup_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
         layout.addWidget(self.cleanup_table)
         
@@ -490,99 +332,120 @@ class KeywordExpanderWidget(QWidget):
         layout.addWidget(self.cleanup_status)
 
     def load_campaigns(self):
+        # 공용 계정 트리 스냅샷 사용 (최신이면 API 호출 없음, 아니면 백그라운드 조회)
+        load_tree_async(self.on_tree_loaded)
+
+    def on_tree_loaded(self, tree):
         self.combo_camp.clear()
         self.cleanup_combo_camp.clear()
-        try:
-            camps = api.get_campaigns()
-            for c in camps:
-                self.combo_camp.addItem(c['name'], c['nccCampaignId'])
-                self.cleanup_combo_camp.addItem(c['name'], c['nccCampaignId'])
-        except: pass
+        for c, _ in tree:
+            self.combo_camp.addItem(c.name, c.id)
+            self.cleanup_combo_camp.addItem(c.name, c.id)
 
     def on_campaign_changed(self):
         self.adgroups_map = {}
         cid = self.combo_camp.currentData()
         if not cid: return
-        try:
-            grps = api.get_adgroups(cid)
-            for g in grps: self.adgroups_map[g['name'].strip()] = g['nccAdgroupId']
-        except: pass
+        # 등록으로 그룹이 새로 생겼으면 스냅샷이 무효화되어 있으므로 다시 조회 후 채움
+        load_tree_async(lambda _tree, cid=cid: self.fill_adgroups_map(cid))
+
+    def fill_adgroups_map(self, cid):
+        if cid != self.combo_camp.currentData():
+            return  # 조회하는 사이 다른 캠페인 선택
+        self.adgroups_map = {g.name.strip(): g.id for g in account_tree.groups_of(cid)}
 
     def generate_preview(self):
-        self.table.setRowCount(0); self.generated_list = []; self.btn_run.setEnabled(False)
+        self.task_model.clear(); self.generated_list = []; self.btn_run.setEnabled(False)
         map_txt = self.txt_mapping.toPlainText().strip()
         kwd_txt = self.txt_kwd.toPlainText().strip()
         if not map_txt or not kwd_txt: return QMessageBox.warning(self, "경고", "입력값 확인")
         
-        kwds = [k.strip() for k in re.split(r'[,\n]+', kwd_txt) if k.strip()]
-        lines = map_txt.splitlines()
-        tasks = []
-        for line in lines:
-            line = line.strip()
-            if not line: continue
-            match = re.match(r"^([^(]+)(?:\(([^)]+)\))?$", line)
-            if match:
-                gname = match.group(1).strip()
-                subs = match.group(2)
-                gid = self.adgroups_map.get(gname)
-                if not gid: 
-                    print(f"매칭 실패: {gname}")
-                    continue
-                geos = [s.strip() for s in subs.split(',') if s.strip()] if subs else [gname]
-                
-                for k in kwds:
-                    # 1. 지역+키워드 조합 (체크된 경우에만)
-                    if self.chk_ab.isChecked() or self.chk_ba.isChecked():
-                        for g in geos:
-                            if self.chk_ab.isChecked():
-                                tasks.append({'group_name': gname, 'group_id': gid, 'keyword': g+k})
-                            if self.chk_ba.isChecked():
-                                tasks.append({'group_name': gname, 'group_id': gid, 'keyword': k+g})
-                    
-                    # 2. 키워드만 (체크된 경우 한 번만 추가)
-                    if self.chk_b.isChecked():
-                        tasks.append({'group_name': gname, 'group_id': gid, 'keyword': k})
-                            
-        self.table.setRowCount(len(tasks))
-        for i, t in enumerate(tasks):
-            self.table.setItem(i, 0, QTableWidgetItem(t['group_name']))
-            self.table.setItem(i, 1, QTableWidgetItem(t['keyword']))
-            self.table.setItem(i, 2, QTableWidgetItem("대기"))
-            self.table.setItem(i, 3, QTableWidgetItem("-"))
-            t['row'] = i
-            self.generated_list.append(t)
-        self.lbl_cnt.setText(f"총 {len(tasks)}개")
-        if tasks: self.btn_run.setEnabled(True)
-        else: QMessageBox.warning(self, "알림", "매칭된 그룹 없음")
+        kwds = split_keywords(kwd_txt)
+        specs, unmatched = parse_mapping(map_txt, self.adgroups_map)
+        for gname in unmatched:
+            print(f"매칭 실패: {gname}")
+        if not specs:
+            return QMessageBox.warning(self, "알림", "매칭된 그룹 없음")
+        
+        # 조합은 생성기로 두고 화면에는 스크롤한 만큼만 가져옴
+        # 이미 등록된 키워드는 등록 작업과 같은 범위(같은 묶음 그룹 base_name*) 인덱스 기준으로 제외
+        cid = self.combo_camp.currentData()
+        existing = {gid: keyword_index.campaign_norms(cid, re.sub(r'_\d+$', '', gname)) for gname, gid, _ in specs}
+        self.expansion = KeywordExpansion(
+            specs, kwds,
+            use_ab=self.chk_ab.isChecked(), use_ba=self.chk_ba.isChecked(), use_b=self.chk_b.isChecked(),
+            existing=existing
+        )
+        self.task_model.set_source(self.expansion)
+        self.lbl_cnt.setText(f"최대 {self.expansion.upper_bound():,}개")
+        self.btn_run.setEnabled(self.task_model.rowCount() > 0)
 
     def run_register(self):
+        # 등록 시점에만 전체 조합을 리스트로 만듦
+        self.generated_list = self.task_model.materialize()
         if not self.generated_list: return
-        if QMessageBox.question(self, "확인", f"{len(self.generated_list)}개 등록?") != QMessageBox.StandardButton.Yes: return
+        exp = self.expansion
+        note = f"\n(중복 {exp.skipped_dup}개 / 기존 등록 {exp.skipped_existing}개 제외)" if exp else ""
+        self.lbl_cnt.setText(f"총 {len(self.generated_list):,}개")
+        if QMessageBox.question(self, "확인", f"{len(self.generated_list)}개 등록?{note}") != QMessageBox.StandardButton.Yes: return
         self.btn_run.setEnabled(False)
-        self.worker = KeywordRegisterWorker(self.generated_list)
-        self.worker.log_signal.connect(self.update_log)
-        self.worker.progress_signal.connect(self.progress.setValue)
-        self.worker.result_signal.connect(self.on_finished)
-        self.worker.start()
+        self.btn_resume.setEnabled(False)
+        self.start_worker(KeywordRegisterWorker(self.generated_list))
 
-    def update_log(self, row, status, msg):
-        item = QTableWidgetItem(status)
-        color = "green" if "성공" in status else ("orange" if "진행" in status or "전환" in status or "복제" in status else "red")
-        item.setForeground(QBrush(QColor(color)))
-        self.table.setItem(row, 2, item)
-        self.table.setItem(row, 3, QTableWidgetItem(msg))
-        self.table.scrollToItem(self.table.item(row, 0))
+    def resume_register(self):
+        """ 중단된 마지막 등록 작업을 저널 기준으로 재개 """
+        job = RegisterJob.latest_unfinished()
+        if not job:
+            self.btn_resume.setEnabled(False)
+            return QMessageBox.information(self, "알림", "재개할 작업이 없습니다.")
+        st = job.summary()
+        msg = (f"작업 {st['job_id']} ({st['created'][:19] if st['created'] else '-'})\n"
+               f"전체 {st['total']}개 / 완료 {st['done']}개 / 실패 {st['failed']}개\n"
+               f"남은 작업 {st['pending']}개 / 확인 필요 {st['in_doubt']}개\n\n이어서 등록하시겠습니까?")
+        if QMessageBox.question(self, "작업 재개", msg) != QMessageBox.StandardButton.Yes: return
+
+        # 저널의 작업 목록과 상태로 표 복원 (row 번호 유지)
+        tasks = [job.tasks[r] for r in sorted(job.tasks)]
+        self.task_model.set_tasks(tasks, job.row_status)
+        self.generated_list = tasks
+        self.expansion = None
+        self.lbl_cnt.setText(f"총 {len(tasks)}개 (재개)")
+
+        self.btn_run.setEnabled(False)
+        self.btn_resume.setEnabled(False)
+        self.start_worker(KeywordRegisterWorker(None, job=job))
+
+    def start_worker(self, worker):
+        """ 행 로그 / 진행률은 브리지로 모아 10Hz 묶음으로 반영 """
+        self.worker = worker
+        # 종료 처리 전에 남은 로그부터 반영 (연결 순서 유지)
+        worker.result_signal.connect(self.flush_bridges)
+        worker.result_signal.connect(self.on_finished)
+        self.log_bridge.attach(worker.log_signal)
+        self.progress_bridge.attach(worker.progress_signal)
+        worker.clone_signal.connect(self.lbl_clone.setText)
+        worker.start()
+
+    def flush_bridges(self, *_):
+        self.log_bridge.flush()
+        self.progress_bridge.flush()
+
+    def update_logs(self, batch):
+        """ batch: [(row, 상태, 메시지), ...] """
+        self.task_model.set_statuses(batch)
+        self.table.scrollTo(self.task_model.index(batch[-1][0], 0))
 
     def on_finished(self, success, fail):
         QMessageBox.information(self, "완료", f"성공: {success}건\n실패: {fail}건\n\n(실패 0건이 아닐 경우 로그 확인 필요)")
         self.btn_run.setEnabled(True)
+        self.btn_resume.setEnabled(RegisterJob.has_unfinished())
         self.worker = None
     
     # ===== 중복 키워드 삭제 기능 =====
     
     def on_cleanup_campaign_changed(self):
         """클린업 탭 캠페인 변경"""
-        self.cleanup_table.setRowCount(0)
+        self.cleanup_model.clear()
         self.cleanup_status.setText("대기 중...")
         self.btn_cleanup_delete.setEnabled(False)
     
@@ -599,103 +462,40 @@ class KeywordExpanderWidget(QWidget):
         basename_list = [b.strip() for b in basenames.split('\n') if b.strip()]
         
         self.cleanup_status.setText("검색 중...")
-        self.cleanup_table.setRowCount(0)
+        self.cleanup_model.clear()
         self.btn_cleanup_delete.setEnabled(False)
+        self.btn_cleanup_scan.setEnabled(False)
         
-        try:
-            # 전체 그룹 조회
-            all_groups = api.get_adgroups(campaign_id)
-            if not isinstance(all_groups, list):
-                self.cleanup_status.setText("그룹 조회 실패")
-                return
-            
-            duplicates = []  # (그룹명, 키워드, 키워드ID, 키워드 정규화)
-            
-            # 각 베이스명별로 처리
-            for basename in basename_list:
-                self.cleanup_status.setText(f"검색 중: {basename}...")
-                
-                # 해당 베이스명으로 시작하는 모든 그룹 찾기
-                related_groups = []
-                for grp in all_groups:
-                    grp_name = grp.get('name', '')
-                    # basename 또는 basename_숫자 형태인 그룹들
-                    if grp_name == basename or re.match(f"^{re.escape(basename)}_\\d+$", grp_name):
-                        related_groups.append(grp)
-                
-                if len(related_groups) < 2:
-                    continue  # 묶음 그룹이 아니면 스킵
-                
-                # 각 그룹의 키워드 수집
-                all_keywords = {}  # {정규화된키워드: [(그룹명, 키워드원본, ID), ...]}
-                
-                for grp in related_groups:
-                    grp_id = grp['nccAdgroupId']
-                    grp_name = grp['name']
-                    
-                    keywords = api.get_keywords(grp_id)
-                    if not isinstance(keywords, list):
-                        continue
-                    
-                    for kwd in keywords:
-                        kwd_text = kwd['keyword']
-                        kwd_id = kwd['nccKeywordId']
-                        normalized = kwd_text.replace(" ", "").upper()
-                        
-                        if normalized not in all_keywords:
-                            all_keywords[normalized] = []
-                        
-                        all_keywords[normalized].append((grp_name, kwd_text, kwd_id))
-                    
-                    time.sleep(0.3)  # API 부하 방지
-                
-                # 중복 찾기 (2개 이상 그룹에 존재하는 키워드)
-                for normalized, occurrences in all_keywords.items():
-                    if len(occurrences) > 1:
-                        # 첫 번째 그룹은 유지, 나머지는 중복으로 표시
-                        for i, (grp_name, kwd_text, kwd_id) in enumerate(occurrences):
-                            if i > 0:  # 첫 번째 제외
-                                duplicates.append((grp_name, kwd_text, kwd_id, normalized))
-            
-            # 테이블에 표시
-            self.cleanup_table.setRowCount(len(duplicates))
-            for i, (grp_name, kwd_text, kwd_id, normalized) in enumerate(duplicates):
-                # 체크박스
-                chk = QCheckBox()
-                chk.setChecked(True)
-                self.cleanup_table.setCellWidget(i, 0, chk)
-                
-                self.cleanup_table.setItem(i, 1, QTableWidgetItem(grp_name))
-                self.cleanup_table.setItem(i, 2, QTableWidgetItem(kwd_text))
-                
-                # 키워드 ID를 UserRole에 저장
-                id_item = QTableWidgetItem(kwd_id)
-                id_item.setData(Qt.ItemDataRole.UserRole, kwd_id)
-                self.cleanup_table.setItem(i, 3, id_item)
-            
-            self.cleanup_status.setText(f"검색 완료: {len(duplicates)}개 중복 키워드 발견")
-            
-            if duplicates:
-                self.btn_cleanup_delete.setEnabled(True)
-            else:
-                QMessageBox.information(self, "결과", "중복 키워드가 없습니다")
-                
-        except Exception as e:
-            self.cleanup_status.setText(f"오류: {e}")
-            QMessageBox.critical(self, "오류", f"검색 중 오류 발생:\n{e}")
+        # 인덱스 동기화(API)와 중복 조회는 워커에서
+        self.scan_worker = DuplicateScanWorker(campaign_id, basename_list)
+        self.scan_worker.status_signal.connect(self.cleanup_status.setText)
+        self.scan_worker.finished_signal.connect(self.on_scan_finished)
+        self.scan_worker.start()
+
+    def on_scan_finished(self, duplicates, error):
+        self.btn_cleanup_scan.setEnabled(True)
+        if duplicates is None:
+            self.cleanup_status.setText(error)
+            QMessageBox.critical(self, "오류", f"검색 중 오류 발생:\n{error}")
+            return
+        
+        # 테이블에 표시 (기본 전체 선택)
+        self.cleanup_model.set_rows(
+            ({"group": grp_name, "keyword": kwd_text, "id": kwd_id} for grp_name, kwd_text, kwd_id, _ in duplicates),
+            checked=True
+        )
+        
+        self.cleanup_status.setText(f"검색 완료: {len(duplicates)}개 중복 키워드 발견")
+        
+        if duplicates:
+            self.btn_cleanup_delete.setEnabled(True)
+        else:
+            QMessageBox.information(self, "결과", "중복 키워드가 없습니다")
     
     def delete_duplicates(self):
-        """선택된 중복 키워드 삭제"""
+        """선택된 중복 키워드 삭제 (대량 삭제 워커, 삭제된 행은 바로 제거)"""
         # 체크된 항목 수집
-        to_delete = []
-        for i in range(self.cleanup_table.rowCount()):
-            chk = self.cleanup_table.cellWidget(i, 0)
-            if chk and chk.isChecked():
-                kwd_id_item = self.cleanup_table.item(i, 3)
-                kwd_id = kwd_id_item.data(Qt.ItemDataRole.UserRole)
-                kwd_text = self.cleanup_table.item(i, 2).text()
-                grp_name = self.cleanup_table.item(i, 1).text()
-                to_delete.append((kwd_id, kwd_text, grp_name, i))
+        to_delete = self.cleanup_model.checked_values("id")
         
         if not to_delete:
             return QMessageBox.warning(self, "경고", "삭제할 항목을 선택하세요")
@@ -710,30 +510,25 @@ class KeywordExpanderWidget(QWidget):
             return
         
         self.btn_cleanup_delete.setEnabled(False)
-        self.cleanup_status.setText("삭제 중...")
-        
-        success = 0
-        fail = 0
-        
-        for kwd_id, kwd_text, grp_name, row_idx in to_delete:
-            try:
-                result = api.delete_keyword(kwd_id)
-                if result and not isinstance(result, dict) or (isinstance(result, dict) and not result.get('error')):
-                    success += 1
-                    # 테이블에서 행 삭제 표시
-                    for col in range(4):
-                        item = self.cleanup_table.item(row_idx, col)
-                        if item:
-                            item.setBackground(QBrush(QColor("#d4edda")))
-                else:
-                    fail += 1
-                time.sleep(0.5)  # API 부하 방지
-            except Exception as e:
-                fail += 1
-                print(f"삭제 실패: {kwd_text} ({kwd_id}) - {e}")
-        
-        self.cleanup_status.setText(f"완료: 성공 {success}건, 실패 {fail}건")
-        QMessageBox.information(self, "완료", f"삭제 완료\n\n성공: {success}건\n실패: {fail}건")
-        
-        # 성공한 행 제거
-        self.scan_duplicates()  # 재검색
\ No newline at end of file
+        self.cleanup_status.setText(f"삭제 중... (0/{len(to_delete)})")
+        
+        self.delete_worker = KeywordDeleteWorker(to_delete)
+        self.delete_worker.chunk_signal.connect(self.on_delete_chunk)
+        self.delete_worker.progress_signal.connect(
+            lambda done, total: self.cleanup_status.setText(f"삭제 중... ({done}/{total})"))
+        self.delete_worker.finished_signal.connect(self.on_delete_finished)
+        self.delete_worker.start()
+
+    def on_delete_chunk(self, deleted, failed):
+        """삭제 묶음 결과 반영: 성공 행은 제거, 실패 행은 메시지 표시"""
+        self.cleanup_model.remove_keys(deleted)
+        for kwd_id, msg in failed.items():
+            row = self.cleanup_model.find_row(kwd_id)
+            if row >= 0:
+                self.cleanup_model.set_value(row, "error", msg)
+
+    def on_delete_finished(self, success, fail):
+        self.delete_worker = None
+        self.cleanup_status.setText(f"완료: 성공 {success}건, 실패 {fail}건 (남은 중복 {self.cleanup_model.rowCount()}건)")
+        self.btn_cleanup_delete.setEnabled(self.cleanup_model.rowCount() > 0)
+        QMessageBox.information(self, "완료", f"삭제 완료\n\n성공: {success}건\n실패: {fail}건")
\ No newline at end of file
@@ -0,0 +1,332 @@
+from itertools import islice
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor, QBrush
+
+# -------------------------------------------------------------------------
+# [테이블 모델] 대량 행을 QTableWidgetItem 없이 표시하는 가상 모델 (모든 탭 공용)
+# - 행 데이터는 튜플로만 보관하고, 화면에 보이는 셀만 data() 로 그림
+# -------------------------------------------------------------------------
+def status_brush(status):
+    """상태 문자열 색상 (성공=초록, 진행/전환/복제=주황, 그 외=빨강)"""
+    if "성공" in status:
+        return QBrush(QColor("green"))
+    if "진행" in status or "전환" in status or "복제" in status:
+        return QBrush(QColor("orange"))
+    return QBrush(QColor("red"))
+
+
+class KeywordTaskModel(QAbstractTableModel):
+    """
+    키워드 등록 미리보기/진행 테이블
+    - set_source(iterable): 생성기를 연결하고 스크롤할 때마다 FETCH_SIZE 행씩 가져옴 (fetchMore)
+    - materialize(): 남은 행을 모두 가져와 등록 작업 리스트로 반환
+    - set_status(row, status, msg): 작업 스레드 로그 반영 (해당 행만 다시 그림)
+    - set_statuses(items): 로그 묶음 반영 (브리지에서 10Hz 로 전달)
+    """
+    HEADERS = ["그룹", "키워드", "상태", "메시지"]
+    FETCH_SIZE = 500
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []      # (그룹명, 그룹ID, 키워드)
+        self._status = {}    # row -> (상태, 메시지) - 바뀐 행만 보관
+        self._source = None
+
+    # ---------------------------------------------------------------------
+    # 데이터 연결
+    # ---------------------------------------------------------------------
+    def set_source(self, iterable):
+        self.beginResetModel()
+        self._rows = []
+        self._status = {}
+        self._source = iter(iterable)
+        self.endResetModel()
+        # 첫 화면분은 바로 채움
+        if self.canFetchMore(QModelIndex()):
+            self.fetchMore(QModelIndex())
+
+    def set_tasks(self, tasks, status=None):
+        """이미 만들어진 작업 리스트(row 순)로 채움 - 재개 시 사용"""
+        self.beginResetModel()
+        self._rows = [(t.get('group_name', ''), t.get('group_id'), t['keyword']) for t in tasks]
+        self._status = dict(status or {})
+        self._source = None
+        self.endResetModel()
+
+    def clear(self):
+        self.set_tasks([])
+
+    def is_complete(self):
+        return self._source is None
+
+    def materialize(self):
+        """생성기를 끝까지 읽어 등록용 작업 리스트 반환 ({'group_name', 'group_id', 'keyword', 'row'})"""
+        if self._source is not None:
+            rest = list(self._source)
+            self._source = None
+            if rest:
+                first = len(self._rows)
+                self.beginInsertRows(QModelIndex(), first, first + len(rest) - 1)
+                self._rows.extend(rest)
+                self.endInsertRows()
+        return [
+            {'group_name': gname, 'group_id': gid, 'keyword': kwd, 'row': i}
+            for i, (gname, gid, kwd) in enumerate(self._rows)
+        ]
+
+    # ---------------------------------------------------------------------
+    # 점진 로딩
+    # ---------------------------------------------------------------------
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._source is not None
+
+    def fetchMore(self, parent):
+        if parent.isValid() or self._source is None:
+            return
+        batch = list(islice(self._source, self.FETCH_SIZE))
+        if len(batch) < self.FETCH_SIZE:
+            self._source = None
+        if batch:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+            self._rows.extend(batch)
+            self.endInsertRows()
+
+    # ---------------------------------------------------------------------
+    # 상태 갱신
+    # ---------------------------------------------------------------------
+    def set_status(self, row, status, msg):
+        if row >= len(self._rows):
+            return
+        self._status[row] = (status, msg)
+        self.dataChanged.emit(self.index(row, 2), self.index(row, 3))
+
+    def set_statuses(self, items):
+        """[(row, 상태, 메시지), ...] 묶음 반영 - 바뀐 범위를 dataChanged 1회로 알림"""
+        rows = [row for row, _, _ in items if row < len(self._rows)]
+        if not rows:
+            return
+        for row, status, msg in items:
+            if row < len(self._rows):
+                self._status[row] = (status, msg)
+        self.dataChanged.emit(self.index(min(rows), 2), self.index(max(rows), 3))
+
+    # ---------------------------------------------------------------------
+    # QAbstractTableModel
+    # ---------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return self._rows[row][0]
+            if col == 1:
+                return self._rows[row][2]
+            status = self._status.get(row)
+            if col == 2:
+                return status[0] if status else "대기"
+            return (status[1] or "-") if status else "-"
+        if role == Qt.ItemDataRole.ForegroundRole and col == 2:
+            status = self._status.get(row)
+            return status_brush(status[0]) if status else None
+        return None
+
+
+class ColumnarTableModel(QAbstractTableModel):
+    """
+    열 단위 리스트로 보관하는 범용 테이블 모델 (QTableWidgetItem / 셀 위젯 없음)
+    - fields / headers: 보관할 열 키와 표시 이름 (같은 순서)
+    - formatters: {키: fn(값) -> str} - 화면에 보이는 셀을 그릴 때만 변환
+    - foregrounds: {키: fn(row dict) -> QColor 또는 None}
+    - checkable: 맨 앞에 '선택' 체크 열 추가 (CheckStateRole)
+    - max_rows: 지정하면 오래된 행부터 버리는 링 버퍼 (로그 테이블)
+    - key: 행 식별 키 (find_row / remove_keys)
+    - hidden: 화면에 표시하지 않고 보관만 하는 키 (ID 등)
+    행 추가는 append_rows 로 묶어서 한 번에 알림 (beginInsertRows 1회)
+    """
+
+    def __init__(self, fields, headers, formatters=None, foregrounds=None,
+                 checkable=False, max_rows=None, key=None, hidden=(), parent=None):
+        super().__init__(parent)
+        self.fields = list(fields)
+        self._stored = self.fields + [h for h in hidden if h not in self.fields]
+        self.headers = list(headers)
+        self.formatters = formatters or {}
+        self.foregrounds = foregrounds or {}
+        self.checkable = checkable
+        self.max_rows = max_rows
+        self.key = key
+        self._offset = 1 if checkable else 0
+        self._cols = {f: [] for f in self._stored}
+        self._checked = []
+
+    # ---------------------------------------------------------------------
+    # 데이터 변경
+    # ---------------------------------------------------------------------
+    def set_rows(self, rows, checked=False):
+        self.beginResetModel()
+        self._cols = {f: [] for f in self._stored}
+        self._checked = []
+        self._extend(rows, checked)
+        if self.max_rows and len(self._checked) > self.max_rows:
+            cut = len(self._checked) - self.max_rows
+            for col in self._cols.values():
+                del col[:cut]
+            del self._checked[:cut]
+        self.endResetModel()
+
+    def append_rows(self, rows, checked=False):
+        rows = list(rows)
+        if not rows:
+            return
+        first = len(self._checked)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._extend(rows, checked)
+        self.endInsertRows()
+        self._trim()
+
+    def append_row(self, row, checked=False):
+        self.append_rows([row], checked)
+
+    def clear(self):
+        self.set_rows([])
+
+    def _extend(self, rows, checked):
+        rows = list(rows)
+        for f in self._stored:
+            self._cols[f].extend(r.get(f) for r in rows)
+        self._checked.extend([checked] * len(rows))
+
+    def _trim(self):
+        """링 버퍼: max_rows 를 넘는 앞쪽 행을 한 번에 제거"""
+        if not self.max_rows:
+            return
+        overflow = len(self._checked) - self.max_rows
+        if overflow <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+        for col in self._cols.values():
+            del col[:overflow]
+        del self._checked[:overflow]
+        self.endRemoveRows()
+
+    def set_value(self, row, field, value):
+        if row >= len(self._checked):
+            return
+        self._cols[field][row] = value
+        if field in self.fields:
+            col = self.fields.index(field) + self._offset
+            self.dataChanged.emit(self.index(row, col), self.index(row, col))
+
+    def remove_keys(self, keys):
+        """key 열 값이 keys 에 속한 행 삭제 (연속 구간 단위로 뒤에서부터 알림)"""
+        keys = set(keys)
+        rows = [i for i, v in enumerate(self._cols[self.key]) if v in keys]
+        for start, end in reversed(list(_ranges(rows))):
+            self.beginRemoveRows(QModelIndex(), start, end)
+            for col in self._cols.values():
+                del col[start:end + 1]
+            del self._checked[start:end + 1]
+            self.endRemoveRows()
+        return len(rows)
+
+    # ---------------------------------------------------------------------
+    # 조회
+    # ---------------------------------------------------------------------
+    def row(self, i):
+        return {f: self._cols[f][i] for f in self._stored}
+
+    def column_values(self, field):
+        return self._cols[field]
+
+    def find_row(self, key_value):
+        try:
+            return self._cols[self.key].index(key_value)
+        except ValueError:
+            return -1
+
+    def checked_values(self, field):
+        return [v for v, c in zip(self._cols[field], self._checked) if c]
+
+    def set_all_checked(self, checked):
+        if not self._checked:
+            return
+        self._checked = [checked] * len(self._checked)
+        self.dataChanged.emit(self.index(0, 0), self.index(len(self._checked) - 1, 0))
+
+    # ---------------------------------------------------------------------
+    # QAbstractTableModel
+    # ---------------------------------------------------------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._checked)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.fields) + self._offset
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            if self.checkable:
+                return "선택" if section == 0 else self.headers[section - 1]
+            return self.headers[section]
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if self.checkable and index.column() == 0:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column() - self._offset
+        if col < 0:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if self._checked[row] else Qt.CheckState.Unchecked
+            return None
+        field = self.fields[col]
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self._cols[field][row]
+            fmt = self.formatters.get(field)
+            if fmt:
+                return fmt(value)
+            return "" if value is None else str(value)
+        if role == Qt.ItemDataRole.ForegroundRole and field in self.foregrounds:
+            color = self.foregrounds[field](self.row(row))
+            return QBrush(color) if color is not None else None
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if self.checkable and index.isValid() and index.column() == 0 and role == Qt.ItemDataRole.CheckStateRole:
+            self._checked[index.row()] = Qt.CheckState(value) == Qt.CheckState.Checked
+            self.dataChanged.emit(index, index, [role])
+            return True
+        return False
+
+
+def _ranges(rows):
+    """정렬된 행 번호 -> (시작, 끝) 연속 구간"""
+    start = prev = None
+    for r in rows:
+        if start is None:
+            start = prev = r
+        elif r == prev + 1:
+            prev = r
+        else:
+            yield start, prev
+            start = prev = r
+    if start is not None:
+        yield start, prev
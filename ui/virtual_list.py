@@ -0,0 +1,139 @@
+from bisect import bisect_right
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QScrollArea, QWidget, QLabel
+
+# -------------------------------------------------------------------------
+# [가상 카드 목록] 높이가 제각각인 카드 위젯을 보이는 것만 만들어 배치
+# - 항목마다 높이(측정 전에는 추정값)를 두고 누적 오프셋으로 화면 범위만 찾음 (bisect)
+# - 화면 밖으로 나간 카드는 숨겨서 풀에 넣고, 새로 보이는 항목에 bind(item) 으로 재사용
+# - 카드 높이는 폭 기준으로 측정해 key 별로 기억 (폭이 바뀌면 다시 측정)
+# - 카드 위젯은 bind(item) 메서드만 있으면 됨
+# -------------------------------------------------------------------------
+class VirtualCardList(QScrollArea):
+    SPACING = 10
+    OVERSCAN = 400  # 화면 위아래로 미리 만들어 둘 여유 (px)
+
+    def __init__(self, make_card, estimate=None, key=None, empty_text="", parent=None):
+        """
+        make_card(): 새 카드 위젯 생성 / estimate(item): 측정 전 높이 추정
+        key(item): 측정한 높이를 기억할 키 (항목 목록이 바뀌어도 재사용)
+        """
+        super().__init__(parent)
+        self.make_card = make_card
+        self.estimate = estimate or (lambda item: 300)
+        self.key = key or id
+        self.items = []
+        self._heights = []
+        self._offsets = [0]   # _offsets[i] = i 번째 항목의 y, 마지막 = 전체 높이
+        self._measured = {}   # key -> 측정 높이 (현재 폭 기준)
+        self._width = 0
+        self._active = {}     # 항목 위치 -> 카드
+        self._pool = []
+
+        self.setWidgetResizable(False)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.canvas = QWidget()
+        self.setWidget(self.canvas)
+        self.empty_label = QLabel(empty_text, self.canvas)
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.empty_label.setVisible(False)
+        self.verticalScrollBar().valueChanged.connect(self._layout_visible)
+
+    def set_items(self, items, keep_scroll=False):
+        """표시 항목 교체 - 보이는 카드만 다시 bind"""
+        for card in self._active.values():
+            self._release(card)
+        self._active = {}
+        self.items = list(items)
+        self._heights = [self._measured.get(self.key(it)) or self.estimate(it) for it in self.items]
+        self._update_offsets()
+        if not keep_scroll:
+            self.verticalScrollBar().setValue(0)
+        self.empty_label.setVisible(not self.items)
+        self._layout_visible()
+
+    def refresh(self):
+        """같은 항목을 다시 bind (항목 내용이 바뀐 경우)"""
+        self.set_items(self.items, keep_scroll=True)
+
+    def cards(self):
+        """현재 만들어져 있는 (보이는) 카드"""
+        return list(self._active.values())
+
+    # ---------------------------------------------------------------------
+    # 배치
+    # ---------------------------------------------------------------------
+    def _update_offsets(self):
+        offsets = [0]
+        for h in self._heights:
+            offsets.append(offsets[-1] + h + self.SPACING)
+        self._offsets = offsets
+        width = self.viewport().width()
+        self.canvas.resize(width, max(offsets[-1], self.viewport().height()))
+        self.empty_label.setGeometry(0, 0, width, 60)
+
+    def _visible_range(self):
+        top = self.verticalScrollBar().value() - self.OVERSCAN
+        bottom = self.verticalScrollBar().value() + self.viewport().height() + self.OVERSCAN
+        first = max(0, bisect_right(self._offsets, top) - 1)
+        last = min(len(self.items), bisect_right(self._offsets, bottom))
+        return first, last
+
+    def _layout_visible(self, *_):
+        width = self.viewport().width()
+        if width != self._width:
+            self._width = width
+            self._measured = {}  # 폭이 바뀌면 높이 다시 측정
+
+        # 측정값이 추정과 다르면 오프셋이 바뀌므로 몇 번 반복 (보통 1~2회)
+        for _ in range(3):
+            first, last = self._visible_range()
+            for row in [r for r in self._active if not first <= r < last]:
+                self._release(self._active.pop(row))
+
+            changed = False
+            for row in range(first, last):
+                card = self._active.get(row)
+                if card is None:
+                    card = self._pool.pop() if self._pool else self.make_card()
+                    card.setParent(self.canvas)
+                    card.bind(self.items[row])
+                    self._active[row] = card
+                key = self.key(self.items[row])
+                h = self._measured.get(key)
+                if h is None:
+                    h = card.heightForWidth(width)
+                    if h <= 0:
+                        h = card.sizeHint().height()
+                    self._measured[key] = h
+                if h != self._heights[row]:
+                    self._heights[row] = h
+                    changed = True
+            if not changed:
+                break
+            self._keep_anchor(first)
+
+        for row, card in self._active.items():
+            card.setGeometry(0, self._offsets[row], width, self._heights[row])
+            card.show()
+
+    def _keep_anchor(self, first):
+        """위쪽 카드 높이가 바뀌어도 보고 있던 카드가 제자리에 있도록 스크롤 보정"""
+        bar = self.verticalScrollBar()
+        value = bar.value()
+        anchor = min(max(first, bisect_right(self._offsets, value) - 1), max(len(self.items) - 1, 0))
+        delta = value - self._offsets[anchor]
+        self._update_offsets()
+        bar.blockSignals(True)
+        bar.setValue(self._offsets[anchor] + delta)
+        bar.blockSignals(False)
+
+    def _release(self, card):
+        card.hide()
+        self._pool.append(card)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_offsets()
+        self._layout_visible()